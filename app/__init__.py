@@ -2,24 +2,32 @@ import os
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_mail import Mail
+from flask_migrate import Migrate
 from datetime import timedelta
+from app.database import RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 mail = Mail()
+migrate = Migrate()
 
 
-def create_app():
+def create_app(config=None):
     app = Flask(__name__, static_folder='static')
 
     os.makedirs(app.instance_path, exist_ok=True)
     db_path = os.path.join(app.instance_path, 'app.db')
-    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', f'sqlite:///{db_path}')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     app.config['SECRET_KEY'] = os.environ.get('FLASK_SECRET_KEY', 'dev-secret-key')
     app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(hours=24)
     app.config['SESSION_COOKIE_SECURE'] = True
     app.config['SESSION_COOKIE_HTTPONLY'] = True
     app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
+    app.config['SCHEDULER_LOCK_PATH'] = os.environ.get('SCHEDULER_LOCK_PATH',
+                                                      os.path.join(app.instance_path, 'scheduler.lock'))
+    app.config['SCHEDULER_LEASE_RETRY'] = int(os.environ.get('SCHEDULER_LEASE_RETRY', '30'))
+    app.config['SCHEDULER_ENABLED'] = os.environ.get('SCHEDULER_ENABLED', '1') == '1'   # never in TESTING apps
+    app.config['SEED_ON_BOOT'] = os.environ.get('SEED_ON_BOOT', '1' if app.debug else '0') == '1'
 
     # Email configuration
     app.config['MAIL_SERVER'] = 'smtp.zoho.com'
@@ -30,8 +38,55 @@ def create_app():
     app.config['MAIL_PASSWORD'] = os.environ.get('MAIL_PASSWORD', 'Sydney2026!@#')
     app.config['MAIL_DEFAULT_SENDER'] = os.environ.get('MAIL_DEFAULT_SENDER', 'no-reply@awslearningplatform.click')
 
+    # Email outbox - drained by the scheduler leader over one SMTP connection, see app/outbox.py
+    app.config['OUTBOX_POLL_SECONDS'] = int(os.environ.get('OUTBOX_POLL_SECONDS', '5'))
+    app.config['OUTBOX_BATCH_SIZE'] = int(os.environ.get('OUTBOX_BATCH_SIZE', '50'))
+    app.config['OUTBOX_MAX_ATTEMPTS'] = int(os.environ.get('OUTBOX_MAX_ATTEMPTS', '6'))
+    app.config['OUTBOX_BACKOFF_SECONDS'] = int(os.environ.get('OUTBOX_BACKOFF_SECONDS', '30'))
+    app.config['OUTBOX_CLAIM_SECONDS'] = int(os.environ.get('OUTBOX_CLAIM_SECONDS', '300'))
+    # Badge awards are buffered per user and emailed as one digest this long after the first, see app/badges.py
+    app.config['BADGE_DIGEST_WINDOW_SECONDS'] = int(os.environ.get('BADGE_DIGEST_WINDOW_SECONDS', '300'))
+
+    # Announcement campaigns - a few persistent SMTP connections under one send rate, see app/campaigns.py
+    app.config['CAMPAIGN_SMTP_CONNECTIONS'] = int(os.environ.get('CAMPAIGN_SMTP_CONNECTIONS', '3'))
+    app.config['CAMPAIGN_RATE_PER_SECOND'] = float(os.environ.get('CAMPAIGN_RATE_PER_SECOND', '10'))
+    app.config['CAMPAIGN_CHUNK_SIZE'] = int(os.environ.get('CAMPAIGN_CHUNK_SIZE', '200'))
+    app.config['CAMPAIGN_POLL_SECONDS'] = int(os.environ.get('CAMPAIGN_POLL_SECONDS', '30'))
+    app.config['CAMPAIGN_LEASE_SECONDS'] = int(os.environ.get('CAMPAIGN_LEASE_SECONDS', '300'))
+
+    # SQLite engine profile - see app/database.py
+    from app.database import SQLITE_PROFILES, apply_sqlite_pragmas, init_readonly_engine
+    app.config['SQLITE_PROFILE'] = os.environ.get('SQLITE_PROFILE', 'performance')
+    app.config['SQLITE_PRAGMAS'] = dict(SQLITE_PROFILES.get(app.config['SQLITE_PROFILE'], {}))
+    app.config['READONLY_ENGINE_ENABLED'] = os.environ.get('READONLY_ENGINE_ENABLED', '1') == '1'
+    app.config['READONLY_POOL_SIZE'] = int(os.environ.get('READONLY_POOL_SIZE', '5'))
+
+    # Metrics - per-worker snapshots merged by /admin/metrics
+    app.config['METRICS_DIR'] = os.environ.get('METRICS_DIR', os.path.join(app.instance_path, 'metrics'))
+    app.config['METRICS_FLUSH_SECONDS'] = float(os.environ.get('METRICS_FLUSH_SECONDS', '5'))
+    app.config['METRICS_TOKEN'] = os.environ.get('METRICS_TOKEN')
+
+    # Conditional GET - set per deploy so template changes invalidate cached ETags
+    app.config['ETAG_SALT'] = os.environ.get('ETAG_SALT', '')
+
+    if config:
+        app.config.update(config)
+
     db.init_app(app)
     mail.init_app(app)
+    from app.schema import MIGRATIONS_DIR
+    migrate.init_app(app, db, directory=MIGRATIONS_DIR)
+
+    with app.app_context():
+        apply_sqlite_pragmas(db.engine, app.config['SQLITE_PRAGMAS'])
+        primary_engine = db.engine
+    readonly_engine = init_readonly_engine(app, app.config['SQLALCHEMY_DATABASE_URI'])
+
+    from app.metrics import init_metrics
+    init_metrics(app, [primary_engine, readonly_engine])
+
+    from app.events import init_events
+    init_events(app)
 
     # Blueprints
     from app.routes import main
@@ -49,36 +104,87 @@ def create_app():
     from app.reports.routes import reports
     app.register_blueprint(reports)
 
-    # Database + Seed
+    from app.commands import register_commands
+    register_commands(app)
+
+    # Database + Seed - production upgrades and seeds once via `flask upgrade-db` / `flask seed-content`,
+    # workers only check the migration head and the manifest
     with app.app_context():
-        db.create_all()
-        from app.models import initialize_challenges, initialize_badges
-        from app.models_learning import seed_learning_paths, seed_aws_associate_paths
-        initialize_challenges()
-        initialize_badges()
-        seed_learning_paths()
-        seed_aws_associate_paths()
-
-    # APScheduler - daily automated backup at 00:00 UTC (02:00 SAST)
+        from app.schema import schema_pending, upgrade_schema
+        from app.seeding import stale_seed_sets, sync_content
+        from app.stats import rebuild_user_stats, stats_missing
+        if app.config['SEED_ON_BOOT']:
+            upgrade_schema()
+            sync_content()
+            if stats_missing():
+                rebuild_user_stats()
+        else:
+            db.create_all()
+            if not app.testing and schema_pending():
+                print("[Schema] Database is behind the migrations - run `flask upgrade-db`.")
+            stale = stale_seed_sets()
+            if stale:
+                print(f"[Seed] Content out of date ({', '.join(stale)}) - run `flask seed-content`.")
+            if stats_missing():
+                print("[Stats] user_stats is empty - run `flask rebuild-stats`.")
+
+    # APScheduler - daily automated backup at 00:00 UTC (02:00 SAST), badge backfill at 00:30 UTC, email outbox, campaigns
     _start_scheduler(app)
 
     return app
 
 
 def _start_scheduler(app):
+    # Test apps share their database with the test thread; background jobs would race it
+    if app.testing or not app.config['SCHEDULER_ENABLED']:
+        return
     if os.environ.get('WERKZEUG_RUN_MAIN') == 'true' or not app.debug:
         try:
-            from apscheduler.schedulers.background import BackgroundScheduler
+            from app.scheduler import LeaderLease, run_as_leader
 
             def _auto_backup():
                 with app.app_context():
                     from app.backup.routes import run_backup
                     run_backup(backup_type='automated', user_id=None)
 
-            scheduler = BackgroundScheduler(daemon=True)
-            scheduler.add_job(func=_auto_backup, trigger='cron', hour=0, minute=0,
-                              id='daily_backup', replace_existing=True)
-            scheduler.start()
-            print("[Scheduler] Daily automated backup job registered (00:00 UTC).")
+            def _badge_backfill():
+                with app.app_context():
+                    from app.badges import backfill_badges
+                    awards = backfill_badges()
+                    print(f"[Badges] Backfill awarded {sum(awards.values())} badges.")
+
+            def _drain_outbox():
+                with app.app_context():
+                    from app.badges import flush_badge_digests
+                    from app.outbox import drain_outbox
+                    flush_badge_digests()
+                    drain_outbox()
+
+            def _send_campaigns():
+                with app.app_context():
+                    from app.campaigns import run_pending_campaigns
+                    run_pending_campaigns()
+
+            def _start():
+                # Only the leader pays for importing APScheduler
+                from apscheduler.schedulers.background import BackgroundScheduler
+                scheduler = BackgroundScheduler(daemon=True)
+                scheduler.add_job(func=_auto_backup, trigger='cron', hour=0, minute=0,
+                                  id='daily_backup', replace_existing=True)
+                scheduler.add_job(func=_badge_backfill, trigger='cron', hour=0, minute=30,
+                                  id='badge_backfill', replace_existing=True)
+                scheduler.add_job(func=_drain_outbox, trigger='interval', seconds=app.config['OUTBOX_POLL_SECONDS'],
+                                  id='email_outbox', replace_existing=True, max_instances=1, coalesce=True)
+                scheduler.add_job(func=_send_campaigns, trigger='interval', seconds=app.config['CAMPAIGN_POLL_SECONDS'],
+                                  id='email_campaigns', replace_existing=True, max_instances=1, coalesce=True)
+                scheduler.start()
+                print(f"[Scheduler] Leader pid {os.getpid()}: daily backup (00:00 UTC), badge backfill "
+                      f"(00:30 UTC), email outbox (every {app.config['OUTBOX_POLL_SECONDS']}s) and campaign "
+                      f"(every {app.config['CAMPAIGN_POLL_SECONDS']}s) jobs registered.")
+
+            # Only one process per host runs jobs; the rest stand by and take over if it dies
+            lease = LeaderLease(app.config['SCHEDULER_LOCK_PATH'])
+            app.extensions['scheduler_lease'] = lease
+            run_as_leader(lease, _start, retry_seconds=app.config['SCHEDULER_LEASE_RETRY'])
         except Exception as e:
             print(f"[Scheduler] Could not start: {e}")
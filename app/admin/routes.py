@@ -1,9 +1,13 @@
+import secrets
 from datetime import datetime
-from flask import Blueprint, render_template, request, jsonify, redirect, url_for, session
+from flask import Blueprint, Response, render_template, request, jsonify, redirect, url_for, session, current_app
 from sqlalchemy import func
+from sqlalchemy.orm import joinedload
 from app import db
-from app.models import User, Score, AuditLog, BackupLog
+from app.models import User, Score, AuditLog, BackupLog, Campaign
 from app.decorators import admin_required
+from app.database import read_only
+from app.versioning import USER_STATS_EPOCH, bump_version
 
 admin = Blueprint('admin', __name__, url_prefix='/admin')
 
@@ -17,6 +21,7 @@ def _log(action_type, affected_record=''):
 # ── Dashboard ─────────────────────────────────────────────────────────────────
 @admin.route('/')
 @admin.route('/dashboard')
+@read_only
 @admin_required
 def dashboard():
     admin_user = User.query.get(session['user_id'])
@@ -46,10 +51,9 @@ def users():
         query = query.filter(
             (User.username.ilike(f'%{q}%')) | (User.email.ilike(f'%{q}%'))
         )
-    all_users = query.order_by(User.created_at.desc()).all()
-    user_scores = {}
-    for u in all_users:
-        user_scores[u.id] = db.session.query(func.sum(Score.score)).filter_by(user_id=u.id).scalar() or 0
+    # Points come from the materialised user_stats row, joined in the same query
+    all_users = query.options(joinedload(User.stats)).order_by(User.created_at.desc()).all()
+    user_scores = {u.id: u.stats.challenge_points if u.stats else 0 for u in all_users}
     return render_template('admin/users.html', users=all_users,
                            user_scores=user_scores, admin_user=admin_user, q=q)
 
@@ -106,6 +110,7 @@ def delete_user(user_id):
         return jsonify({'error': 'Cannot delete your own account.'}), 400
     username = user.username
     db.session.delete(user)
+    bump_version(USER_STATS_EPOCH)   # their user_stats row goes too - ranked caches reload
     _log('DELETE_USER', f'user:{user_id} ({username})')
     db.session.commit()
     return jsonify({'success': True})
@@ -116,5 +121,90 @@ def delete_user(user_id):
 @admin_required
 def audit_log():
     admin_user = User.query.get(session['user_id'])
-    logs = AuditLog.query.order_by(AuditLog.timestamp.desc()).limit(200).all()
+    logs = AuditLog.query.options(joinedload(AuditLog.admin))\
+        .order_by(AuditLog.timestamp.desc()).limit(200).all()
     return render_template('admin/audit_log.html', logs=logs, admin_user=admin_user)
+
+
+# ── Database Engine ───────────────────────────────────────────────────────────
+@admin.route('/database')
+@admin_required
+def database():
+    from app.database import read_sqlite_pragmas
+    admin_user = User.query.get(session['user_id'])
+    return render_template('admin/database.html', admin_user=admin_user,
+                           profile=current_app.config['SQLITE_PROFILE'],
+                           configured=current_app.config['SQLITE_PRAGMAS'],
+                           live=read_sqlite_pragmas(db.engine))
+
+
+# ── Announcement Campaigns ────────────────────────────────────────────────────
+@admin.route('/campaigns', methods=['GET', 'POST'])
+@admin_required
+def campaigns():
+    from jinja2 import TemplateSyntaxError
+    from app.campaigns import AUDIENCES, validate_body
+    admin_user = User.query.get(session['user_id'])
+    error = None
+    if request.method == 'POST':
+        subject = request.form.get('subject', '').strip()
+        body = request.form.get('body', '').strip()
+        audience = request.form.get('audience', 'active')
+        try:
+            validate_body(body)
+        except TemplateSyntaxError as e:
+            error = f'Template error on line {e.lineno}: {e.message}'
+        if not subject or not body or audience not in AUDIENCES:
+            error = 'Subject, body and a valid audience are required.'
+        if not error:
+            campaign = Campaign(subject=subject, body=body, audience=audience, created_by=admin_user.id)
+            db.session.add(campaign)
+            db.session.flush()
+            _log('CREATE_CAMPAIGN', f'campaign:{campaign.id} ({subject})')
+            db.session.commit()
+            return redirect(url_for('admin.campaigns'))
+    all_campaigns = Campaign.query.options(joinedload(Campaign.creator))\
+        .order_by(Campaign.created_at.desc()).limit(50).all()
+    return render_template('admin/campaigns.html', campaigns=all_campaigns, audiences=AUDIENCES,
+                           admin_user=admin_user, error=error, form=request.form)
+
+
+@admin.route('/campaigns/<int:campaign_id>/send', methods=['POST'])
+@admin_required
+def send_campaign(campaign_id):
+    campaign = Campaign.query.get_or_404(campaign_id)
+    if campaign.status != 'draft':
+        return jsonify({'error': f'Campaign is already {campaign.status}.'}), 400
+    campaign.status = 'queued'     # the scheduler leader picks it up on its next campaign run
+    _log('SEND_CAMPAIGN', f'campaign:{campaign_id} ({campaign.subject})')
+    db.session.commit()
+    return jsonify({'success': True})
+
+
+@admin.route('/campaigns/<int:campaign_id>/cancel', methods=['POST'])
+@admin_required
+def cancel_campaign(campaign_id):
+    campaign = Campaign.query.get_or_404(campaign_id)
+    if campaign.status not in ('draft', 'queued', 'sending'):
+        return jsonify({'error': f'Campaign is already {campaign.status}.'}), 400
+    campaign.status = 'cancelled'
+    campaign.finished_at = datetime.utcnow()
+    _log('CANCEL_CAMPAIGN', f'campaign:{campaign_id} ({campaign.subject})')
+    db.session.commit()
+    return jsonify({'success': True})
+
+
+# ── Metrics ───────────────────────────────────────────────────────────────────
+def _metrics_response():
+    from app.metrics import render_prometheus
+    snapshot = current_app.extensions['metrics'].collect()
+    return Response(render_prometheus(snapshot), mimetype='text/plain; version=0.0.4')
+
+
+@admin.route('/metrics')
+def metrics():
+    """Prometheus scrape endpoint - admin session, or `Authorization: Bearer $METRICS_TOKEN`."""
+    token = current_app.config['METRICS_TOKEN']
+    if token and secrets.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return _metrics_response()
+    return admin_required(_metrics_response)()
@@ -1,5 +1,4 @@
 import os
-import shutil
 import sqlite3
 from datetime import datetime, timezone, timedelta
 from flask import Blueprint, render_template, request, jsonify, session, current_app
@@ -26,6 +25,19 @@ def _ensure_backup_dir():
     os.makedirs(BACKUP_DIR, exist_ok=True)
 
 
+def _copy_database(src_path, dst_path, journal_mode=None):
+    """Copy a SQLite database with the online backup API so pages still in the WAL are included."""
+    src = sqlite3.connect(src_path)
+    dst = sqlite3.connect(dst_path)
+    try:
+        src.backup(dst)
+        if journal_mode:
+            dst.execute(f'PRAGMA journal_mode={journal_mode}')
+    finally:
+        dst.close()
+        src.close()
+
+
 def _validate_backup_file(backup_path, live_db_path):
     try:
         backup_conn = sqlite3.connect(backup_path)
@@ -58,7 +70,7 @@ def run_backup(backup_type='automated', user_id=None):
         backup_filename = f'backup_{timestamp}_{backup_type}.db'
         backup_path = os.path.join(BACKUP_DIR, backup_filename)
         try:
-            shutil.copy2(db_path, backup_path)
+            _copy_database(db_path, backup_path, journal_mode='DELETE')
             file_size = os.path.getsize(backup_path)
             status, error_msg = _validate_backup_file(backup_path, db_path)
             log = BackupLog(
@@ -163,7 +175,7 @@ def restore_backup(backup_id):
     safety_log = run_backup(backup_type='pre_restore_safety', user_id=session['user_id'])
     safety_path = safety_log.file_path
     try:
-        shutil.copy2(log_file_path, db_path)
+        _copy_database(log_file_path, db_path)
         status, err = _validate_backup_file(db_path, log_file_path)
         if status == 'pass':
             audit = AuditLog(
@@ -176,11 +188,11 @@ def restore_backup(backup_id):
             db.session.commit()
             return jsonify({'success': True, 'message': f'System restored to backup from {log_created_at} SAST.'})
         else:
-            shutil.copy2(safety_path, db_path)
+            _copy_database(safety_path, db_path)
             return jsonify({'error': f'Post-restore validation failed. System reverted. Error: {err}'}), 500
     except Exception as e:
         try:
-            shutil.copy2(safety_path, db_path)
+            _copy_database(safety_path, db_path)
         except Exception:
             pass
         return jsonify({'error': f'Restore failed and system was reverted. Error: {str(e)}'}), 500
@@ -0,0 +1,207 @@
+"""
+Badge rule engine.
+
+``Badge.trigger_condition`` holds a small expression such as ``score>=20`` or
+``challenges>=1 and paths>=1``. Each distinct expression is compiled once into
+a predicate over a user_stats row, and the compiled rules for every badge are
+kept per app until the badge seed set runs again. Awarding evaluates every
+rule in memory against the stats row (usually the one ``bump_stats`` just
+returned), reads the badge ids the user already owns in one query and inserts
+the new UserBadge rows in one statement. ``backfill_badges`` applies the same
+conditions as SQL to award badges retroactively; `flask backfill-badges` and a
+nightly scheduler job run it.
+
+New awards are not emailed one by one: they are flagged ``email_pending`` and
+``flush_badge_digests`` (run with every outbox drain) sends each user one
+digest once their oldest pending award is BADGE_DIGEST_WINDOW_SECONDS old.
+"""
+import operator
+import re
+from collections import namedtuple
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import groupby
+
+from flask import current_app
+from sqlalchemy import and_, exists, func, literal, select
+
+from app import db
+from app.database import dialect_insert
+from app.events import BadgeAwarded
+from app.models import Badge, User, UserBadge, UserStats
+from app.versioning import USER_STATS, bump_version
+
+# trigger_condition metric -> user_stats column
+METRICS = {
+    'score': 'challenge_points',
+    'challenges': 'challenge_count',
+    'paths': 'path_count',
+    'certificates': 'certificate_count',
+    'points': 'total_points',
+}
+OPERATORS = {'>=': operator.ge, '>': operator.gt, '<=': operator.le, '<': operator.lt,
+             '==': operator.eq, '=': operator.eq, '!=': operator.ne}
+BACKFILL_CHUNK = 10000   # user ids per backfill transaction, so the SQLite write lock is released often
+DIGEST_BATCH = 200       # users per badge digest transaction
+
+_TERM = re.compile(r'^\s*(\w+)\s*(>=|<=|==|!=|>|<|=)\s*(\d+)\s*$')
+
+# A badge as the engine sees it; carries what BadgeAwarded needs so nothing is re-read after commit
+BadgeRule = namedtuple('BadgeRule', 'id name description icon predicate')
+
+
+@lru_cache(maxsize=None)
+def _parse(condition):
+    """(user_stats column, operator, value) terms of a condition; ValueError if it is malformed."""
+    terms = []
+    for part in re.split(r'\s+and\s+', condition.strip(), flags=re.IGNORECASE):
+        m = _TERM.match(part)
+        if not m or m.group(1).lower() not in METRICS:
+            raise ValueError(f'unsupported badge condition {condition!r}')
+        terms.append((METRICS[m.group(1).lower()], OPERATORS[m.group(2)], int(m.group(3))))
+    return tuple(terms)
+
+
+@lru_cache(maxsize=None)
+def compile_condition(condition):
+    """Compile a trigger_condition into a predicate over a stats row; ValueError if it is malformed."""
+    terms = _parse(condition)
+
+    def predicate(stats):
+        return all(op(getattr(stats, column), value) for column, op, value in terms)
+    return predicate
+
+
+def badge_rules():
+    """Compiled rules for every badge that has a trigger condition, built once per app."""
+    rules = current_app.extensions.get('badge_rules')
+    if rules is None:
+        rules = []
+        for badge in Badge.query.filter(Badge.trigger_condition.isnot(None)).order_by(Badge.id):
+            try:
+                predicate = compile_condition(badge.trigger_condition)
+            except ValueError as e:
+                print(f'[Badges] Skipping {badge.name}: {e}')
+                continue
+            rules.append(BadgeRule(badge.id, badge.name, badge.description, badge.icon, predicate))
+        rules = current_app.extensions['badge_rules'] = tuple(rules)
+    return rules
+
+
+def invalidate_badge_rules():
+    """Drop the compiled rules so the next award check reloads the badge table."""
+    current_app.extensions.pop('badge_rules', None)
+
+
+def check_and_award_badges(user_id, stats=None):
+    """Add any badges the user has newly earned to the current transaction.
+
+    ``stats``, when given, is the row ``bump_stats`` returned earlier in this transaction; its
+    version is reused for the badge_count bump. New awards wait for the user's next badge digest
+    email. Returns a BadgeAwarded event per new badge for the caller to publish once it has
+    committed.
+    """
+    from app.stats import bump_stats, get_stats
+    version = stats.version if stats is not None else None
+    stats = stats or get_stats(user_id)
+    earned = [rule for rule in badge_rules() if rule.predicate(stats)]
+    if not earned:
+        return []
+    owned = set(db.session.scalars(select(UserBadge.badge_id).where(UserBadge.user_id == user_id)))
+    candidates = [rule for rule in earned if rule.id not in owned]
+    if not candidates:
+        return []
+    # Insert-or-ignore so a concurrent request awarding the same badge is not counted twice
+    now = datetime.utcnow()
+    stmt = (dialect_insert(UserBadge.__table__)
+            .values([{'user_id': user_id, 'badge_id': rule.id, 'awarded_at': now, 'email_pending': True}
+                     for rule in candidates])
+            .on_conflict_do_nothing(index_elements=['user_id', 'badge_id'])
+            .returning(UserBadge.badge_id))
+    inserted = set(db.session.execute(stmt).scalars())
+    awarded = [rule for rule in candidates if rule.id in inserted]
+    if awarded:
+        bump_stats(user_id, version=version, badge_count=len(awarded))
+    return [BadgeAwarded(user_id, rule.id, rule.name, rule.description, rule.icon) for rule in awarded]
+
+
+def flush_badge_digests(window=None):
+    """Queue one email per user whose oldest pending badge award is at least `window` seconds old.
+
+    Each digest lists every award still pending for that user; the outbox sends it. Works in
+    batches of DIGEST_BATCH users, one commit each. Returns the number of digests queued.
+    """
+    from app.email_utils import queue_badge_digest
+    window = current_app.config['BADGE_DIGEST_WINDOW_SECONDS'] if window is None else window
+    cutoff = datetime.utcnow() - timedelta(seconds=window)
+    queued = 0
+    while True:
+        due = (select(UserBadge.user_id).where(UserBadge.email_pending.is_(True))
+               .group_by(UserBadge.user_id).having(func.min(UserBadge.awarded_at) <= cutoff)
+               .limit(DIGEST_BATCH))
+        rows = db.session.execute(
+            select(UserBadge.id, UserBadge.user_id, User.username, User.email,
+                   Badge.name, Badge.description, Badge.icon)
+            .join(User, User.id == UserBadge.user_id).join(Badge, Badge.id == UserBadge.badge_id)
+            .where(UserBadge.email_pending.is_(True), UserBadge.user_id.in_(due))
+            .order_by(UserBadge.user_id, UserBadge.awarded_at, UserBadge.id)).all()
+        if not rows:
+            return queued
+        for _, awards in groupby(rows, key=lambda row: row.user_id):
+            awards = list(awards)
+            if awards[0].email:
+                queue_badge_digest(awards[0].username, awards[0].email,
+                                   [(a.name, a.description, a.icon) for a in awards])
+                queued += 1
+        db.session.execute(UserBadge.__table__.update()
+                           .where(UserBadge.id.in_([row.id for row in rows]))
+                           .values(email_pending=False))
+        db.session.commit()
+
+
+def condition_clause(condition):
+    """The same condition as a SQL expression over user_stats, for set-based awarding."""
+    return and_(*[op(getattr(UserStats, column), value) for column, op, value in _parse(condition)])
+
+
+def backfill_badges(names=None, chunk_size=BACKFILL_CHUNK):
+    """Award badges (all, or just `names`) to every user whose user_stats row qualifies.
+
+    Works through user ids in chunks of `chunk_size`: per chunk, one INSERT ... SELECT per
+    badge, one UPDATE that recounts badge_count for users who gained a badge, then a commit.
+    Returns {badge name: awards made}. Awards are silent - no emails for retroactive badges.
+    """
+    query = Badge.query.filter(Badge.trigger_condition.isnot(None)).order_by(Badge.id)
+    if names:
+        query = query.filter(Badge.name.in_(names))
+    targets = []
+    for badge in query:
+        try:
+            targets.append((badge.id, badge.name, condition_clause(badge.trigger_condition)))
+        except ValueError as e:
+            print(f'[Badges] Skipping {badge.name}: {e}')
+    awards = {name: 0 for _, name, _ in targets}
+    low, high = db.session.query(func.min(UserStats.user_id), func.max(UserStats.user_id)).one()
+    if not targets or low is None:
+        return awards
+
+    table = UserBadge.__table__
+    owned = select(UserBadge.user_id).where(UserBadge.user_id == UserStats.user_id)
+    for start in range(low, high + 1, chunk_size):
+        in_chunk = UserStats.user_id.between(start, start + chunk_size - 1)
+        now = datetime.utcnow()
+        changed = 0
+        for badge_id, name, clause in targets:
+            qualifying = (select(UserStats.user_id, literal(badge_id), literal(now))
+                          .where(in_chunk, clause, ~exists(owned.where(UserBadge.badge_id == badge_id))))
+            result = db.session.execute(table.insert().from_select(['user_id', 'badge_id', 'awarded_at'], qualifying))
+            awards[name] += result.rowcount
+            changed += result.rowcount
+        if changed:
+            count = select(func.count()).where(UserBadge.user_id == UserStats.user_id).scalar_subquery()
+            db.session.execute(UserStats.__table__.update()
+                               .where(in_chunk, UserStats.badge_count != count)
+                               .values(badge_count=count, version=bump_version(USER_STATS)))
+        db.session.commit()
+    return awards
+
@@ -0,0 +1,272 @@
+"""
+Admin announcement campaigns.
+
+A campaign's subject and body are rendered once, with a placeholder where
+each recipient's username goes, so personalising a message is a string join.
+Recipients are read in keyset-paginated chunks of (id, username, email) -
+never whole User rows - and each chunk is handed to a ``MailerPool``: a few
+threads, each holding one persistent SMTP connection, sharing a
+messages-per-second limit. After every chunk the campaign row records the
+last user id reached and the running counts, so a crashed or restarted
+sender resumes from that checkpoint (at most the chunk in flight is sent
+twice). A sender claims the campaign with a conditional UPDATE and holds a
+lease it renews at every checkpoint, so the scheduler and `flask
+send-campaign` never send the same campaign at once. Transient failures are
+handed to the email outbox for retry; permanent rejections are only counted.
+"""
+import queue
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+from email.utils import formataddr
+
+from flask import current_app, render_template
+from flask_mail import Message
+from jinja2 import TemplateSyntaxError, nodes
+from jinja2.sandbox import SandboxedEnvironment
+from markupsafe import escape
+from sqlalchemy import and_, func, or_
+
+from app import db, mail
+from app.models import Campaign, User
+from app.outbox import CONNECTION_ERRORS, enqueue_email, permanent_failure, sender_id
+
+CAMPAIGN_SENDER = ('AWS Community Labs', 'no-reply@awslearningplatform.click')
+AUDIENCES = {
+    'active': 'All active learners',
+    'admins': 'Admins only (test send)',
+}
+
+_RECIPIENT = '\x00recipient\x00'     # stands in for the username while rendering; survives autoescaping
+_sandbox = SandboxedEnvironment(autoescape=False)
+
+# Subject plus the text and HTML bodies split around the recipient placeholder
+RenderedCampaign = namedtuple('RenderedCampaign', 'subject text html')
+
+
+def validate_body(body):
+    """Check an admin-supplied body; raises jinja2.TemplateSyntaxError if it is malformed.
+
+    The body is rendered once with a placeholder for the username, so ``username`` may only be
+    output as is: a filter or expression on it would transform the placeholder instead.
+    """
+    tree = _sandbox.parse(body)
+    plain = {id(node) for output in tree.find_all(nodes.Output) for node in output.nodes
+             if isinstance(node, nodes.Name) and node.name == 'username'}
+    for node in tree.find_all(nodes.Name):
+        if node.name == 'username' and id(node) not in plain:
+            raise TemplateSyntaxError('username can only be inserted as {{ username }}, '
+                                      'without filters or expressions', node.lineno)
+
+
+def render_campaign(campaign):
+    """Render the campaign once for every recipient."""
+    text = _sandbox.from_string(campaign.body).render(username=_RECIPIENT)
+    paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+    html = render_template('campaign_email.html', subject=campaign.subject, paragraphs=paragraphs)
+    return RenderedCampaign(campaign.subject, tuple(text.split(_RECIPIENT)), tuple(html.split(_RECIPIENT)))
+
+
+def build_message(rendered, recipient):
+    """The campaign message for one (user id, username, email) recipient."""
+    _, username, email = recipient
+    return Message(subject=rendered.subject, sender=formataddr(CAMPAIGN_SENDER), recipients=[email],
+                   body=username.join(rendered.text), html=str(escape(username)).join(rendered.html))
+
+
+def recipients(audience, after_id, limit):
+    """The next `limit` recipients with user id above `after_id`, in id order."""
+    query = (db.session.query(User.id, User.username, User.email)
+             .filter(User.id > after_id, User.is_active.is_(True), User.email.isnot(None), User.email != ''))
+    if audience == 'admins':
+        query = query.filter(User.role == 'admin')
+    return query.order_by(User.id).limit(limit).all()
+
+
+class RateLimiter:
+    """Spaces calls to ``acquire`` at most `rate` per second across threads (0 = unlimited)."""
+
+    def __init__(self, rate):
+        self._interval = 1.0 / rate if rate else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class MailerPool:
+    """Worker threads, each sending over its own persistent SMTP connection, under one rate limit."""
+
+    def __init__(self, app, size, rate):
+        self.app = app
+        self.limiter = RateLimiter(rate)
+        self._jobs = queue.Queue()
+        self._results = []
+        self._lock = threading.Lock()
+        self._threads = [threading.Thread(target=self._work, name=f'mailer-{i}', daemon=True)
+                         for i in range(max(1, size))]
+        for thread in self._threads:
+            thread.start()
+
+    def send(self, items):
+        """Send (key, Message) pairs; block until all are done and return [(key, error or None)]."""
+        self._results = []
+        for item in items:
+            self._jobs.put(item)
+        self._jobs.join()
+        return self._results
+
+    def close(self):
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _work(self):
+        with self.app.app_context():
+            conn = None
+            while True:
+                item = self._jobs.get()
+                try:
+                    if item is None:
+                        break
+                    key, msg = item
+                    self.limiter.acquire()
+                    conn, error = self._deliver(conn, msg)
+                    with self._lock:
+                        self._results.append((key, error))
+                finally:
+                    self._jobs.task_done()
+            _close(conn)
+
+    @staticmethod
+    def _deliver(conn, msg):
+        """Send msg, reconnecting once if the connection has dropped; return (connection, error)."""
+        for attempt in range(2):
+            try:
+                if conn is None:
+                    conn = mail.connect()
+                    conn.__enter__()
+                conn.send(msg)
+                return conn, None
+            except CONNECTION_ERRORS as e:
+                _close(conn)
+                conn, error = None, e
+            except Exception as e:
+                return conn, e
+        return conn, error
+
+
+def _close(conn):
+    if conn is not None:
+        try:
+            conn.__exit__(None, None, None)
+        except Exception:
+            pass
+
+
+def claim_campaign(campaign_id, owner):
+    """Atomically take a queued campaign, or one whose sender's lease has lapsed; True if `owner` got it."""
+    now = datetime.utcnow()
+    table = Campaign.__table__
+    claimable = or_(table.c.status == 'queued',
+                    and_(table.c.status == 'sending',
+                         or_(table.c.lease_until.is_(None), table.c.lease_until < now)))
+    result = db.session.execute(
+        table.update().where(table.c.id == campaign_id, claimable)
+        .values(status='sending', claimed_by=owner, lease_until=_lease_end(),
+                started_at=func.coalesce(table.c.started_at, now)))
+    db.session.commit()
+    return result.rowcount == 1
+
+
+def _renew_lease(campaign_id, owner):
+    """Extend our lease in the current transaction; False if another sender has taken the campaign."""
+    table = Campaign.__table__
+    result = db.session.execute(table.update().where(table.c.id == campaign_id, table.c.claimed_by == owner)
+                                .values(lease_until=_lease_end()))
+    return result.rowcount == 1
+
+
+def _finish(campaign_id, owner):
+    """Mark our campaign done, unless it was cancelled or taken over meanwhile."""
+    table = Campaign.__table__
+    db.session.execute(table.update()
+                       .where(table.c.id == campaign_id, table.c.claimed_by == owner, table.c.status == 'sending')
+                       .values(status='done', finished_at=datetime.utcnow(), lease_until=None))
+    db.session.commit()
+
+
+def _lease_end():
+    return datetime.utcnow() + timedelta(seconds=current_app.config['CAMPAIGN_LEASE_SECONDS'])
+
+
+def run_campaign(campaign_id):
+    """Send a queued campaign, or resume one that was interrupted, from its checkpoint.
+
+    The campaign is claimed first, so a second sender (the scheduler and `flask send-campaign`)
+    leaves it alone while this one holds the lease; the lease is renewed with every checkpoint.
+    """
+    config = current_app.config
+    owner = sender_id()
+    if not claim_campaign(campaign_id, owner):
+        return db.session.get(Campaign, campaign_id)
+    campaign = db.session.get(Campaign, campaign_id)
+    rendered = render_campaign(campaign)
+    print(f"[Campaign] {campaign.id}: sending from user id {campaign.last_user_id}.")
+
+    pool = MailerPool(current_app._get_current_object(), config['CAMPAIGN_SMTP_CONNECTIONS'],
+                      config['CAMPAIGN_RATE_PER_SECOND'])
+    try:
+        while True:
+            chunk = recipients(campaign.audience, campaign.last_user_id, config['CAMPAIGN_CHUNK_SIZE'])
+            if not chunk:
+                _finish(campaign.id, owner)
+                db.session.refresh(campaign)
+                break
+            results = pool.send([(recipient, build_message(rendered, recipient)) for recipient in chunk])
+            db.session.refresh(campaign)     # picks up a cancel issued while the chunk was sending
+            for recipient, error in results:
+                if error is None:
+                    campaign.sent_count += 1
+                elif permanent_failure(error):
+                    campaign.failed_count += 1
+                else:
+                    _defer(rendered, recipient)
+                    campaign.deferred_count += 1
+            campaign.last_user_id = chunk[-1].id
+            if not _renew_lease(campaign.id, owner):
+                db.session.rollback()
+                print(f"[Campaign] {campaign.id}: claimed by another sender, stopping.")
+                break
+            db.session.commit()
+            if campaign.status == 'cancelled':
+                break
+    finally:
+        pool.close()
+    print(f"[Campaign] {campaign.id}: {campaign.status}, {campaign.sent_count} sent, "
+          f"{campaign.deferred_count} deferred, {campaign.failed_count} failed.")
+    return campaign
+
+
+def _defer(rendered, recipient):
+    msg = build_message(rendered, recipient)
+    enqueue_email('campaign', recipient.email, msg.subject, CAMPAIGN_SENDER, body=msg.body, html=msg.html)
+
+
+def run_pending_campaigns():
+    """Run every queued or interrupted campaign, oldest first (the scheduler leader calls this)."""
+    ids = [cid for (cid,) in db.session.query(Campaign.id)
+           .filter(Campaign.status.in_(('queued', 'sending'))).order_by(Campaign.id)]
+    for campaign_id in ids:
+        run_campaign(campaign_id)
+    return ids
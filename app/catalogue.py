@@ -0,0 +1,65 @@
+"""
+In-process challenge catalogue.
+
+Challenges and their hint links change only when `flask seed-content` runs,
+so each worker keeps an immutable snapshot of them: one ``ChallengeEntry``
+(a ``__slots__`` object) per challenge with its hint text prebuilt, ordered
+for /challenges and indexed by id for /validate. ``initialize_challenges``
+bumps the CHALLENGES data-version counter whenever it adds or changes a
+challenge; a request only reads that counter (memoised per request) and the
+snapshot is rebuilt when it has moved.
+"""
+from flask import current_app
+
+from app.models import Challenge
+from app.versioning import CHALLENGES, read_versions
+
+DEFAULT_DOC_LINK = 'https://aws.amazon.com/cli/'
+
+
+class ChallengeEntry:
+    """A read-only copy of one challenge row, plus the hint shown for a wrong answer."""
+
+    __slots__ = ('id', 'name', 'description', 'solution', 'forbidden_params', 'points', 'version',
+                 'doc_link', 'video_link', 'hint')
+
+    def __init__(self, row):
+        values = {name: getattr(row, name) for name in self.__slots__[:-1]}
+        values['doc_link'] = values['doc_link'] or DEFAULT_DOC_LINK
+        values['hint'] = f"\n📖 Docs: {values['doc_link']}" + (
+            f"\n🎥 Video: {values['video_link']}" if values['video_link'] else '')
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('challenge catalogue entries are read-only')
+
+    def __repr__(self):
+        return f'<ChallengeEntry {self.name} v{self.version}>'
+
+
+class Catalogue:
+    """Every challenge at one CHALLENGES version: ``challenges`` in id order, ``get`` by id."""
+
+    __slots__ = ('version', 'challenges', '_by_id')
+
+    def __init__(self, version, rows):
+        self.version = version
+        self.challenges = tuple(ChallengeEntry(row) for row in rows)
+        self._by_id = {entry.id: entry for entry in self.challenges}
+
+    def get(self, challenge_id):
+        return self._by_id.get(challenge_id)
+
+    def __len__(self):
+        return len(self.challenges)
+
+
+def get_catalogue():
+    """This worker's challenge snapshot, rebuilt only when the CHALLENGES counter has moved."""
+    version = read_versions(CHALLENGES)[CHALLENGES]
+    catalogue = current_app.extensions.get('challenge_catalogue')
+    if catalogue is None or catalogue.version != version:
+        catalogue = Catalogue(version, Challenge.query.order_by(Challenge.id).all())
+        current_app.extensions['challenge_catalogue'] = catalogue
+    return catalogue
@@ -0,0 +1,99 @@
+"""
+Structured AWS CLI command matching.
+
+``parse_command`` tokenises a command into (service, operation, params,
+args): ``--user-name=x`` and ``--user-name x`` both become params['user-name']
+= 'x', flag order does not matter and option names are case-insensitive. A
+challenge's solution is parsed the same way and compiled into a ``Matcher``:
+the service and operation must be equal, every option in the solution must be
+present (with the same value, when the solution gives one), any positional
+arguments in the solution must lead the command's, and none of the
+challenge's forbidden options may appear. Matchers are cached per app by
+challenge id and rebuilt only when the challenge's version changes.
+"""
+import re
+from collections import namedtuple
+
+from flask import current_app
+
+# "double quoted" | 'single quoted' | bare word
+_TOKEN = re.compile(r'"([^"]*)"|\'([^\']*)\'|(\S+)')
+
+# A command as the matcher sees it; params maps lower-case option names (without --) to a value or None
+ParsedCommand = namedtuple('ParsedCommand', 'service operation params args')
+# ok, plus a short learner-facing reason when it is not
+MatchResult = namedtuple('MatchResult', 'ok problem')
+
+
+def tokenize(command):
+    return [next(g for g in m.groups() if g is not None) for m in _TOKEN.finditer(command)]
+
+
+def parse_command(command):
+    """(service, operation, params, args) for an `aws ...` command, or None if it is not one."""
+    tokens = tokenize(command)
+    if not tokens or tokens[0].lower() != 'aws':
+        return None
+    words, params = [], {}
+    i = 1
+    while i < len(tokens):
+        token = tokens[i]
+        if token.startswith('--') and len(token) > 2:
+            name, eq, value = token[2:].partition('=')
+            if not eq:
+                # --name value, unless the next token is another option (then --name is a flag)
+                nxt = tokens[i + 1] if i + 1 < len(tokens) else None
+                value = None
+                if nxt is not None and not nxt.startswith('--'):
+                    value = nxt
+                    i += 1
+            params[name.lower()] = value
+        else:
+            words.append(token)
+        i += 1
+    if len(words) < 2:
+        return None
+    return ParsedCommand(words[0].lower(), words[1].lower(), params, tuple(words[2:]))
+
+
+class Matcher:
+    """A challenge's solution, compiled once; call it with a parsed command."""
+
+    __slots__ = ('service', 'operation', 'required', 'forbidden', 'args')
+
+    def __init__(self, solution, forbidden=''):
+        parsed = parse_command(solution)
+        if parsed is None:
+            raise ValueError(f'not an aws command: {solution!r}')
+        self.service, self.operation, self.required, self.args = parsed
+        self.forbidden = frozenset(name.lstrip('-').lower() for name in (forbidden or '').split())
+
+    def __call__(self, parsed):
+        if parsed is None:
+            return MatchResult(False, 'Commands start with `aws <service> <operation>`.')
+        if (parsed.service, parsed.operation) != (self.service, self.operation):
+            return MatchResult(False, None)
+        for name, value in self.required.items():
+            if name not in parsed.params:
+                return MatchResult(False, f'Missing --{name}.')
+            if value is not None and parsed.params[name] != value:
+                return MatchResult(False, f'--{name} should be {value}.')
+        for name in self.forbidden.intersection(parsed.params):
+            return MatchResult(False, f'--{name} is not allowed here.')
+        if parsed.args[:len(self.args)] != self.args:
+            return MatchResult(False, f"Expected {' '.join(self.args)}.")
+        return MatchResult(True, None)
+
+
+def matcher_for(challenge):
+    """The compiled matcher for a challenge, reused until its version changes."""
+    cache = current_app.extensions.setdefault('cli_matchers', {})
+    entry = cache.get(challenge.id)
+    if entry is None or entry[0] != challenge.version:
+        entry = cache[challenge.id] = (challenge.version, Matcher(challenge.solution, challenge.forbidden_params))
+    return entry[1]
+
+
+def match_command(challenge, command):
+    """MatchResult for a learner's command against a challenge."""
+    return matcher_for(challenge)(parse_command(command))
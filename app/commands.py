@@ -0,0 +1,114 @@
+"""
+Flask CLI commands for one-shot maintenance tasks.
+Usage: flask --app run <command>
+"""
+import click
+from flask.cli import with_appcontext
+
+
+@click.command('upgrade-db')
+@with_appcontext
+def upgrade_db_command():
+    """Create missing tables and apply pending migrations (stamps pre-migration databases first)."""
+    from app.schema import upgrade_schema
+    before, after = upgrade_schema()
+    click.echo(f"Schema at {after} (was {before or 'unversioned'}).")
+
+
+@click.command('seed-content')
+@click.option('--force', is_flag=True, help='Re-run every seed set even if its hash is unchanged.')
+@with_appcontext
+def seed_content_command(force):
+    """Create tables and seed challenges, badges and learning paths."""
+    from app import db
+    from app.seeding import sync_content
+    db.create_all()
+    seeded = sync_content(force=force)
+    if seeded:
+        click.echo(f"Seeded: {', '.join(seeded)}")
+        if 'badges' in seeded:
+            from app.badges import backfill_badges
+            _echo_awards(backfill_badges())
+    else:
+        click.echo('Content is up to date.')
+
+
+@click.command('generate-dataset')
+@click.option('--users', type=int, default=10000, show_default=True, help='Number of synthetic users to add.')
+@click.option('--seed', type=int, default=42, show_default=True, help='Random seed, for reproducible datasets.')
+@click.option('--password', default='Bench@1234', show_default=True, help='Password shared by every generated user.')
+@click.option('--prefix', default='bench', show_default=True, help='Username prefix for generated users.')
+@with_appcontext
+def generate_dataset_command(users, seed, password, prefix):
+    """Bulk-insert synthetic users, scores, progress, certificates and logs for benchmarking."""
+    from app import db
+    from app.dataset import generate_dataset
+    from app.seeding import sync_content
+    db.create_all()
+    sync_content()
+    counts = generate_dataset(users, seed=seed, password=password, prefix=prefix)
+    seconds = counts.pop('seconds')
+    click.echo(', '.join(f'{table}: {n}' for table, n in counts.items()))
+    click.echo(f'Generated in {seconds}s.')
+
+
+@click.command('rebuild-stats')
+@with_appcontext
+def rebuild_stats_command():
+    """Recompute the user_stats table from scores, progress, certificates and badges."""
+    from app import db
+    from app.stats import rebuild_user_stats
+    db.create_all()
+    rows, drifted = rebuild_user_stats()
+    click.echo(f'Rebuilt stats for {rows} users ({drifted} out of date).')
+
+
+@click.command('backfill-badges')
+@click.option('--badge', 'names', multiple=True, help='Only this badge (repeatable); default is every badge.')
+@click.option('--chunk-size', type=int, default=None, help='User ids per transaction (default 10000).')
+@with_appcontext
+def backfill_badges_command(names, chunk_size):
+    """Award badges retroactively to every user whose stats already qualify."""
+    from app.badges import BACKFILL_CHUNK, backfill_badges
+    _echo_awards(backfill_badges(names or None, chunk_size=chunk_size or BACKFILL_CHUNK))
+
+
+@click.command('send-outbox')
+@with_appcontext
+def send_outbox_command():
+    """Queue due badge digests and send every due email in the outbox now (normally the scheduler does this)."""
+    from app.badges import flush_badge_digests
+    from app.models import OutboxEmail
+    from app.outbox import drain_outbox
+    flush_badge_digests()
+    counts = drain_outbox()
+    dead = OutboxEmail.query.filter_by(status='dead').count()
+    click.echo(f"Sent {counts['sent']}, failed {counts['failed']}; {dead} dead-lettered in total.")
+
+
+@click.command('send-campaign')
+@click.argument('campaign_id', type=int)
+@with_appcontext
+def send_campaign_command(campaign_id):
+    """Send (or resume) a queued announcement campaign now, instead of waiting for the scheduler."""
+    from app.campaigns import run_campaign
+    campaign = run_campaign(campaign_id)
+    if campaign is None:
+        raise click.ClickException(f'No campaign {campaign_id}.')
+    click.echo(f'Campaign {campaign.id} {campaign.status}: {campaign.sent_count} sent, '
+               f'{campaign.deferred_count} deferred, {campaign.failed_count} failed.')
+
+
+def _echo_awards(awards):
+    click.echo(', '.join(f'{name}: {n}' for name, n in awards.items()) or 'No badges with trigger conditions.')
+    click.echo(f'Awarded {sum(awards.values())} badges.')
+
+
+def register_commands(app):
+    app.cli.add_command(upgrade_db_command)
+    app.cli.add_command(seed_content_command)
+    app.cli.add_command(generate_dataset_command)
+    app.cli.add_command(rebuild_stats_command)
+    app.cli.add_command(backfill_badges_command)
+    app.cli.add_command(send_outbox_command)
+    app.cli.add_command(send_campaign_command)
@@ -0,0 +1,118 @@
+"""
+SQLite engine tuning and read/write routing.
+
+Pragmas are applied on every new DBAPI connection through a SQLAlchemy
+``connect`` event. The profile is chosen with the SQLITE_PROFILE env var;
+'performance' enables WAL so readers in other workers are not blocked by a
+writer's commit.
+
+Views marked with ``read_only`` (or whole blueprints via ``read_only_blueprint``)
+run their SELECTs on a separate engine that opens the same file with
+``mode=ro`` and ``query_only``, sized independently from the write pool.
+"""
+from functools import wraps
+
+from flask import current_app, g
+from flask_sqlalchemy.session import Session
+from sqlalchemy import create_engine, event
+
+SQLITE_PROFILES = {
+    'default': {},
+    'performance': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,          # ms to wait on a locked database before failing
+        'mmap_size': 268435456,        # 256 MB memory-mapped I/O
+        'cache_size': -64000,          # negative = KiB, i.e. ~64 MB page cache
+        'temp_store': 'MEMORY',
+    },
+}
+
+REPORTED_PRAGMAS = ('journal_mode', 'synchronous', 'busy_timeout', 'mmap_size',
+                    'cache_size', 'temp_store', 'foreign_keys', 'page_size')
+
+
+def apply_sqlite_pragmas(engine, pragmas):
+    """Register a connect hook that runs PRAGMA statements on each new connection."""
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+
+    @event.listens_for(engine, 'connect')
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+
+
+def read_sqlite_pragmas(engine):
+    """Return the live value of each reported pragma, for the admin database page."""
+    if engine.dialect.name != 'sqlite':
+        return {}
+    values = {}
+    with engine.connect() as conn:
+        for name in REPORTED_PRAGMAS:
+            values[name] = conn.exec_driver_sql(f'PRAGMA {name}').scalar()
+    return values
+
+
+def readonly_uri(primary_uri):
+    """Read-only URI for a file-backed SQLite database, or None if it cannot be shared."""
+    prefix = 'sqlite:///'
+    if not primary_uri.startswith(prefix) or ':memory:' in primary_uri or '?' in primary_uri:
+        return None
+    return f'{prefix}file:{primary_uri[len(prefix):]}?mode=ro&uri=true'
+
+
+def init_readonly_engine(app, primary_uri):
+    """Build the read-only engine into app.extensions['readonly_engine'] when enabled."""
+    uri = app.config.get('SQLALCHEMY_READONLY_URI') or readonly_uri(primary_uri)
+    if not app.config['READONLY_ENGINE_ENABLED'] or uri is None:
+        app.extensions['readonly_engine'] = None
+        return None
+    engine = create_engine(uri, pool_size=app.config['READONLY_POOL_SIZE'], max_overflow=0)
+    pragmas = {k: v for k, v in app.config['SQLITE_PRAGMAS'].items() if k != 'journal_mode'}
+    pragmas['query_only'] = 'ON'
+    apply_sqlite_pragmas(engine, pragmas)
+    app.extensions['readonly_engine'] = engine
+    return engine
+
+
+def dialect_insert(table):
+    """INSERT construct for the bound dialect, so callers can use on_conflict_do_update upserts."""
+    from app import db
+    if db.session.get_bind().dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(table)
+
+
+class RoutingSession(Session):
+    """Sends reads to the read-only engine while the current request is marked read-only."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and g and g.get('db_read_only'):
+            engine = current_app.extensions.get('readonly_engine')
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def _mark_read_only():
+    g.db_read_only = True
+
+
+def read_only(f):
+    """Route every query issued by this view to the read-only engine."""
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        _mark_read_only()
+        return f(*args, **kwargs)
+    return decorated
+
+
+def read_only_blueprint(blueprint):
+    """Mark every view in a blueprint as read-only."""
+    blueprint.before_request(_mark_read_only)
+    return blueprint
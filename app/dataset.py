@@ -0,0 +1,123 @@
+"""
+Synthetic dataset generator for benchmarks and query-budget tests.
+
+Builds users with skewed activity on top of the seeded content: most learners
+finish a couple of challenges, a long tail finishes everything; a share enrol
+in learning paths, progress part-way and sometimes earn the certificate. Rows
+go in through chunked Core executemany inserts with one pre-computed password
+hash, so 100k users take seconds rather than minutes.
+"""
+import random
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func
+from werkzeug.security import generate_password_hash
+
+from app import db
+from app.models import User, Challenge, Score, AuditLog, BackupLog
+from app.models_learning import PathModule, UserPathProgress, UserModuleProgress, Certificate
+from app.stats import rebuild_user_stats
+
+ADMIN_EVERY = 1000          # one admin per this many generated users (user 0 is always an admin)
+ENROL_RATE = 0.4            # share of users enrolled in at least one path
+AUDIT_ACTIONS = ('ACTIVATE_USER', 'DEACTIVATE_USER', 'PROMOTE_USER', 'DEMOTE_USER', 'MANUAL_BACKUP')
+
+
+def _insert(model, rows, chunk_size):
+    """Executemany a Core INSERT in chunks so memory stays flat."""
+    table = model.__table__
+    for i in range(0, len(rows), chunk_size):
+        db.session.execute(table.insert(), rows[i:i + chunk_size])
+    return len(rows)
+
+
+def _skewed(rng, upper):
+    """Integer in [0, upper], heavily weighted toward the low end (Pareto tail)."""
+    return min(upper, int(rng.paretovariate(1.2)) - 1)
+
+
+def generate_dataset(users, seed=42, password='Bench@1234', prefix='bench', days=365, chunk_size=5000):
+    """Insert `users` synthetic learners plus their activity; return {table: rows inserted}."""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    started = time.perf_counter()
+
+    challenges = db.session.query(Challenge.id, Challenge.points).order_by(Challenge.id).all()
+    paths = {}
+    for path_id, module_id, points in (db.session.query(PathModule.path_id, PathModule.id, PathModule.points)
+                                       .order_by(PathModule.path_id, PathModule.order_index)):
+        paths.setdefault(path_id, []).append((module_id, points or 0))
+
+    first_index = db.session.query(func.count(User.id)).filter(User.username.like(f'{prefix}%')).scalar()
+    max_id = db.session.query(func.max(User.id)).scalar() or 0
+    pw_hash = generate_password_hash(password)
+
+    joined = []
+    user_rows = []
+    for n in range(users):
+        i = first_index + n
+        created = now - timedelta(days=rng.random() * days)
+        joined.append(created)
+        user_rows.append({
+            'username': f'{prefix}{i:06d}', 'email': f'{prefix}{i:06d}@example.com', 'password_hash': pw_hash,
+            'role': 'admin' if i % ADMIN_EVERY == 0 else 'user', 'is_active': rng.random() > 0.03,
+            'created_at': created, 'last_login': created + timedelta(days=rng.random() * (now - created).days),
+            'show_wizard': False,
+        })
+    counts = {'user': _insert(User, user_rows, chunk_size)}
+    user_ids = [uid for (uid,) in db.session.query(User.id).filter(User.id > max_id).order_by(User.id)]
+    admin_ids = [uid for uid, row in zip(user_ids, user_rows) if row['role'] == 'admin']
+
+    score_rows, path_rows, module_rows, cert_rows = [], [], [], []
+    for uid, created in zip(user_ids, joined):
+        span = max((now - created).total_seconds(), 1)
+        for cid, points in rng.sample(challenges, _skewed(rng, len(challenges))):
+            score_rows.append({'user_id': uid, 'challenge_id': cid, 'score': points or 0,
+                               'completed_at': created + timedelta(seconds=rng.random() * span)})
+        if not paths or rng.random() > ENROL_RATE:
+            continue
+        for path_id in rng.sample(list(paths), min(len(paths), 1 + _skewed(rng, 2))):
+            modules = paths[path_id]
+            done = min(len(modules), int(rng.random() ** 1.5 * (len(modules) + 1)))
+            enrolled = created + timedelta(seconds=rng.random() * span)
+            earned = 0
+            finished = enrolled
+            for module_id, points in modules[:done]:
+                finished = finished + timedelta(hours=rng.random() * 72)
+                earned += points
+                module_rows.append({
+                    'user_id': uid, 'module_id': module_id, 'completed': True, 'completed_at': finished,
+                    'quiz_score': rng.choice((70, 80, 90, 100)), 'quiz_passed': True,
+                    'quiz_attempts': 1 + _skewed(rng, 3), 'points_earned': points})
+            completed_at = finished if done == len(modules) else None
+            path_rows.append({'user_id': uid, 'path_id': path_id, 'enrolled_at': enrolled,
+                              'completed_at': completed_at, 'total_points_earned': earned})
+            if completed_at:
+                cert_rows.append({'user_id': uid, 'path_id': path_id, 'cert_code': f'BN{uid:09d}{path_id:03d}',
+                                  'issued_at': completed_at, 'recipient_full_name': f'Learner {uid}',
+                                  'total_points': earned})
+
+    counts['score'] = _insert(Score, score_rows, chunk_size)
+    counts['user_path_progress'] = _insert(UserPathProgress, path_rows, chunk_size)
+    counts['user_module_progress'] = _insert(UserModuleProgress, module_rows, chunk_size)
+    counts['certificate'] = _insert(Certificate, cert_rows, chunk_size)
+
+    audit_rows = []
+    if admin_ids:
+        audit_rows = [{'admin_id': rng.choice(admin_ids), 'action_type': rng.choice(AUDIT_ACTIONS),
+                       'affected_record': f'user:{rng.choice(user_ids)}',
+                       'timestamp': now - timedelta(days=rng.random() * days)}
+                      for _ in range(max(1, users // 10))]
+    counts['audit_log'] = _insert(AuditLog, audit_rows, chunk_size)
+
+    backup_rows = [{'backup_type': 'automated', 'file_path': f'backups/backup_auto_{d:04d}.db',
+                    'file_size': 200_000 + d * 100, 'validation_status': 'pass' if rng.random() > 0.02 else 'fail',
+                    'created_at': now - timedelta(days=d), 'created_by': None}
+                   for d in range(days)]
+    counts['backup_log'] = _insert(BackupLog, backup_rows, chunk_size)
+
+    db.session.commit()
+    counts['user_stats'] = rebuild_user_stats()[0]
+    counts['seconds'] = round(time.perf_counter() - started, 2)
+    return counts
@@ -1,11 +1,21 @@
-from flask_mail import Message
-from flask import render_template
-from app import mail
-import os
+from functools import lru_cache
 
+from flask import current_app, render_template
+from markupsafe import Markup, escape
 
-def send_welcome_email(user):
-    """Send welcome email to newly registered user."""
+from app.outbox import enqueue_email
+
+PLATFORM_SENDER = ("Devon Adkins via AWS Learning Platform", "no-reply@awslearningplatform.click")
+CLI_PLATFORM_SENDER = ("Devon Adkins via AWS CLI Learning Platform", "no-reply@awslearningplatform.click")
+LABS_SENDER = ('AWS Community Labs', 'no-reply@awslearningplatform.click')
+
+# Badge digest template fields, in the order they appear in badge_digest_email.html, and their placeholders
+_DIGEST_FIELDS = (('headline', '\x00headline\x00'), ('username', '\x00username\x00'),
+                  ('earned', '\x00earned\x00'), ('badges', '\x00badges\x00'))
+
+
+def queue_welcome_email(user):
+    """Queue the welcome email for a newly registered user (sent by the outbox once the signup commits)."""
     signature = """
     <div style="font-family:Arial,sans-serif;font-size:12px;color:#666;
                 border-top:1px solid #e0e0e0;padding-top:10px;margin-top:20px;">
@@ -16,14 +26,7 @@ def send_welcome_email(user):
         devon@awslearningplatform.click</p>
     </div>
     """
-    try:
-        msg = Message(
-            subject="Welcome to the AWS Learning Platform!",
-            sender=("Devon Adkins via AWS Learning Platform",
-                    "no-reply@awslearningplatform.click"),
-            recipients=[user.email]
-        )
-        msg.body = f"""
+    body = f"""
 Hello {user.username}!
 
 Welcome to the AWS CLI Learning Platform!
@@ -41,72 +44,69 @@ devon@awslearningplatform.click
 Happy Learning!
 AWS Learning Platform Team
         """
-        msg.html = render_template('welcome_email.html', user=user) + signature
-
-        aws_img = os.path.join(os.path.dirname(__file__), 'static', 'aws.png')
-        if os.path.exists(aws_img):
-            with open(aws_img, 'rb') as f:
-                msg.attach("cloudlearning", "image/png", f.read(), "aws.png")
-
-        mail.send(msg)
-        print(f"[Email] Welcome email sent to {user.email}")
-        return True
-    except Exception as e:
-        print(f"[Email] Failed to send welcome email: {e}")
-        return False
-
-
-def send_badge_email(user, badge):
-    """Send badge unlock notification email."""
-    try:
-        msg = Message(
-            subject=f"Congratulations! You've Unlocked the {badge.name} Badge!",
-            sender=("Devon Adkins via AWS CLI Learning Platform",
-                    "no-reply@awslearningplatform.click"),
-            recipients=[user.email]
-        )
-        msg.body = f"""
-Hello {user.username}!
-
-Congratulations! You've earned the {badge.name} badge!
-
-{badge.description}
-
+    html = render_template('welcome_email.html', user=user) + signature
+    return enqueue_email('welcome', user.email, "Welcome to the AWS Learning Platform!", PLATFORM_SENDER,
+                         body=body, html=html, attachments=[('aws.png', 'cloudlearning', 'image/png', 'aws.png')])
+
+
+def _digest_parts():
+    """The digest template rendered once per app, split around its fields into the fixed HTML between them."""
+    parts = current_app.extensions.get('badge_digest_parts')
+    if parts is None:
+        html = render_template('badge_digest_email.html',
+                               **{field: Markup(marker) for field, marker in _DIGEST_FIELDS})
+        parts = []
+        for _, marker in _DIGEST_FIELDS:
+            head, html = html.split(marker, 1)
+            parts.append(head)
+        parts.append(html)
+        parts = current_app.extensions['badge_digest_parts'] = tuple(parts)
+    return parts
+
+
+@lru_cache(maxsize=256)
+def _badge_item(name, description, icon):
+    """One badge's line in the digest, as (text, html)."""
+    text = f"{icon or '🏆'} {name}\n{description}\n"
+    html = (f'<p style="margin:16px 0 4px;font-size:16px;"><strong>{escape(icon or "🏆")} {escape(name)}</strong></p>'
+            f'<p style="margin:0;color:#555;">{escape(description)}</p>')
+    return text, html
+
+
+def queue_badge_digest(username, email, badges):
+    """Queue one email announcing every badge in `badges` ((name, description, icon) tuples)."""
+    items = [_badge_item(*badge) for badge in badges]
+    if len(badges) == 1:
+        headline, earned = f'{badges[0][0]} Unlocked!', f'the <strong>{escape(badges[0][0])}</strong> badge'
+        subject = f"Congratulations! You've Unlocked the {badges[0][0]} Badge!"
+    else:
+        headline, earned = f'{len(badges)} Badges Unlocked!', f'<strong>{len(badges)} new badges</strong>'
+        subject = f"Congratulations! You've Unlocked {len(badges)} New Badges!"
+    values = (escape(headline), escape(username), earned, ''.join(html for _, html in items))
+    parts = _digest_parts()
+    html = parts[0] + ''.join(str(value) + part for value, part in zip(values, parts[1:]))
+    body = f"""
+Hello {username}!
+
+Congratulations! You've earned {'a new badge' if len(badges) == 1 else f'{len(badges)} new badges'}:
+
+{chr(10).join(text for text, _ in items)}
 Keep going - more badges and challenges await you at:
 https://awslearningplatform.click
 
 AWS Learning Platform Team
         """
-        msg.html = f"""
-        <div style="font-family:Arial,sans-serif;max-width:600px;margin:0 auto;padding:20px;">
-            <h1 style="color:#FF9900;text-align:center;">
-                {badge.icon or '🏆'} {badge.name} Unlocked! {badge.icon or '🏆'}
-            </h1>
-            <p style="text-align:center;font-size:18px;">
-                <strong>Congratulations</strong>, {user.username}!
-            </p>
-            <p style="text-align:center;color:#555;">
-                You've earned the prestigious <strong>{badge.name}</strong> by mastering AWS CLI challenges!
-            </p>
-            <p>{badge.description}</p>
-            <div style="text-align:center;margin:30px 0;">
-                <a href="https://awslearningplatform.click"
-                   style="background:#FF9900;color:#000;padding:12px 30px;
-                          border-radius:8px;text-decoration:none;font-weight:bold;">
-                    Continue Learning
-                </a>
-            </div>
-        </div>
-        """
-
-        aws_img = os.path.join(os.path.dirname(__file__), 'static', 'badge.png')
-        if os.path.exists(aws_img):
-            with open(aws_img, 'rb') as f:
-                msg.attach("badge", "image/png", f.read(), "badge.png")
-
-        mail.send(msg)
-        print(f"[Email] Badge email sent to {user.email} for badge: {badge.name}")
-        return True
-    except Exception as e:
-        print(f"[Email] Failed to send badge email: {e}")
-        return False
+    return enqueue_email('badge', email, subject, CLI_PLATFORM_SENDER, body=body, html=html,
+                         attachments=[('badge.png', 'badge', 'image/png', 'badge.png')])
+
+
+def queue_password_reset_email(user, reset_link):
+    """Queue the password reset link in the transaction that stores the token."""
+    html = f"""
+            <p>Hello {user.username},</p>
+            <p>You requested a password reset for your AWS Community Labs account.</p>
+            <p><a href="{reset_link}">Click here to reset your password</a></p>
+            <p>This link expires in 1 hour. If you did not request this, ignore this email.</p>
+            <p>- AWS Community Labs</p>
+            """
+    return enqueue_email('password_reset', user.email, 'Password Reset - AWS Community Labs', LABS_SENDER, html=html)
@@ -0,0 +1,70 @@
+"""
+In-process domain events.
+
+Writers commit their core change first, then ``publish`` what happened:
+ChallengeCompleted, ModuleCompleted, PathCompleted, Enrolled, BadgeAwarded.
+Subscribers run inline, after the commit, so they must stay cheap; the only
+built-in one counts events into the metrics registry. Side effects that need
+to survive a crash do not belong here: emails go through the outbox in the
+writer's own transaction (see app.outbox) and badge digests are flushed by
+the scheduler (see app.badges). A failing subscriber is logged and never
+affects the publisher or the other subscribers.
+"""
+from collections import namedtuple
+
+from flask import current_app
+
+ChallengeCompleted = namedtuple('ChallengeCompleted', 'user_id challenge_id points')
+ModuleCompleted = namedtuple('ModuleCompleted', 'user_id path_id module_id points')
+PathCompleted = namedtuple('PathCompleted', 'user_id path_id certificate_code')
+Enrolled = namedtuple('Enrolled', 'user_id path_id')
+# Carries the badge details, so subscribers do not re-read the badge
+BadgeAwarded = namedtuple('BadgeAwarded', 'user_id badge_id name description icon')
+
+EVENT_TYPES = (ChallengeCompleted, ModuleCompleted, PathCompleted, Enrolled, BadgeAwarded)
+
+
+class EventBus:
+    """Subscribers per event type, called inline in the order they subscribed."""
+
+    def __init__(self):
+        self._handlers = {}
+
+    def subscribe(self, event_type, handler=None):
+        """Register handler for event_type; usable as a decorator."""
+        if handler is None:
+            return lambda fn: self.subscribe(event_type, fn)
+        self._handlers.setdefault(event_type, []).append(handler)
+        return handler
+
+    def unsubscribe(self, event_type, handler):
+        self._handlers.get(event_type, []).remove(handler)
+
+    def publish(self, *events):
+        """Deliver committed events to their subscribers."""
+        for event in events:
+            for handler in self._handlers.get(type(event), ()):
+                try:
+                    handler(event)
+                except Exception as e:
+                    print(f"[Events] {handler.__name__} failed on {type(event).__name__}: {e}")
+
+
+def publish(*events):
+    """Publish events on the current app's bus. Call only after the transaction that produced them commits."""
+    if events:
+        current_app.extensions['events'].publish(*events)
+
+
+def init_events(app):
+    """Create the app's bus and register the built-in subscribers."""
+    bus = EventBus()
+    app.extensions['events'] = bus
+
+    metrics = app.extensions.get('metrics')
+    if metrics is not None:
+        def _count(event):
+            metrics.registry.inc('domain_events_total', {'event': type(event).__name__})
+        for event_type in EVENT_TYPES:
+            bus.subscribe(event_type, _count)
+    return bus
@@ -0,0 +1,58 @@
+"""
+Conditional GET (ETag / If-None-Match) keyed on data-version counters.
+
+A view wrapped in ``conditional(versions)`` first reads the cheap counters its
+response depends on and hashes them, together with the user, the full request
+path and ETAG_SALT, into a strong ETag. A request whose If-None-Match already
+holds that tag gets a bare 304 before the view or any of its queries run.
+The counters are read *before* the body is built, so a write racing with the
+request can only make the tag older than the body, never newer.
+"""
+import hashlib
+from functools import wraps
+
+from flask import current_app, g, make_response, request, session
+
+from app.models import now_sast
+from app.stats import get_stats
+from app.versioning import USER_STATS, USER_STATS_EPOCH, read_versions
+
+
+def scores_version():
+    """Global ranking domain: every user_stats change, rebuilds, and the day (windowed boards roll over)."""
+    versions = read_versions(USER_STATS, USER_STATS_EPOCH)
+    return versions[USER_STATS], versions[USER_STATS_EPOCH], now_sast().date().isoformat()
+
+
+def user_version():
+    """Per-user progress domain: the version stamped on the session user's user_stats row.
+
+    Loads the whole row and holds it on g for the request: the session's identity map is
+    weak-referenced, and keeping the row alive lets a view's own get_stats() skip the query.
+    """
+    g._etag_user_stats = get_stats(session['user_id'])
+    return g._etag_user_stats.version
+
+
+def _etag(versions):
+    raw = repr((current_app.config['ETAG_SALT'], session.get('user_id'), request.full_path, versions))
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+def conditional(versions):
+    """Answer 304 when If-None-Match matches the ETag derived from `versions()`; tag 200 responses."""
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            tag = _etag(versions())
+            if request.if_none_match.contains(tag):
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(tag)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return decorated
+    return decorator
@@ -0,0 +1,163 @@
+"""
+Process-level ranked leaderboards.
+
+``RankedIndex`` keeps every scoring user in a list sorted by (-total, user_id),
+so top-K is a slice, a user's rank or neighbourhood is one bisection, and a
+keyset page starts at the bisection of its (total, user_id) cursor.
+
+Each worker holds one index per board in ``app.extensions['leaderboard']`` and
+syncs it on read: if the shared 'user_stats' data version has moved it reloads
+only the users whose rows are stamped with a newer version; if the epoch moved
+(a rebuild or a deleted user) or a windowed board rolled over to a new day it
+reloads in full. The all-time board reads user_stats; the weekly and monthly
+boards sum the per-day score_daily rollup, never the raw score table. The
+overall board ranks user_stats.total_points (challenge plus learning-path
+points, precomputed by every award) and carries the per-source breakdown.
+"""
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import timedelta
+from collections import namedtuple
+
+from flask import current_app
+from sqlalchemy import func
+
+from app import db
+from app.models import User, UserStats, ScoreDaily, now_sast
+from app.versioning import USER_STATS, USER_STATS_EPOCH, read_versions
+
+RankedEntry = namedtuple('RankedEntry', 'rank user_id username total breakdown', defaults=(None,))
+Breakdown = namedtuple('Breakdown', 'challenges learning')
+
+# Board name -> (points ranked, window length in days or None for all time)
+BOARDS = {
+    'overall': ('combined', None),
+    'all': ('challenges', None),
+    'week': ('challenges', 7),
+    'month': ('challenges', 30),
+}
+DEFAULT_BOARD = 'all'     # challenge points, as before the extra boards; 'overall' is opt-in via ?board=
+
+
+class RankedIndex:
+    """Users with points, ordered by total descending then user id; lookups are O(log n) bisections."""
+
+    def __init__(self, rows=()):
+        self._totals = {}
+        self._names = {}
+        self._breakdowns = {}
+        for user_id, total, username, *breakdown in rows:
+            if total > 0:
+                self._totals[user_id] = total
+                self._names[user_id] = username
+                if breakdown:
+                    self._breakdowns[user_id] = breakdown[0]
+        self._keys = sorted((-total, user_id) for user_id, total in self._totals.items())
+
+    def __len__(self):
+        return len(self._keys)
+
+    def set(self, user_id, total, username, breakdown=None):
+        """Insert, move or (when total is 0) drop a user."""
+        old = self._totals.pop(user_id, None)
+        if old is not None:
+            del self._keys[bisect_left(self._keys, (-old, user_id))]
+        if total > 0:
+            self._totals[user_id] = total
+            self._names[user_id] = username
+            if breakdown is not None:
+                self._breakdowns[user_id] = breakdown
+            insort(self._keys, (-total, user_id))
+        else:
+            self._names.pop(user_id, None)
+            self._breakdowns.pop(user_id, None)
+
+    def _entry(self, i):
+        neg_total, user_id = self._keys[i]
+        return RankedEntry(i + 1, user_id, self._names[user_id], -neg_total, self._breakdowns.get(user_id))
+
+    def top(self, k=10):
+        return [self._entry(i) for i in range(min(k, len(self._keys)))]
+
+    def rank(self, user_id):
+        """1-based rank, or None if the user has no points."""
+        total = self._totals.get(user_id)
+        if total is None:
+            return None
+        return bisect_left(self._keys, (-total, user_id)) + 1
+
+    def page(self, after=None, limit=50):
+        """Up to `limit` entries ranked below the (total, user_id) cursor, or from the top."""
+        start = 0 if after is None else bisect_right(self._keys, (-after[0], after[1]))
+        return [self._entry(i) for i in range(start, min(start + limit, len(self._keys)))]
+
+    def around(self, user_id, n=2):
+        """The user's entry with up to n entries either side."""
+        rank = self.rank(user_id)
+        if rank is None:
+            return []
+        return [self._entry(i) for i in range(max(0, rank - 1 - n), min(len(self._keys), rank + n))]
+
+
+class LeaderboardCache:
+    """A RankedIndex for one board plus the data versions (and window) it reflects."""
+
+    def __init__(self, points='challenges', window_days=None):
+        self.points = points
+        self.window_days = window_days
+        self.index = None
+        self.version = None
+        self.epoch = None
+        self.window_start = None
+        self._lock = threading.Lock()
+
+    def _rows(self, window_start, since=None):
+        if self.window_days is None:
+            combined = self.points == 'combined'
+            total = UserStats.total_points if combined else UserStats.challenge_points
+            columns = [UserStats.user_id, total, User.username]
+            if combined:
+                columns += [UserStats.challenge_points, UserStats.module_points]
+            query = db.session.query(*columns).join(User, User.id == UserStats.user_id)
+            if since is None:
+                query = query.filter(total > 0)
+            else:
+                query = query.filter(UserStats.version > since)
+            if combined:
+                return [(uid, pts, name, Breakdown(ch, mod)) for uid, pts, name, ch, mod in query]
+            return query.all()
+        query = (db.session.query(ScoreDaily.user_id, func.sum(ScoreDaily.points), User.username)
+                 .join(User, User.id == ScoreDaily.user_id)
+                 .filter(ScoreDaily.day >= window_start)
+                 .group_by(ScoreDaily.user_id, User.username))
+        if since is not None:
+            changed = db.session.query(UserStats.user_id).filter(UserStats.version > since)
+            query = query.filter(ScoreDaily.user_id.in_(changed.scalar_subquery()))
+        return query.all()
+
+    def sync(self):
+        """Bring the index up to the committed data version and return it."""
+        versions = read_versions(USER_STATS, USER_STATS_EPOCH)
+        window_start = None
+        if self.window_days is not None:
+            window_start = now_sast().date() - timedelta(days=self.window_days - 1)
+        with self._lock:
+            if (self.index is None or versions[USER_STATS_EPOCH] != self.epoch
+                    or window_start != self.window_start):
+                self.index = RankedIndex(self._rows(window_start))
+            elif versions[USER_STATS] != self.version:
+                for user_id, total, username, *breakdown in self._rows(window_start, since=self.version):
+                    self.index.set(user_id, total, username, *breakdown)
+            self.version = versions[USER_STATS]
+            self.epoch = versions[USER_STATS_EPOCH]
+            self.window_start = window_start
+            return self.index
+
+
+def get_leaderboard(board=DEFAULT_BOARD):
+    """This worker's ranked index for one of BOARDS, synced with the database."""
+    caches = current_app.extensions.get('leaderboard')
+    if caches is None:
+        caches = current_app.extensions.setdefault(
+            'leaderboard', {name: LeaderboardCache(points, days) for name, (points, days) in BOARDS.items()})
+    return caches[board].sync()
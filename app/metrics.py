@@ -0,0 +1,309 @@
+"""
+Per-endpoint request and SQL instrumentation in Prometheus text format.
+
+Every worker keeps its own counters and histograms in memory and periodically
+overwrites its snapshot in METRICS_DIR (one ``<pid>.json`` per process), after
+requests and on a background timer so idle workers stay current. The scrape
+endpoint merges all snapshots, so the numbers cover every gunicorn worker. A
+snapshot whose process has exited is folded into ``_retired.json`` and then
+removed, so merged counters never go down when workers are recycled.
+"""
+import glob
+import json
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX dev machines - a single process, no locking needed
+    fcntl = None
+import time
+from contextlib import contextmanager
+
+from flask import g, request
+from sqlalchemy import event
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+RETIRED_SNAPSHOT = '_retired.json'   # summed totals of workers that have exited
+
+_HELP = {
+    'http_requests_total': ('counter', 'Requests served, by endpoint, method and status.'),
+    'http_request_duration_seconds': ('histogram', 'Request latency by endpoint.'),
+    'db_queries_total': ('counter', 'SQL statements executed, by endpoint.'),
+    'db_query_duration_seconds_total': ('counter', 'Time spent executing SQL, by endpoint.'),
+    'db_queries_per_request': ('histogram', 'SQL statements issued per request, by endpoint.'),
+    'domain_events_total': ('counter', 'Domain events published, by event type.'),
+}
+
+
+def _key(labels):
+    return json.dumps(sorted(labels.items()))
+
+
+class MetricsRegistry:
+    """Thread-safe in-process counters and histograms."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {}     # name -> {label_key: value}
+        self.histograms = {}   # name -> {label_key: {'buckets': [...], 'sum': x, 'count': n}}
+
+    def inc(self, name, labels, value=1):
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            key = _key(labels)
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name, labels, value, buckets):
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            key = _key(labels)
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = {'le': list(buckets), 'buckets': [0] * len(buckets), 'sum': 0, 'count': 0}
+            for i, bound in enumerate(hist['le']):
+                if value <= bound:
+                    hist['buckets'][i] += 1
+            hist['sum'] += value
+            hist['count'] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return json.loads(json.dumps({'counters': self.counters, 'histograms': self.histograms}))
+
+
+def merge_snapshots(snapshots):
+    merged = {'counters': {}, 'histograms': {}}
+    for snap in snapshots:
+        for name, series in snap.get('counters', {}).items():
+            target = merged['counters'].setdefault(name, {})
+            for key, value in series.items():
+                target[key] = target.get(key, 0) + value
+        for name, series in snap.get('histograms', {}).items():
+            target = merged['histograms'].setdefault(name, {})
+            for key, hist in series.items():
+                if key not in target:
+                    target[key] = {'le': hist['le'], 'buckets': list(hist['buckets']),
+                                   'sum': hist['sum'], 'count': hist['count']}
+                    continue
+                t = target[key]
+                t['buckets'] = [a + b for a, b in zip(t['buckets'], hist['buckets'])]
+                t['sum'] += hist['sum']
+                t['count'] += hist['count']
+    return merged
+
+
+def _fmt_labels(key, extra=None):
+    pairs = json.loads(key) + (extra or [])
+    if not pairs:
+        return ''
+    body = ','.join('{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"')) for k, v in pairs)
+    return '{' + body + '}'
+
+
+def render_prometheus(snapshot):
+    lines = []
+    for name, series in sorted(snapshot['counters'].items()):
+        kind, help_text = _HELP.get(name, ('counter', name))
+        lines += [f'# HELP {name} {help_text}', f'# TYPE {name} {kind}']
+        for key, value in sorted(series.items()):
+            lines.append(f'{name}{_fmt_labels(key)} {value}')
+    for name, series in sorted(snapshot['histograms'].items()):
+        kind, help_text = _HELP.get(name, ('histogram', name))
+        lines += [f'# HELP {name} {help_text}', f'# TYPE {name} histogram']
+        for key, hist in sorted(series.items()):
+            for bound, count in zip(hist['le'], hist['buckets']):
+                lines.append(f'{name}_bucket{_fmt_labels(key, [["le", bound]])} {count}')
+            lines.append(f'{name}_bucket{_fmt_labels(key, [["le", "+Inf"]])} {hist["count"]}')
+            lines.append(f'{name}_sum{_fmt_labels(key)} {hist["sum"]}')
+            lines.append(f'{name}_count{_fmt_labels(key)} {hist["count"]}')
+    return '\n'.join(lines) + '\n'
+
+
+class WorkerMetrics:
+    """The registry for this process plus its snapshot file in the shared metrics directory."""
+
+    def __init__(self, directory, flush_seconds, background=False):
+        self.registry = MetricsRegistry()
+        self.directory = directory
+        self.flush_seconds = flush_seconds
+        self.background = background
+        self._last_flush = 0.0
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        # Read at flush time, so a registry created before a fork still writes under the worker's pid
+        return os.path.join(self.directory, f'{os.getpid()}.json')
+
+    @property
+    def retired_path(self):
+        return os.path.join(self.directory, RETIRED_SNAPSHOT)
+
+    def maybe_flush(self, force=False):
+        now = time.monotonic()
+        if not force and now - self._last_flush < self.flush_seconds:
+            return
+        self._last_flush = now
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            if self._pid != os.getpid():
+                self._start_process()
+            tmp = f'{self.path}.tmp'
+            with open(tmp, 'w') as f:
+                json.dump(self.registry.snapshot(), f)
+            os.replace(tmp, self.path)
+
+    def _start_process(self):
+        """First flush in this process: keep the totals of an exited worker that had our pid, start the timer."""
+        self._pid = os.getpid()
+        if os.path.exists(self.path):
+            with _directory_lock(self.directory):
+                self._retire(self.path)
+        if self.background:
+            threading.Thread(target=self._flush_periodically, name='metrics-flush', daemon=True).start()
+
+    def _flush_periodically(self):
+        # Keeps an idle worker's snapshot current between requests
+        pid = os.getpid()
+        while os.getpid() == pid:
+            time.sleep(self.flush_seconds)
+            self.maybe_flush(force=True)
+
+    def _retire(self, path):
+        """Fold an exited worker's snapshot into the retired totals and remove it (directory lock held)."""
+        try:
+            with open(path) as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return
+        except ValueError:
+            snapshot = {}
+        retired = _read_snapshot(self.retired_path) or {}
+        tmp = f'{self.retired_path}.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(merge_snapshots([retired, snapshot]), f)
+        os.replace(tmp, self.retired_path)
+        os.remove(path)
+
+    def collect(self):
+        """Merged snapshot of every worker, live or exited, that has written to the metrics directory."""
+        self.maybe_flush(force=True)
+        own, retired = self.path, self.retired_path
+        with _directory_lock(self.directory):
+            for path in glob.glob(os.path.join(self.directory, '*.json')):
+                if path not in (own, retired) and not _pid_alive(path):
+                    self._retire(path)
+            snapshots = [_read_snapshot(path) for path in glob.glob(os.path.join(self.directory, '*.json'))]
+        return merge_snapshots([snap for snap in snapshots if snap is not None])
+
+
+def _read_snapshot(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+@contextmanager
+def _directory_lock(directory):
+    """Serialise retiring and reading snapshots across the workers sharing a metrics directory."""
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(os.path.join(directory, f'{RETIRED_SNAPSHOT}.lock'), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def _pid_alive(path):
+    """Whether the process a ``<pid>.json`` snapshot belongs to is still running (False for other names)."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    if not name.isdigit():
+        return False
+    try:
+        os.kill(int(name), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _track_queries(engine):
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info['query_start'].pop()
+        if g and '_metrics_start' in g:
+            g._sql_count += 1
+            g._sql_time += elapsed
+
+
+class QueryCounter:
+    """Context manager that records every SQL statement executed on the given engines."""
+
+    def __init__(self, *engines):
+        self.engines = [e for e in engines if e is not None]
+        self.statements = []
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        for engine in self.engines:
+            event.listen(engine, 'before_cursor_execute', self._record)
+        return self
+
+    def __exit__(self, *exc):
+        for engine in self.engines:
+            event.remove(engine, 'before_cursor_execute', self._record)
+        return False
+
+
+def init_metrics(app, engines):
+    """Install request hooks on the app and SQL hooks on each engine."""
+    metrics = WorkerMetrics(app.config['METRICS_DIR'], app.config['METRICS_FLUSH_SECONDS'],
+                            background=not app.testing)
+    app.extensions['metrics'] = metrics
+    for engine in engines:
+        if engine is not None:
+            _track_queries(engine)
+
+    @app.before_request
+    def _start_timer():
+        g._metrics_start = time.perf_counter()
+        g._sql_count = 0
+        g._sql_time = 0.0
+
+    @app.after_request
+    def _record(response):
+        start = g.pop('_metrics_start', None)
+        if start is None:
+            return response
+        endpoint = request.endpoint or 'unmatched'
+        registry = metrics.registry
+        registry.inc('http_requests_total', {'endpoint': endpoint, 'method': request.method,
+                                             'status': str(response.status_code)})
+        registry.observe('http_request_duration_seconds', {'endpoint': endpoint},
+                         time.perf_counter() - start, LATENCY_BUCKETS)
+        registry.inc('db_queries_total', {'endpoint': endpoint}, g._sql_count)
+        registry.inc('db_query_duration_seconds_total', {'endpoint': endpoint}, round(g._sql_time, 6))
+        registry.observe('db_queries_per_request', {'endpoint': endpoint}, g._sql_count, QUERY_COUNT_BUCKETS)
+        metrics.maybe_flush()
+        return response
+
+    return metrics
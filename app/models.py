@@ -20,10 +20,10 @@ class User(db.Model):
     password_hash = db.Column(db.String(255), nullable=False)
     role = db.Column(db.String(10), nullable=False, default='user')   # 'user' or 'admin'
     is_active = db.Column(db.Boolean, nullable=False, default=True)
-    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    created_at = db.Column(db.DateTime, server_default=db.func.now(), index=True)
     last_login = db.Column(db.DateTime, nullable=True)
     show_wizard = db.Column(db.Boolean, nullable=False, default=True)  # first-login wizard flag
-    reset_token = db.Column(db.String(100), nullable=True)
+    reset_token = db.Column(db.String(100), nullable=True, index=True)
     reset_token_expiration = db.Column(db.DateTime, nullable=True)
 
     def set_password(self, password):
@@ -55,8 +55,12 @@ class Challenge(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(120), nullable=False)
     description = db.Column(db.Text, nullable=False)
-    solution = db.Column(db.String(255), nullable=False)
+    solution = db.Column(db.String(255), nullable=False)          # parsed into a matcher, see app.cli_matcher
+    forbidden_params = db.Column(db.String(255), nullable=True)   # space-separated options that fail the match
     points = db.Column(db.Integer, default=10)
+    doc_link = db.Column(db.String(255), nullable=True)           # hint links shown for a wrong answer
+    video_link = db.Column(db.String(255), nullable=True)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')  # bumped when the rules change
 
     def __repr__(self):
         return f'<Challenge {self.name}>'
@@ -72,6 +76,9 @@ class Score(db.Model):
     user = db.relationship('User', backref=db.backref('scores', lazy=True, cascade='all, delete-orphan'))
     challenge = db.relationship('Challenge', backref=db.backref('scores', lazy=True))
 
+    # One completion per user and challenge; also serves user_id lookups
+    __table_args__ = (db.Index('uq_score_user_challenge', 'user_id', 'challenge_id', unique=True),)
+
     def __repr__(self):
         return f'<Score User:{self.user_id} Challenge:{self.challenge_id} Score:{self.score}>'
 
@@ -83,7 +90,7 @@ class BackupLog(db.Model):
     file_path = db.Column(db.String(500), nullable=False)
     file_size = db.Column(db.Integer, nullable=True)              # bytes
     validation_status = db.Column(db.String(10), nullable=False, default='pending')  # pass/fail/pending
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     created_by = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='SET NULL'), nullable=True)
     error_message = db.Column(db.Text, nullable=True)
     creator = db.relationship('User', backref=db.backref('backup_logs', lazy=True))
@@ -98,7 +105,7 @@ class AuditLog(db.Model):
     admin_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='RESTRICT'), nullable=False)
     action_type = db.Column(db.String(100), nullable=False)      # e.g. 'DEACTIVATE_USER'
     affected_record = db.Column(db.String(200), nullable=True)   # e.g. 'user:5 (testuser)'
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     admin = db.relationship('User', backref=db.backref('audit_actions', lazy=True))
 
     def __repr__(self):
@@ -123,93 +130,193 @@ class UserBadge(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), nullable=False)
     badge_id = db.Column(db.Integer, db.ForeignKey('badge.id', ondelete='RESTRICT'), nullable=False)
     awarded_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Awaiting the user's next badge digest email (see app.badges.flush_badge_digests); backfilled awards never are
+    email_pending = db.Column(db.Boolean, nullable=False, default=False, server_default=db.false())
     user = db.relationship('User', backref=db.backref('badges', lazy=True))
     badge = db.relationship('Badge', backref=db.backref('recipients', lazy=True))
 
-    __table_args__ = (db.UniqueConstraint('user_id', 'badge_id'),)
+    __table_args__ = (db.UniqueConstraint('user_id', 'badge_id'),
+                      db.Index('ix_user_badge_email_pending', 'email_pending', 'user_id'))
 
     def __repr__(self):
         return f'<UserBadge user:{self.user_id} badge:{self.badge_id}>'
 
 
+class UserStats(db.Model):
+    """Per-user totals maintained alongside Score/UserPathProgress/UserModuleProgress/Certificate/UserBadge writes (see app.stats)."""
+    __tablename__ = 'user_stats'
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), primary_key=True)
+    challenge_points = db.Column(db.Integer, nullable=False, default=0)
+    challenge_count = db.Column(db.Integer, nullable=False, default=0)
+    path_count = db.Column(db.Integer, nullable=False, default=0)         # learning paths enrolled in
+    module_points = db.Column(db.Integer, nullable=False, default=0)
+    certificate_count = db.Column(db.Integer, nullable=False, default=0)
+    badge_count = db.Column(db.Integer, nullable=False, default=0)
+    total_points = db.Column(db.Integer, nullable=False, default=0)   # challenge_points + module_points
+    version = db.Column(db.Integer, nullable=False, default=0, index=True)  # data_version 'user_stats' at last change
+    user = db.relationship('User', backref=db.backref('stats', uselist=False, lazy=True,
+                                                      cascade='all, delete-orphan'))
+
+    def __repr__(self):
+        return f'<UserStats user:{self.user_id} pts:{self.challenge_points}>'
+
+
+class ScoreDaily(db.Model):
+    """Challenge points per user per day - the rollup the weekly/monthly leaderboards read."""
+    __tablename__ = 'score_daily'
+    day = db.Column(db.Date, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), primary_key=True)
+    points = db.Column(db.Integer, nullable=False, default=0)
+    user = db.relationship('User', backref=db.backref('daily_scores', lazy=True,
+                                                      cascade='all, delete-orphan'))
+
+    def __repr__(self):
+        return f'<ScoreDaily {self.day} user:{self.user_id} pts:{self.points}>'
+
+
+class DataVersion(db.Model):
+    """Monotonic change counters shared by every worker (see app.versioning)."""
+    __tablename__ = 'data_version'
+    name = db.Column(db.String(50), primary_key=True)            # e.g. 'user_stats'
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<DataVersion {self.name}={self.version}>'
+
+
+class ContentManifest(db.Model):
+    __tablename__ = 'content_manifest'
+    seed_set = db.Column(db.String(50), primary_key=True)        # e.g. 'challenges'
+    content_hash = db.Column(db.String(64), nullable=False)      # sha256 of the seed data
+    seeded_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<ContentManifest {self.seed_set} {self.content_hash[:8]}>'
+
+
+class OutboxEmail(db.Model):
+    """An email queued in the same transaction as the change that triggered it (see app.outbox)."""
+    __tablename__ = 'email_outbox'
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(30), nullable=False)                 # 'welcome', 'badge', 'password_reset', ...
+    sender = db.Column(db.String(200), nullable=False)              # 'Name <address>'
+    recipient = db.Column(db.String(120), nullable=False)
+    subject = db.Column(db.String(200), nullable=False)
+    body = db.Column(db.Text, nullable=True)
+    html = db.Column(db.Text, nullable=True)
+    attachments = db.Column(db.Text, nullable=True)                # JSON: [[static file, name, type, disposition]]
+    status = db.Column(db.String(10), nullable=False, default='pending')   # pending/sending/sent/dead
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime, nullable=True)
+    claimed_by = db.Column(db.String(80), nullable=True)            # the drain that last claimed it
+    claimed_until = db.Column(db.DateTime, nullable=True)           # after this another drain may take it back
+
+    __table_args__ = (db.Index('ix_email_outbox_due', 'status', 'next_attempt_at', 'id'),)
+
+    def __repr__(self):
+        return f'<OutboxEmail {self.kind} to:{self.recipient} {self.status}>'
+
+
+class Campaign(db.Model):
+    """An admin announcement emailed to every learner in an audience (see app.campaigns)."""
+    __tablename__ = 'email_campaign'
+    id = db.Column(db.Integer, primary_key=True)
+    subject = db.Column(db.String(200), nullable=False)
+    body = db.Column(db.Text, nullable=False)                      # Jinja text; {{ username }} per recipient
+    audience = db.Column(db.String(20), nullable=False, default='active')   # see app.campaigns.AUDIENCES
+    status = db.Column(db.String(10), nullable=False, default='draft')      # draft/queued/sending/done/cancelled
+    last_user_id = db.Column(db.Integer, nullable=False, default=0)         # checkpoint: recipients up to here are done
+    claimed_by = db.Column(db.String(80), nullable=True)                    # sender holding the campaign (host:pid:token)
+    lease_until = db.Column(db.DateTime, nullable=True)                     # another sender may take over after this
+    sent_count = db.Column(db.Integer, nullable=False, default=0)
+    deferred_count = db.Column(db.Integer, nullable=False, default=0)      # handed to the outbox for retry
+    failed_count = db.Column(db.Integer, nullable=False, default=0)
+    created_by = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='SET NULL'), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    creator = db.relationship('User', backref=db.backref('campaigns', lazy=True))
+
+    def __repr__(self):
+        return f'<Campaign {self.id} {self.status} sent:{self.sent_count}>'
+
+
+CHALLENGE_SEED = [
+    {'name': 'Create a VPC', 'description': 'Use the AWS CLI to create a new VPC.',
+     'solution': 'aws ec2 create-vpc', 'points': 10,
+     'doc_link': 'https://docs.aws.amazon.com/cli/latest/reference/ec2/create-vpc.html',
+     'video_link': 'https://www.youtube.com/watch?v=ctwO-CMGkxg'},
+    {'name': 'Create an RDS Instance', 'description': 'Use the AWS CLI to create an RDS instance.',
+     'solution': 'aws rds create-db-instance', 'points': 10,
+     'doc_link': 'https://docs.aws.amazon.com/cli/latest/reference/rds/create-db-instance.html',
+     'video_link': 'https://www.youtube.com/watch?v=QtouOs4tzNk'},
+    {'name': 'Create a Security Group', 'description': 'Use the AWS CLI to create a security group.',
+     'solution': 'aws ec2 create-security-group', 'points': 10,
+     'doc_link': 'https://docs.aws.amazon.com/cli/latest/reference/ec2/create-security-group.html',
+     'video_link': 'https://www.youtube.com/watch?v=gBDK4Pa_BRY'},
+    {'name': 'Create an IAM User', 'description': 'Use the AWS CLI to create a new IAM user.',
+     'solution': 'aws iam create-user --user-name', 'points': 10,
+     'doc_link': 'https://docs.aws.amazon.com/cli/latest/reference/iam/create-user.html',
+     'video_link': 'https://www.youtube.com/watch?v=ZQMpSICUEcw'},
+    {'name': 'Launch an EC2 instance', 'description': 'Use the AWS CLI to launch an EC2 instance.',
+     'solution': 'aws ec2 run-instances', 'forbidden_params': '--dry-run', 'points': 10,
+     'doc_link': 'https://docs.aws.amazon.com/cli/latest/reference/ec2/run-instances.html',
+     'video_link': 'https://www.youtube.com/watch?v=crNyDkR3ulU'},
+    {'name': 'Create an S3 Bucket', 'description': 'Use the AWS CLI to Create an S3 Bucket.',
+     'solution': 'aws s3 mb', 'points': 10,
+     'doc_link': 'https://docs.aws.amazon.com/cli/latest/reference/s3api/create-bucket.html',
+     'video_link': 'https://www.youtube.com/watch?v=RODg8GWKU2Q'},
+]
+# Seed fields kept in sync on existing challenges; a change bumps the challenge's version
+CHALLENGE_SYNCED_FIELDS = ('description', 'solution', 'forbidden_params', 'points', 'doc_link', 'video_link')
+
+BADGE_SEED = [
+    {'name': 'Cloud Warrior', 'description': 'Earned 20 or more points on challenges.',
+     'icon': '🛡️', 'trigger_condition': 'score>=20'},
+    {'name': 'Cloud Sorcerer', 'description': 'Earned 50 or more points on challenges.',
+     'icon': '🌟', 'trigger_condition': 'score>=50'},
+    {'name': 'First Steps', 'description': 'Completed your first challenge.',
+     'icon': '👣', 'trigger_condition': 'challenges>=1'},
+    {'name': 'Path Starter', 'description': 'Enrolled in your first learning path.',
+     'icon': '📚', 'trigger_condition': 'paths>=1'},
+    {'name': 'Certified', 'description': 'Earned your first learning path certificate.',
+     'icon': '🏆', 'trigger_condition': 'certificates>=1'},
+]
+
+
 def initialize_challenges():
-    """Seed challenge data if not already present."""
-    existing = {c.name for c in Challenge.query.all()}
-    challenges = [
-        Challenge(name='Create a VPC', description='Use the AWS CLI to create a new VPC.',
-                  solution='aws ec2 create-vpc', points=10),
-        Challenge(name='Create an RDS Instance', description='Use the AWS CLI to create an RDS instance.',
-                  solution='aws rds create-db-instance', points=10),
-        Challenge(name='Create a Security Group', description='Use the AWS CLI to create a security group.',
-                  solution='aws ec2 create-security-group', points=10),
-        Challenge(name='Create an IAM User', description='Use the AWS CLI to create a new IAM user.',
-                  solution='aws iam create-user --user-name', points=10),
-        Challenge(name='Launch an EC2 instance', description='Use the AWS CLI to launch an EC2 instance.',
-                  solution='aws ec2 run-instances', points=10),
-        Challenge(name='Create an S3 Bucket', description='Use the AWS CLI to Create an S3 Bucket.',
-                  solution='aws s3 mb', points=10),
-    ]
-    new = [c for c in challenges if c.name not in existing]
-    if new:
+    """Seed challenge data if not already present; existing challenges pick up changed rules and hints."""
+    from app.versioning import CHALLENGES, bump_version
+    existing = {c.name: c for c in Challenge.query.all()}
+    new, changed = [], 0
+    for seed in CHALLENGE_SEED:
+        challenge = existing.get(seed['name'])
+        if challenge is None:
+            new.append(Challenge(**seed))
+            continue
+        updates = {f: seed.get(f) for f in CHALLENGE_SYNCED_FIELDS if getattr(challenge, f) != seed.get(f)}
+        if updates:
+            for field, value in updates.items():
+                setattr(challenge, field, value)
+            challenge.version += 1      # cached matchers for it are rebuilt
+            changed += 1
+    if new or changed:
         db.session.add_all(new)
+        bump_version(CHALLENGES)        # every worker's challenge catalogue reloads
         db.session.commit()
-        print(f"Seeded {len(new)} challenges.")
+        print(f"Seeded {len(new)} challenges, updated {changed}.")
 
 
 def initialize_badges():
     """Seed badge definitions if not already present."""
     existing = {b.name for b in Badge.query.all()}
-    badges = [
-        Badge(name='Cloud Warrior', description='Earned 20 or more points on challenges.',
-              icon='🛡️', trigger_condition='score>=20'),
-        Badge(name='Cloud Sorcerer', description='Earned 50 or more points on challenges.',
-              icon='🌟', trigger_condition='score>=50'),
-        Badge(name='First Steps', description='Completed your first challenge.',
-              icon='👣', trigger_condition='challenges>=1'),
-        Badge(name='Path Starter', description='Enrolled in your first learning path.',
-              icon='📚', trigger_condition='paths>=1'),
-        Badge(name='Certified', description='Earned your first learning path certificate.',
-              icon='🏆', trigger_condition='certificates>=1'),
-    ]
-    new = [b for b in badges if b.name not in existing]
+    new = [Badge(**b) for b in BADGE_SEED if b['name'] not in existing]
     if new:
         db.session.add_all(new)
         db.session.commit()
         print(f"Seeded {len(new)} badges.")
-
-
-def check_and_award_badges(user_id):
-    """Check badge triggers for a user and award any newly earned badges."""
-    from sqlalchemy import func as sqlfunc
-    user = User.query.get(user_id)
-    if not user:
-        return
-    total_score = db.session.query(sqlfunc.sum(Score.score)).filter_by(user_id=user_id).scalar() or 0
-    newly_awarded = []
-    challenge_count = Score.query.filter_by(user_id=user_id).count()
-    # Award score-based badges
-    score_badges = [(20, 'Cloud Warrior'), (50, 'Cloud Sorcerer')]
-    for threshold, badge_name in score_badges:
-        if total_score >= threshold:
-            badge = Badge.query.filter_by(name=badge_name).first()
-            if badge:
-                existing = UserBadge.query.filter_by(user_id=user_id, badge_id=badge.id).first()
-                if not existing:
-                    db.session.add(UserBadge(user_id=user_id, badge_id=badge.id))
-                    newly_awarded.append(badge)
-    if challenge_count >= 1:
-        badge = Badge.query.filter_by(name='First Steps').first()
-        if badge:
-            existing = UserBadge.query.filter_by(user_id=user_id, badge_id=badge.id).first()
-            if not existing:
-                db.session.add(UserBadge(user_id=user_id, badge_id=badge.id))
-                newly_awarded.append(badge)
-    db.session.commit()
-    # Send badge notification emails
-    if user.email:
-        try:
-            from app.email_utils import send_badge_email
-            for badge in newly_awarded:
-                send_badge_email(user, badge)
-        except Exception as e:
-            print(f"[Badge email] Error: {e}")
+    from app.badges import invalidate_badge_rules
+    invalidate_badge_rules()
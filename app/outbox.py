@@ -0,0 +1,162 @@
+"""
+Transactional email outbox.
+
+Request handlers never talk to SMTP. ``enqueue_email`` adds an email_outbox
+row to the caller's session, so the email exists exactly when the change that
+triggered it commits. ``drain_outbox`` runs on the scheduler leader every
+OUTBOX_POLL_SECONDS: it opens one ``mail.connect()`` connection and sends
+every due row through it, batch by batch, committing after each batch. Each
+batch is claimed first with a conditional UPDATE (status 'sending', plus who
+claimed it and until when), so a concurrent `flask send-outbox` or an
+overlapping leader never sends the same row twice; claims are released when a
+drain stops early, and expire after OUTBOX_CLAIM_SECONDS if it dies.
+Transient failures are retried with exponential backoff; permanent (5xx)
+rejections and rows that exhaust OUTBOX_MAX_ATTEMPTS are dead-lettered with
+their last error. `flask send-outbox` drains once by hand.
+"""
+import json
+import os
+import smtplib
+import socket
+import uuid
+from datetime import datetime, timedelta
+from email.utils import formataddr
+from functools import lru_cache
+
+from flask import current_app
+from flask_mail import Message
+
+from app import db, mail
+from app.models import OutboxEmail
+
+STATIC_DIR = os.path.join(os.path.dirname(__file__), 'static')
+
+# The connection itself is gone: stop this drain and let the next one reconnect
+CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+def permanent_failure(error):
+    """True for SMTP rejections that retrying will not fix (5xx replies, refused recipients)."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return True
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500
+
+
+def sender_id():
+    """A name for this sender, unique per call: host, pid and a random suffix."""
+    return f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+
+
+def enqueue_email(kind, recipient, subject, sender, body=None, html=None, attachments=()):
+    """Queue an email in the current transaction; the caller commits.
+
+    ``sender`` is a (name, address) pair; ``attachments`` are (static file, name, content type,
+    disposition) tuples, read from app/static when the email is sent.
+    """
+    row = OutboxEmail(kind=kind, recipient=recipient, subject=subject, sender=formataddr(sender),
+                      body=body, html=html, attachments=json.dumps(list(attachments)) if attachments else None)
+    db.session.add(row)
+    return row
+
+
+@lru_cache(maxsize=32)
+def _static_bytes(static_file):
+    """Attachment bytes from app/static, read from disk once per process (None if the file is missing)."""
+    path = os.path.join(STATIC_DIR, static_file)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _build_message(row):
+    msg = Message(subject=row.subject, sender=row.sender, recipients=[row.recipient], body=row.body, html=row.html)
+    for static_file, name, content_type, disposition in json.loads(row.attachments or '[]'):
+        data = _static_bytes(static_file)
+        if data is not None:
+            msg.attach(name, content_type, data, disposition)
+    return msg
+
+
+def _claim(owner, limit):
+    """Claim up to `limit` due rows for `owner` and return them; rows another drain took first are skipped."""
+    now = datetime.utcnow()
+    table = OutboxEmail.__table__
+    due = (db.session.query(OutboxEmail.id)
+           .filter(OutboxEmail.status == 'pending', OutboxEmail.next_attempt_at <= now)
+           .order_by(OutboxEmail.next_attempt_at, OutboxEmail.id)
+           .limit(limit))
+    ids = [row_id for (row_id,) in due]
+    if not ids:
+        return []
+    until = now + timedelta(seconds=current_app.config['OUTBOX_CLAIM_SECONDS'])
+    db.session.execute(table.update().where(table.c.id.in_(ids), table.c.status == 'pending')
+                       .values(status='sending', claimed_by=owner, claimed_until=until))
+    db.session.commit()
+    return (OutboxEmail.query.filter(OutboxEmail.claimed_by == owner, OutboxEmail.status == 'sending')
+            .order_by(OutboxEmail.id).all())
+
+
+def _release(owner=None):
+    """Return claimed rows to 'pending': this drain's (owner), or every claim that has expired."""
+    table = OutboxEmail.__table__
+    claimed = (table.c.claimed_by == owner if owner is not None
+               else table.c.claimed_until < datetime.utcnow())
+    db.session.execute(table.update().where(table.c.status == 'sending', claimed)
+                       .values(status='pending', claimed_by=None, claimed_until=None))
+    db.session.commit()
+
+
+def _fail(row, error, permanent=False):
+    config = current_app.config
+    row.attempts += 1
+    row.last_error = str(error)[:1000]
+    row.claimed_until = None
+    if permanent or row.attempts >= config['OUTBOX_MAX_ATTEMPTS']:
+        row.status = 'dead'
+        print(f"[Outbox] Dead-lettered email {row.id} ({row.kind}) after {row.attempts} attempts: {row.last_error}")
+    else:
+        row.status, row.claimed_by = 'pending', None
+        delay = config['OUTBOX_BACKOFF_SECONDS'] * 2 ** (row.attempts - 1)
+        row.next_attempt_at = datetime.utcnow() + timedelta(seconds=delay)
+
+
+def drain_outbox(batch_size=None):
+    """Send every due email over one SMTP connection; return {'sent': n, 'failed': n}."""
+    batch_size = batch_size or current_app.config['OUTBOX_BATCH_SIZE']
+    counts = {'sent': 0, 'failed': 0}
+    owner = sender_id()
+    _release()      # rows claimed by a drain that died
+    batch = _claim(owner, batch_size)
+    if not batch:
+        return counts
+    try:
+        with mail.connect() as conn:
+            while batch:
+                for row in batch:
+                    try:
+                        conn.send(_build_message(row))
+                    except CONNECTION_ERRORS as e:
+                        _fail(row, e)
+                        counts['failed'] += 1
+                        db.session.commit()
+                        _release(owner)
+                        print(f"[Outbox] Connection lost, stopping this run: {e}")
+                        return counts
+                    except Exception as e:
+                        _fail(row, e, permanent=permanent_failure(e))
+                        counts['failed'] += 1
+                    else:
+                        row.status = 'sent'
+                        row.sent_at = datetime.utcnow()
+                        row.attempts += 1
+                        row.claimed_until = None
+                        counts['sent'] += 1
+                db.session.commit()
+                batch = _claim(owner, batch_size)
+    except Exception as e:
+        # Could not connect (or close) - unsent rows go back to pending and the next run tries again
+        db.session.rollback()
+        _release(owner)
+        print(f"[Outbox] SMTP connection failed: {e}")
+    return counts
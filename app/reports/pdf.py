@@ -0,0 +1,79 @@
+"""
+ReportLab rendering for the admin PDF reports.
+
+Kept apart from the blueprint so reportlab is only imported the first time a
+report is downloaded, not when a worker boots.
+"""
+import io
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import cm
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+
+from app.models import now_sast
+
+# Brand colours
+AWS_ORANGE = colors.HexColor('#FF9900')
+AWS_DARK   = colors.HexColor('#232F3E')
+BLUE       = colors.HexColor('#1A4E8C')
+LIGHT_BLUE = colors.HexColor('#EBF3FA')
+
+
+def _doc_header(elements, title):
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle('Title', parent=styles['Title'],
+                                 fontSize=18, textColor=AWS_DARK,
+                                 spaceAfter=6)
+    sub_style = ParagraphStyle('Sub', parent=styles['Normal'],
+                               fontSize=10, textColor=colors.gray,
+                               spaceAfter=20)
+    elements.append(Paragraph('AWS Community Labs - awslearningplatform.click', sub_style))
+    elements.append(Paragraph(title, title_style))
+    elements.append(Paragraph(f'Generated: {now_sast().strftime("%Y-%m-%d %H:%M")} UTC', sub_style))
+    elements.append(Spacer(1, 0.4 * cm))
+
+
+def _table_style(header_rows=1):
+    return TableStyle([
+        ('BACKGROUND',   (0, 0), (-1, header_rows - 1), AWS_DARK),
+        ('TEXTCOLOR',    (0, 0), (-1, header_rows - 1), colors.white),
+        ('FONTNAME',     (0, 0), (-1, header_rows - 1), 'Helvetica-Bold'),
+        ('FONTSIZE',     (0, 0), (-1, -1), 9),
+        ('ROWBACKGROUNDS', (0, header_rows), (-1, -1), [colors.white, LIGHT_BLUE]),
+        ('GRID',         (0, 0), (-1, -1), 0.5, colors.lightgrey),
+        ('ALIGN',        (0, 0), (-1, -1), 'LEFT'),
+        ('VALIGN',       (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING',   (0, 0), (-1, -1), 4),
+        ('BOTTOMPADDING',(0, 0), (-1, -1), 4),
+        ('LEFTPADDING',  (0, 0), (-1, -1), 6),
+    ])
+
+
+def build_table_report(title, data, col_widths_cm, summary, highlight_cells=None):
+    """Render a landscape A4 report with one table and return it as a BytesIO.
+
+    highlight_cells maps (col, row) -> hex colour for bold white-on-colour cells.
+    """
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=landscape(A4),
+                            rightMargin=2*cm, leftMargin=2*cm,
+                            topMargin=2*cm, bottomMargin=2*cm)
+    elements = []
+    _doc_header(elements, title)
+
+    t = Table(data, colWidths=[w * cm for w in col_widths_cm], repeatRows=1)
+    style = _table_style()
+    for (col, row), hex_colour in (highlight_cells or {}).items():
+        style.add('BACKGROUND', (col, row), (col, row), colors.HexColor(hex_colour))
+        style.add('TEXTCOLOR', (col, row), (col, row), colors.white)
+        style.add('FONTNAME', (col, row), (col, row), 'Helvetica-Bold')
+    t.setStyle(style)
+    elements.append(t)
+    elements.append(Spacer(1, 0.5*cm))
+    elements.append(Paragraph(summary, getSampleStyleSheet()['Normal']))
+
+    doc.build(elements)
+    buffer.seek(0)
+    return buffer
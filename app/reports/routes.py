@@ -1,56 +1,20 @@
-import io
-from datetime import datetime
 from flask import Blueprint, render_template, send_file, request, session
-from sqlalchemy import func
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import cm
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.enums import TA_CENTER
+from sqlalchemy.orm import joinedload
 
 from app import db
 from app.models import now_sast
-from app.models import User, Score, BackupLog, AuditLog
+from app.models import User, BackupLog, AuditLog
 from app.decorators import admin_required
+from app.database import read_only_blueprint
 
-reports = Blueprint('reports', __name__, url_prefix='/reports')
-
-# Brand colours
-AWS_ORANGE = colors.HexColor('#FF9900')
-AWS_DARK   = colors.HexColor('#232F3E')
-BLUE       = colors.HexColor('#1A4E8C')
-LIGHT_BLUE = colors.HexColor('#EBF3FA')
-
-
-def _doc_header(elements, title):
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle('Title', parent=styles['Title'],
-                                 fontSize=18, textColor=AWS_DARK,
-                                 spaceAfter=6)
-    sub_style = ParagraphStyle('Sub', parent=styles['Normal'],
-                               fontSize=10, textColor=colors.gray,
-                               spaceAfter=20)
-    elements.append(Paragraph('AWS Community Labs - awslearningplatform.click', sub_style))
-    elements.append(Paragraph(title, title_style))
-    elements.append(Paragraph(f'Generated: {now_sast().strftime("%Y-%m-%d %H:%M")} UTC', sub_style))
-    elements.append(Spacer(1, 0.4 * cm))
-
-
-def _table_style(header_rows=1):
-    return TableStyle([
-        ('BACKGROUND',   (0, 0), (-1, header_rows - 1), AWS_DARK),
-        ('TEXTCOLOR',    (0, 0), (-1, header_rows - 1), colors.white),
-        ('FONTNAME',     (0, 0), (-1, header_rows - 1), 'Helvetica-Bold'),
-        ('FONTSIZE',     (0, 0), (-1, -1), 9),
-        ('ROWBACKGROUNDS', (0, header_rows), (-1, -1), [colors.white, LIGHT_BLUE]),
-        ('GRID',         (0, 0), (-1, -1), 0.5, colors.lightgrey),
-        ('ALIGN',        (0, 0), (-1, -1), 'LEFT'),
-        ('VALIGN',       (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING',   (0, 0), (-1, -1), 4),
-        ('BOTTOMPADDING',(0, 0), (-1, -1), 4),
-        ('LEFTPADDING',  (0, 0), (-1, -1), 6),
-    ])
+# Reports only read - every view runs on the read-only engine
+reports = read_only_blueprint(Blueprint('reports', __name__, url_prefix='/reports'))
+
+
+def _send_pdf(buffer, prefix):
+    return send_file(buffer, as_attachment=True,
+                     download_name=f'{prefix}_{now_sast().strftime("%Y%m%d")}.pdf',
+                     mimetype='application/pdf')
 
 
 # ── Reports Panel ─────────────────────────────────────────────────────────────
@@ -65,16 +29,10 @@ def panel():
 @reports.route('/users')
 @admin_required
 def user_registration_report():
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=landscape(A4),
-                            rightMargin=2*cm, leftMargin=2*cm,
-                            topMargin=2*cm, bottomMargin=2*cm)
-    elements = []
-    _doc_header(elements, 'User Registration Report')
+    from app.reports.pdf import build_table_report
 
-    users = User.query.order_by(User.created_at.desc()).all()
-    user_scores = {u.id: db.session.query(func.sum(Score.score)).filter_by(user_id=u.id).scalar() or 0
-                   for u in users}
+    users = User.query.options(joinedload(User.stats)).order_by(User.created_at.desc()).all()
+    user_scores = {u.id: u.stats.challenge_points if u.stats else 0 for u in users}
 
     data = [['#', 'Username', 'Email', 'Role', 'Status', 'Points', 'Registered', 'Last Login']]
     for i, u in enumerate(users, 1):
@@ -89,35 +47,23 @@ def user_registration_report():
             u.last_login.strftime('%Y-%m-%d %H:%M') if u.last_login else 'Never',
         ])
 
-    col_widths = [1*cm, 3.5*cm, 5*cm, 2*cm, 2.2*cm, 2*cm, 3*cm, 4*cm]
-    t = Table(data, colWidths=col_widths, repeatRows=1)
-    t.setStyle(_table_style())
-    elements.append(t)
-    elements.append(Spacer(1, 0.5*cm))
-    elements.append(Paragraph(f'Total users: {len(users)}', getSampleStyleSheet()['Normal']))
-
-    doc.build(elements)
-    buffer.seek(0)
-    return send_file(buffer, as_attachment=True,
-                     download_name=f'user_report_{now_sast().strftime("%Y%m%d")}.pdf',
-                     mimetype='application/pdf')
+    buffer = build_table_report('User Registration Report', data,
+                                [1, 3.5, 5, 2, 2.2, 2, 3, 4],
+                                f'Total users: {len(users)}')
+    return _send_pdf(buffer, 'user_report')
 
 
 # ── Report 2: System Activity ──────────────────────────────────────────────────
 @reports.route('/activity')
 @admin_required
 def system_activity_report():
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=landscape(A4),
-                            rightMargin=2*cm, leftMargin=2*cm,
-                            topMargin=2*cm, bottomMargin=2*cm)
-    elements = []
-    _doc_header(elements, 'System Activity Report')
-
-    logs = AuditLog.query.order_by(AuditLog.timestamp.desc()).limit(500).all()
+    from app.reports.pdf import build_table_report
+
+    logs = AuditLog.query.options(joinedload(AuditLog.admin))\
+        .order_by(AuditLog.timestamp.desc()).limit(500).all()
     data = [['#', 'Admin', 'Action', 'Affected Record', 'Timestamp (UTC)']]
     for i, log in enumerate(logs, 1):
-        admin = User.query.get(log.admin_id)
+        admin = log.admin
         data.append([
             str(i),
             admin.username if admin else f'ID:{log.admin_id}',
@@ -126,35 +72,23 @@ def system_activity_report():
             log.timestamp.strftime('%Y-%m-%d %H:%M:%S') if log.timestamp else '-',
         ])
 
-    col_widths = [1*cm, 3*cm, 4*cm, 7*cm, 4.5*cm]
-    t = Table(data, colWidths=col_widths, repeatRows=1)
-    t.setStyle(_table_style())
-    elements.append(t)
-    elements.append(Spacer(1, 0.5*cm))
-    elements.append(Paragraph(f'Total entries: {len(logs)}', getSampleStyleSheet()['Normal']))
-
-    doc.build(elements)
-    buffer.seek(0)
-    return send_file(buffer, as_attachment=True,
-                     download_name=f'activity_report_{now_sast().strftime("%Y%m%d")}.pdf',
-                     mimetype='application/pdf')
+    buffer = build_table_report('System Activity Report', data,
+                                [1, 3, 4, 7, 4.5],
+                                f'Total entries: {len(logs)}')
+    return _send_pdf(buffer, 'activity_report')
 
 
 # ── Report 3: Backup Integrity ────────────────────────────────────────────────
 @reports.route('/backups')
 @admin_required
 def backup_integrity_report():
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=landscape(A4),
-                            rightMargin=2*cm, leftMargin=2*cm,
-                            topMargin=2*cm, bottomMargin=2*cm)
-    elements = []
-    _doc_header(elements, 'Backup Integrity Report')
-
-    backups = BackupLog.query.order_by(BackupLog.created_at.desc()).all()
+    from app.reports.pdf import build_table_report
+
+    backups = BackupLog.query.options(joinedload(BackupLog.creator))\
+        .order_by(BackupLog.created_at.desc()).all()
     data = [['#', 'Type', 'Status', 'Size (KB)', 'Created By', 'Timestamp (UTC)', 'Notes']]
     for i, b in enumerate(backups, 1):
-        creator = User.query.get(b.created_by) if b.created_by else None
+        creator = b.creator
         data.append([
             str(i),
             b.backup_type.upper(),
@@ -166,24 +100,12 @@ def backup_integrity_report():
             else (b.error_message or '-'),
         ])
 
-    col_widths = [1*cm, 3*cm, 2.5*cm, 2.5*cm, 3*cm, 4.5*cm, 5.5*cm]
-    t = Table(data, colWidths=col_widths, repeatRows=1)
-    style = _table_style()
     # Colour pass/fail cells
-    for row_idx, b in enumerate(backups, 1):
-        cell_color = colors.HexColor('#2E7D32') if b.validation_status == 'pass' else colors.HexColor('#C62828')
-        style.add('BACKGROUND', (2, row_idx), (2, row_idx), cell_color)
-        style.add('TEXTCOLOR', (2, row_idx), (2, row_idx), colors.white)
-        style.add('FONTNAME', (2, row_idx), (2, row_idx), 'Helvetica-Bold')
-    t.setStyle(style)
-    elements.append(t)
-    elements.append(Spacer(1, 0.5*cm))
+    status_cells = {(2, row_idx): '#2E7D32' if b.validation_status == 'pass' else '#C62828'
+                    for row_idx, b in enumerate(backups, 1)}
     passed = sum(1 for b in backups if b.validation_status == 'pass')
-    elements.append(Paragraph(f'Total: {len(backups)} | Passed: {passed} | Failed: {len(backups)-passed}',
-                               getSampleStyleSheet()['Normal']))
-
-    doc.build(elements)
-    buffer.seek(0)
-    return send_file(buffer, as_attachment=True,
-                     download_name=f'backup_report_{now_sast().strftime("%Y%m%d")}.pdf',
-                     mimetype='application/pdf')
+    buffer = build_table_report('Backup Integrity Report', data,
+                                [1, 3, 2.5, 2.5, 3, 4.5, 5.5],
+                                f'Total: {len(backups)} | Passed: {passed} | Failed: {len(backups)-passed}',
+                                highlight_cells=status_cells)
+    return _send_pdf(buffer, 'backup_report')
@@ -1,39 +1,40 @@
 import os
 import json
 import secrets
-import requests
-try:
-    import boto3
-except ImportError:
-    boto3 = None
-from datetime import datetime
 from flask import Blueprint, render_template, request, jsonify, redirect, url_for, session, flash
-from flask_mail import Message
-from sqlalchemy import func
 from werkzeug.security import generate_password_hash
 
-from app import db, mail
+from app import db
 from app.models import now_sast
-from app.models import User, Challenge, Score, check_and_award_badges
+from app.models import User, Score
+from app.badges import check_and_award_badges
+from app.events import ChallengeCompleted, publish
+from app.catalogue import get_catalogue
+from app.cli_matcher import match_command
 from app.validation import validate_username, validate_email, validate_password, sanitise_cli_input
-from app.email_utils import send_welcome_email
+from app.email_utils import queue_password_reset_email, queue_welcome_email
 from app.decorators import login_required
+from app.database import read_only
+from app.stats import get_stats, record_challenge_completion
+from app.leaderboard import BOARDS, DEFAULT_BOARD, get_leaderboard
+from app.http_cache import conditional, scores_version, user_version
 
 main = Blueprint('main', __name__)
 
+LEADERBOARD_PAGE_SIZE = 50
+
 
 # ─── HOME ──────────────────────────────────────────────────────────────────────
 @main.route('/')
 @login_required
 def index():
     user = User.query.get(session['user_id'])
-    total_score = db.session.query(func.sum(Score.score)).filter_by(user_id=user.id).scalar() or 0
-    completed_challenges = Score.query.filter_by(user_id=user.id).count()
+    stats = get_stats(user.id)
     show_wizard = user.show_wizard
     return render_template('landing_page.html',
                            user=user,
-                           total_score=total_score,
-                           completed_challenges=completed_challenges,
+                           total_score=stats.challenge_points,
+                           completed_challenges=stats.challenge_count,
                            show_wizard=show_wizard)
 
 
@@ -110,19 +111,17 @@ def signup():
                                    message='❌ Email already registered. Use the Forgot Password link to recover your account.',
                                    show_forgot_password=True)
 
-        new_user = User(username=username, email=email, show_wizard=True)
+        new_user = User(username=username, email=email, show_wizard=True, last_login=now_sast())
         new_user.set_password(password)
         db.session.add(new_user)
         try:
+            # The welcome email commits with the account and is sent by the outbox, off the request
+            if new_user.email:
+                queue_welcome_email(new_user)
             db.session.commit()
             session['user_id'] = new_user.id
             session['role'] = 'user'
             session.permanent = True
-            new_user.last_login = now_sast()
-            db.session.commit()
-            # Send welcome email - non-blocking, does not affect registration on failure
-            if new_user.email:
-                send_welcome_email(new_user)
             return redirect(url_for('main.index'))
         except Exception as e:
             db.session.rollback()
@@ -147,24 +146,8 @@ def forgot_password():
         if user:
             reset_token = secrets.token_urlsafe(32)
             user.set_reset_token(reset_token)
+            queue_password_reset_email(user, url_for('main.reset_password', token=reset_token, _external=True))
             db.session.commit()
-            reset_link = url_for('main.reset_password', token=reset_token, _external=True)
-            msg = Message(
-                subject='Password Reset - AWS Community Labs',
-                sender=('AWS Community Labs', 'no-reply@awslearningplatform.click'),
-                recipients=[user.email]
-            )
-            msg.html = f"""
-            <p>Hello {user.username},</p>
-            <p>You requested a password reset for your AWS Community Labs account.</p>
-            <p><a href="{reset_link}">Click here to reset your password</a></p>
-            <p>This link expires in 1 hour. If you did not request this, ignore this email.</p>
-            <p>- AWS Community Labs</p>
-            """
-            try:
-                mail.send(msg)
-            except Exception as e:
-                print(f"Reset email error: {e}")
         return render_template('forgot_password.html',
                                message='If an account with that email exists, reset instructions have been sent.')
     return render_template('forgot_password.html')
@@ -198,9 +181,8 @@ def reset_password(token):
 @login_required
 def challenges():
     user = User.query.get(session['user_id'])
-    all_challenges = Challenge.query.all()
     completed = {s.challenge_id for s in Score.query.filter_by(user_id=user.id).all()}
-    return render_template('challenges.html', challenges=all_challenges,
+    return render_template('challenges.html', challenges=get_catalogue().challenges,
                            completed=completed, user=user)
 
 
@@ -218,45 +200,27 @@ def validate_command():
             challenge_id = int(challenge_id)
         except ValueError:
             return jsonify({'message': '❌ Invalid challenge ID.'}), 400
-        challenge = Challenge.query.get(challenge_id)
+        challenge = get_catalogue().get(challenge_id)
         if not challenge:
             return jsonify({'message': '❌ Challenge not found.'}), 404
-        if command.lower().startswith(challenge.solution.strip().lower()):
-            existing = Score.query.filter_by(user_id=user_id, challenge_id=challenge.id).first()
-            if not existing:
-                score = Score(user_id=user_id, challenge_id=challenge.id,
-                              score=challenge.points, completed_at=datetime.now())
-                db.session.add(score)
-                db.session.commit()
-                check_and_award_badges(user_id)
-                total = db.session.query(func.sum(Score.score)).filter_by(user_id=user_id).scalar() or 0
-                return jsonify({'message': f"✅ Correct! '{challenge.name}' completed! +{challenge.points} pts",
-                                'total_score': total})
-            else:
+        result = match_command(challenge, command)
+        if result.ok:
+            # Score, stats and badges go in one transaction; side effects are published once it commits
+            stats = record_challenge_completion(user_id, challenge)
+            if stats is None:
+                db.session.rollback()
                 return jsonify({'message': 'ℹ️ You have already completed this challenge.'})
+            events = [ChallengeCompleted(user_id, challenge_id, challenge.points or 0),
+                      *check_and_award_badges(user_id, stats)]
+            message = f"✅ Correct! '{challenge.name}' completed! +{challenge.points} pts"
+            db.session.commit()
+            publish(*events)
+            return jsonify({'message': message, 'total_score': stats.challenge_points})
         else:
-            links = {
-                'Create a VPC': 'https://docs.aws.amazon.com/cli/latest/reference/ec2/create-vpc.html',
-                'Create an S3 Bucket': 'https://docs.aws.amazon.com/cli/latest/reference/s3api/create-bucket.html',
-                'Create an RDS Instance': 'https://docs.aws.amazon.com/cli/latest/reference/rds/create-db-instance.html',
-                'Create a Security Group': 'https://docs.aws.amazon.com/cli/latest/reference/ec2/create-security-group.html',
-                'Create an IAM User': 'https://docs.aws.amazon.com/cli/latest/reference/iam/create-user.html',
-                'Launch an EC2 instance': 'https://docs.aws.amazon.com/cli/latest/reference/ec2/run-instances.html',
-            }
-            videos = {
-                'Create a VPC': 'https://www.youtube.com/watch?v=ctwO-CMGkxg',
-                'Create an S3 Bucket': 'https://www.youtube.com/watch?v=RODg8GWKU2Q',
-                'Create an RDS Instance': 'https://www.youtube.com/watch?v=QtouOs4tzNk',
-                'Create a Security Group': 'https://www.youtube.com/watch?v=gBDK4Pa_BRY',
-                'Create an IAM User': 'https://www.youtube.com/watch?v=ZQMpSICUEcw',
-                'Launch an EC2 instance': 'https://www.youtube.com/watch?v=crNyDkR3ulU',
-            }
-            doc_link = links.get(challenge.name, 'https://aws.amazon.com/cli/')
-            vid_link = videos.get(challenge.name)
-            msg = f"❌ Incorrect command for '{challenge.name}'.\n📖 Docs: {doc_link}"
-            if vid_link:
-                msg += f"\n🎥 Video: {vid_link}"
-            return jsonify({'message': msg})
+            msg = f"❌ Incorrect command for '{challenge.name}'."
+            if result.problem:
+                msg += f" {result.problem}"
+            return jsonify({'message': msg + challenge.hint})
     except Exception as e:
         return jsonify({'message': f'❌ An error occurred: {str(e)}'}), 500
 
@@ -277,32 +241,67 @@ def labs2():
 
 
 @main.route('/leaderboard')
+@read_only
 @login_required
+@conditional(scores_version)
 def leaderboard():
     user = User.query.get(session['user_id'])
-    data = db.session.query(
-        User.username,
-        func.sum(Score.score).label('total_score')
-    ).join(Score, User.id == Score.user_id)\
-     .group_by(User.username)\
-     .order_by(func.sum(Score.score).desc())\
-     .limit(10).all()
-    ranked = list(enumerate(data, 1))
-    return render_template('leaderboard.html', leaderboard=ranked, user=user)
+    board_name = _board_name()
+    board = get_leaderboard(board_name)
+    ranked = board.top(10)
+    my_rank = board.rank(user.id)
+    # Learners outside the top 10 also see where they sit and who is just above and below them
+    neighbours = board.around(user.id) if my_rank and my_rank > 10 else []
+    return render_template('leaderboard.html', leaderboard=ranked, user=user, board=board_name,
+                           my_rank=my_rank, ranked_count=len(board), neighbours=neighbours)
+
+
+@main.route('/leaderboard/full')
+@read_only
+@login_required
+@conditional(scores_version)
+def leaderboard_full():
+    """Whole ranking, LEADERBOARD_PAGE_SIZE rows at a time, paged by a (total, user_id) cursor."""
+    user = User.query.get(session['user_id'])
+    board_name = _board_name()
+    board = get_leaderboard(board_name)
+    page_size = LEADERBOARD_PAGE_SIZE
+    entries = board.page(_parse_cursor(request.args.get('after')), page_size)
+    next_cursor = f'{entries[-1].total}.{entries[-1].user_id}' if len(entries) == page_size else None
+    return render_template('leaderboard.html', leaderboard=entries,
+                           user=user, board=board_name, full=True, next_cursor=next_cursor,
+                           my_rank=board.rank(user.id), ranked_count=len(board), neighbours=[])
+
+
+def _board_name():
+    name = request.args.get('board', DEFAULT_BOARD)
+    return name if name in BOARDS else DEFAULT_BOARD
+
+
+def _parse_cursor(raw):
+    """'<total>.<user_id>' -> (total, user_id); anything malformed starts from the top."""
+    try:
+        total, user_id = raw.split('.')
+        return int(total), int(user_id)
+    except (AttributeError, ValueError):
+        return None
 
 
 @main.route('/user_info')
 @login_required
+@conditional(user_version)
 def user_info():
     user = User.query.get(session['user_id'])
-    total = db.session.query(func.sum(Score.score)).filter_by(user_id=user.id).scalar() or 0
-    return jsonify({'username': user.username, 'total_score': total})
+    return jsonify({'username': user.username, 'total_score': get_stats(user.id).challenge_points})
 
 
 @main.route('/start-lab-session')
 @login_required
 def start_lab_session():
     try:
+        # boto3 and requests are only needed here - imported on first use to keep worker boot light
+        import boto3
+        import requests
         aws_session = boto3.Session()
         sts = aws_session.client('sts')
         response = sts.assume_role(
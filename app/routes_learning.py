@@ -10,7 +10,13 @@ from app.models_learning import (
     UserPathProgress, UserModuleProgress, Certificate
 )
 from app.decorators import login_required
+from app.database import read_only
+from app.stats import bump_stats, get_stats
+from app.badges import check_and_award_badges
+from app.events import Enrolled, ModuleCompleted, PathCompleted, publish
+from app.http_cache import conditional, user_version
 from sqlalchemy import func
+from sqlalchemy.orm import joinedload, selectinload
 
 learning = Blueprint('learning', __name__)
 
@@ -21,10 +27,11 @@ def _current_user():
 
 # ── Catalogue ─────────────────────────────────────────────────────────────────
 @learning.route('/learning-paths')
+@read_only
 @login_required
 def catalogue():
     user = _current_user()
-    paths = LearningPath.query.all()
+    paths = LearningPath.query.options(selectinload(LearningPath.modules)).all()
     enrolled = {p.path_id: p for p in UserPathProgress.query.filter_by(user_id=user.id).all()}
     return render_template('learning_paths/catalogue.html', paths=paths, enrolled=enrolled, user=user)
 
@@ -54,11 +61,18 @@ def enrol(slug):
     user = _current_user()
     path = LearningPath.query.filter_by(slug=slug).first_or_404()
     if not UserPathProgress.query.filter_by(user_id=user.id, path_id=path.id).first():
-        db.session.add(UserPathProgress(user_id=user.id, path_id=path.id))
-        db.session.commit()
+        _enrol(user.id, path.id)
     return jsonify({'success': True})
 
 
+def _enrol(user_id, path_id):
+    """Create the user's progress row for a path, count it and award any badge it earns, in one commit."""
+    db.session.add(UserPathProgress(user_id=user_id, path_id=path_id))
+    badges = check_and_award_badges(user_id, bump_stats(user_id, path_count=1))
+    db.session.commit()
+    publish(Enrolled(user_id, path_id), *badges)
+
+
 # ── Module View ───────────────────────────────────────────────────────────────
 @learning.route('/learning-paths/<slug>/module/<int:module_id>')
 @login_required
@@ -69,8 +83,7 @@ def module_view(slug, module_id):
     if module.path_id != path.id:
         return redirect(url_for('learning.path_detail', slug=slug))
     if not UserPathProgress.query.filter_by(user_id=user.id, path_id=path.id).first():
-        db.session.add(UserPathProgress(user_id=user.id, path_id=path.id))
-        db.session.commit()
+        _enrol(user.id, path.id)
     mod_progress = UserModuleProgress.query.filter_by(user_id=user.id, module_id=module_id).first()
     modules = path.modules
     idx = next((i for i, m in enumerate(modules) if m.id == module_id), 0)
@@ -139,37 +152,52 @@ def quiz_submit(slug, module_id):
     if mp.quiz_score is None or score_pct > mp.quiz_score:
         mp.quiz_score = score_pct
     points_awarded = 0
+    events = []
     if passed and not mp.quiz_passed:
         mp.quiz_passed = True
         mp.completed = True
         mp.completed_at = now_sast()
         mp.points_earned = module.points
         points_awarded = module.points
+        stat_deltas = {'module_points': module.points}
+        events.append(ModuleCompleted(user.id, path.id, module_id, module.points))
         pp = UserPathProgress.query.filter_by(user_id=user.id, path_id=path.id).first()
         if not pp:
             pp = UserPathProgress(user_id=user.id, path_id=path.id)
             db.session.add(pp)
+            stat_deltas['path_count'] = 1
+            events.append(Enrolled(user.id, path.id))
         pp.total_points_earned = (pp.total_points_earned or 0) + module.points
-        all_done = all(
-            UserModuleProgress.query.filter_by(user_id=user.id, module_id=m.id, completed=True).first()
-            for m in path.modules
-        )
+        module_ids = [m.id for m in path.modules]
+        done_count = UserModuleProgress.query.filter(
+            UserModuleProgress.user_id == user.id,
+            UserModuleProgress.module_id.in_(module_ids),
+            UserModuleProgress.completed.is_(True)
+        ).count()
+        all_done = done_count == len(module_ids)
         if all_done and not pp.completed_at:
             pp.completed_at = now_sast()
-            _issue_certificate(user, path, pp)
+            cert = _issue_certificate(user, path, pp)
+            if cert:
+                stat_deltas['certificate_count'] = 1
+                events.append(PathCompleted(user.id, path.id, cert.cert_code))
+        events += check_and_award_badges(user.id, bump_stats(user.id, **stat_deltas))
     db.session.commit()
+    publish(*events)
     return jsonify({'score': score_pct, 'correct': correct, 'total': total,
                     'passed': passed, 'feedback': feedback, 'points_earned': points_awarded})
 
 
 def _issue_certificate(user, path, path_progress):
+    """Add the path certificate to the session; return it, or None if one was already issued."""
     if Certificate.query.filter_by(user_id=user.id, path_id=path.id).first():
-        return
+        return None
     code = ''.join(secrets.choice(string.ascii_uppercase + string.digits) for _ in range(12))
     cert = Certificate(user_id=user.id, path_id=path.id, cert_code=code,
                        recipient_full_name=user.username,
                        total_points=path_progress.total_points_earned or 0)
     db.session.add(cert)
+    return cert
 
 
 # ── Certificate ───────────────────────────────────────────────────────────────
@@ -204,15 +232,26 @@ def set_cert_name(cert_code):
 # ── Progress API ──────────────────────────────────────────────────────────────
 @learning.route('/api/my-progress')
 @login_required
+@conditional(user_version)
 def my_progress_api():
     user = _current_user()
+    enrolments = UserPathProgress.query.filter_by(user_id=user.id)\
+        .options(joinedload(UserPathProgress.path)).all()
+    path_ids = [pp.path_id for pp in enrolments]
+    # Module totals and completions per path in two grouped queries
+    module_totals = dict(db.session.query(PathModule.path_id, func.count(PathModule.id))
+                         .filter(PathModule.path_id.in_(path_ids)).group_by(PathModule.path_id).all())
+    module_done = dict(db.session.query(PathModule.path_id, func.count(UserModuleProgress.id))
+                       .join(UserModuleProgress, UserModuleProgress.module_id == PathModule.id)
+                       .filter(PathModule.path_id.in_(path_ids),
+                               UserModuleProgress.user_id == user.id,
+                               UserModuleProgress.completed.is_(True))
+                       .group_by(PathModule.path_id).all())
     result = []
-    for pp in UserPathProgress.query.filter_by(user_id=user.id).all():
-        path = LearningPath.query.get(pp.path_id)
-        total_mods = len(path.modules)
-        done_mods = sum(1 for m in path.modules
-                        if UserModuleProgress.query.filter_by(
-                            user_id=user.id, module_id=m.id, completed=True).first())
+    for pp in enrolments:
+        path = pp.path
+        total_mods = module_totals.get(path.id, 0)
+        done_mods = module_done.get(path.id, 0)
         result.append({'path_id': path.id, 'slug': path.slug, 'title': path.title,
                        'icon': path.icon, 'total_modules': total_mods,
                        'completed_modules': done_mods,
@@ -225,10 +264,7 @@ def my_progress_api():
 # ── Stats API (used by dashboard cert + badge counts) ─────────────────────────
 @learning.route('/api/my-stats')
 @login_required
+@conditional(user_version)
 def my_stats_api():
-    from app.models_learning import Certificate
-    from app.models import UserBadge
-    user = _current_user()
-    cert_count = Certificate.query.filter_by(user_id=user.id).count()
-    badge_count = UserBadge.query.filter_by(user_id=user.id).count()
-    return jsonify({'cert_count': cert_count, 'badge_count': badge_count})
+    stats = get_stats(session['user_id'])
+    return jsonify({'cert_count': stats.certificate_count, 'badge_count': stats.badge_count})
@@ -0,0 +1,69 @@
+"""
+Host-wide leader election for scheduled jobs.
+
+Every worker competes for an exclusive flock on a lease file in the instance
+folder. The holder runs the scheduler; the others keep retrying in a daemon
+thread. The kernel drops the lock when the leader process dies, so the next
+retry in a surviving worker takes over automatically.
+"""
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX dev machines - every process leads
+    fcntl = None
+
+
+class LeaderLease:
+    """Non-blocking exclusive file lock held for the lifetime of the process."""
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+
+    @property
+    def held(self):
+        return self._fd is not None
+
+    def try_acquire(self):
+        if self.held:
+            return True
+        if fcntl is None:
+            self._fd = -1
+            return True
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+    def release(self):
+        if self._fd is not None and self._fd >= 0:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+        self._fd = None
+
+
+def run_as_leader(lease, start, retry_seconds=30):
+    """Call start() once this process holds the lease, retrying in the background until it does."""
+    if lease.try_acquire():
+        start()
+        return None
+
+    stop = threading.Event()
+
+    def _retry_lease():
+        while not stop.wait(retry_seconds):
+            if lease.try_acquire():
+                start()
+                return
+
+    thread = threading.Thread(target=_retry_lease, name='scheduler-leader', daemon=True)
+    thread.start()
+    return stop
@@ -0,0 +1,53 @@
+"""
+Schema upgrades for existing databases.
+
+``db.create_all()`` creates missing tables but never alters existing ones, so
+new columns and indexes on existing tables live in migrations/versions.
+``upgrade_schema`` brings any database to the migration head: it creates
+missing tables from the models, stamps a database that predates Alembic (no
+alembic_version table) at the baseline revision, then runs every pending
+migration. The migrations after the baseline check for what already exists,
+so they are safe on databases built by ``create_all`` at any point.
+
+keep.sh runs `flask upgrade-db` before seeding; development boots
+(SEED_ON_BOOT) upgrade automatically, and other boots warn when the
+database is behind.
+"""
+import os
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+from app import db
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+BASELINE_REVISION = '3afb2f422ff5'   # the tables the app had before migrations were applied on deploy
+
+
+def head_revision():
+    config = Config(os.path.join(MIGRATIONS_DIR, 'alembic.ini'))
+    config.set_main_option('script_location', MIGRATIONS_DIR)
+    return ScriptDirectory.from_config(config).get_current_head()
+
+
+def current_revision():
+    """The revision the database is stamped at, or None if it predates Alembic."""
+    with db.engine.connect() as conn:
+        return MigrationContext.configure(conn).get_current_revision()
+
+
+def schema_pending():
+    return current_revision() != head_revision()
+
+
+def upgrade_schema():
+    """Create missing tables and apply pending migrations; returns the (old, new) revisions."""
+    from flask_migrate import stamp, upgrade
+    before = current_revision()
+    db.create_all()
+    if before is None:
+        stamp(directory=MIGRATIONS_DIR, revision=BASELINE_REVISION)
+    upgrade(directory=MIGRATIONS_DIR)
+    db.session.remove()
+    return before, current_revision()
@@ -0,0 +1,54 @@
+"""
+Versioned content seeding.
+
+Every seed set is fingerprinted with a SHA-256 of its source data and the hash
+is stored in the content_manifest table. A seed set is only re-run when its
+fingerprint changes, so an up-to-date database costs a single lookup on boot.
+"""
+import hashlib
+import json
+from datetime import datetime
+
+from app import db
+from app.models import ContentManifest
+
+
+def _hash_data(data):
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _seed_sets():
+    """Return (name, fingerprint, seed_function) in the order they must run."""
+    from app.models import CHALLENGE_SEED, BADGE_SEED, initialize_challenges, initialize_badges
+    from app.models_learning import seed_learning_paths, seed_aws_associate_paths
+    from app.content import bundle_hash
+    return [
+        ('challenges', _hash_data(CHALLENGE_SEED), initialize_challenges),
+        ('badges', _hash_data(BADGE_SEED), initialize_badges),
+        ('learning_paths', bundle_hash('learning_paths'), seed_learning_paths),
+        ('aws_associate_paths', bundle_hash('aws_associate_paths'), seed_aws_associate_paths),
+    ]
+
+
+def stale_seed_sets():
+    """Names of seed sets whose stored hash is missing or out of date."""
+    stored = dict(db.session.query(ContentManifest.seed_set, ContentManifest.content_hash).all())
+    return [name for name, fingerprint, _ in _seed_sets() if stored.get(name) != fingerprint]
+
+
+def sync_content(force=False):
+    """Run every stale seed set (or all of them with force) and record the new hashes."""
+    stored = dict(db.session.query(ContentManifest.seed_set, ContentManifest.content_hash).all())
+    seeded = []
+    for name, fingerprint, seed in _seed_sets():
+        if not force and stored.get(name) == fingerprint:
+            continue
+        seed()
+        entry = db.session.get(ContentManifest, name) or ContentManifest(seed_set=name)
+        entry.content_hash = fingerprint
+        entry.seeded_at = datetime.utcnow()
+        db.session.add(entry)
+        db.session.commit()
+        seeded.append(name)
+    return seeded
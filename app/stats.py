@@ -0,0 +1,137 @@
+"""
+Materialised per-user totals (the user_stats table).
+
+Writers call ``bump_stats`` in the same session as the Score, module progress,
+Certificate, UserBadge or path enrolment row they add, so the counters commit or roll back with
+it (``record_challenge_completion`` does both for a challenge). Pages read one
+user_stats row instead of aggregating the source tables, and the row's version
+doubles as the per-user data version behind ETags.
+Challenge points are also rolled up per day into score_daily for the windowed
+leaderboards. ``rebuild_user_stats`` recomputes both from the source tables
+with set-based SQL and reports how many rows had drifted; `flask rebuild-stats`
+runs it.
+"""
+from sqlalchemy import func, literal, or_, select
+
+from app import db
+from app.database import dialect_insert
+from app.models import User, Score, ScoreDaily, UserBadge, UserStats, now_sast
+from app.models_learning import UserPathProgress, UserModuleProgress, Certificate
+from app.versioning import USER_STATS, USER_STATS_EPOCH, bump_version
+
+STAT_COLUMNS = ('challenge_points', 'challenge_count', 'path_count', 'module_points', 'certificate_count',
+                'badge_count', 'total_points')
+POINT_SOURCES = ('challenge_points', 'module_points')   # summed into total_points
+
+
+class _EmptyStats:
+    """Stand-in for users who have no user_stats row yet."""
+    challenge_points = challenge_count = path_count = module_points = certificate_count = badge_count = 0
+    total_points = version = 0
+
+
+EMPTY_STATS = _EmptyStats()
+
+
+def bump_stats(user_id, version=None, **deltas):
+    """Add deltas to a user's counters in the current transaction, creating the row if needed.
+
+    Returns the updated row (read back with RETURNING, so no extra SELECT). A second bump in the
+    same transaction can pass the version the first one returned instead of issuing a new one.
+    """
+    table = UserStats.__table__
+    points = sum(deltas.get(source, 0) for source in POINT_SOURCES)
+    if points:
+        deltas['total_points'] = points
+    if version is None:
+        version = bump_version(USER_STATS)
+    stmt = dialect_insert(table).values(user_id=user_id, version=version, **deltas)
+    set_ = {k: table.c[k] + stmt.excluded[k] for k in deltas}   # empty when only the version is stamped
+    set_['version'] = stmt.excluded.version
+    stmt = stmt.on_conflict_do_update(index_elements=[table.c.user_id], set_=set_).returning(*table.c)
+    row = db.session.execute(stmt).one()
+    if deltas.get('challenge_points'):
+        _bump_daily(user_id, deltas['challenge_points'])
+    return row
+
+
+def _bump_daily(user_id, points):
+    table = ScoreDaily.__table__
+    stmt = dialect_insert(table).values(day=now_sast().date(), user_id=user_id, points=points)
+    db.session.execute(stmt.on_conflict_do_update(index_elements=[table.c.day, table.c.user_id],
+                                                  set_={'points': table.c.points + stmt.excluded.points}))
+
+
+def record_challenge_completion(user_id, challenge):
+    """Insert the user's Score for the challenge unless one exists, and bump their stats if it is new.
+
+    Returns the updated stats row, or None when the challenge was already completed. The
+    unique (user_id, challenge_id) index makes this safe against concurrent submissions.
+    """
+    stmt = (dialect_insert(Score.__table__)
+            .values(user_id=user_id, challenge_id=challenge.id, score=challenge.points, completed_at=now_sast())
+            .on_conflict_do_nothing(index_elements=['user_id', 'challenge_id'])
+            .returning(Score.id))
+    if db.session.execute(stmt).scalar_one_or_none() is None:
+        return None
+    return bump_stats(user_id, challenge_points=challenge.points or 0, challenge_count=1)
+
+
+def get_stats(user_id):
+    """The user's stats row, or an all-zero stand-in."""
+    return db.session.get(UserStats, user_id) or EMPTY_STATS
+
+
+def _fresh_stats_select(version=0):
+    """One row per user with every counter recomputed from the source tables."""
+    scores = (select(Score.user_id, func.sum(Score.score).label('points'), func.count().label('n'))
+              .group_by(Score.user_id).subquery())
+    paths = select(UserPathProgress.user_id, func.count().label('n')).group_by(UserPathProgress.user_id).subquery()
+    modules = (select(UserModuleProgress.user_id, func.sum(UserModuleProgress.points_earned).label('points'))
+               .where(UserModuleProgress.completed.is_(True))
+               .group_by(UserModuleProgress.user_id).subquery())
+    certs = select(Certificate.user_id, func.count().label('n')).group_by(Certificate.user_id).subquery()
+    badges = select(UserBadge.user_id, func.count().label('n')).group_by(UserBadge.user_id).subquery()
+    return (select(User.id.label('user_id'),
+                   func.coalesce(scores.c.points, 0).label('challenge_points'),
+                   func.coalesce(scores.c.n, 0).label('challenge_count'),
+                   func.coalesce(paths.c.n, 0).label('path_count'),
+                   func.coalesce(modules.c.points, 0).label('module_points'),
+                   func.coalesce(certs.c.n, 0).label('certificate_count'),
+                   func.coalesce(badges.c.n, 0).label('badge_count'),
+                   (func.coalesce(scores.c.points, 0) + func.coalesce(modules.c.points, 0)).label('total_points'),
+                   literal(version).label('version'))
+            .outerjoin(scores, scores.c.user_id == User.id)
+            .outerjoin(paths, paths.c.user_id == User.id)
+            .outerjoin(modules, modules.c.user_id == User.id)
+            .outerjoin(certs, certs.c.user_id == User.id)
+            .outerjoin(badges, badges.c.user_id == User.id))
+
+
+def rebuild_user_stats():
+    """Recompute user_stats and score_daily for every user; return (user_stats rows, rows that had drifted)."""
+    fresh = _fresh_stats_select().subquery()
+    drifted = (db.session.query(func.count())
+               .select_from(fresh)
+               .outerjoin(UserStats, UserStats.user_id == fresh.c.user_id)
+               .filter(or_(UserStats.user_id.is_(None),
+                           *[getattr(UserStats, c) != fresh.c[c] for c in STAT_COLUMNS]))
+               .scalar())
+    version = bump_version(USER_STATS)
+    bump_version(USER_STATS_EPOCH)
+    db.session.execute(UserStats.__table__.delete())
+    result = db.session.execute(UserStats.__table__.insert().from_select(
+        ['user_id', *STAT_COLUMNS, 'version'], _fresh_stats_select(version)))
+    day = func.date(Score.completed_at)
+    db.session.execute(ScoreDaily.__table__.delete())
+    db.session.execute(ScoreDaily.__table__.insert().from_select(
+        ['day', 'user_id', 'points'],
+        select(day, Score.user_id, func.sum(Score.score)).group_by(day, Score.user_id)))
+    db.session.commit()
+    return result.rowcount, drifted
+
+
+def stats_missing():
+    """True when users exist but user_stats has never been built (e.g. straight after the table was added)."""
+    return (db.session.query(UserStats.user_id).first() is None
+            and db.session.query(User.id).first() is not None)
@@ -0,0 +1,39 @@
+"""
+Shared data-version counters.
+
+Each counter is a row in data_version that writers increment inside the same
+transaction as the change it describes. Per-process caches (the leaderboard
+index, for one) compare the committed value with the one they were built from
+and catch up when it moves, which keeps every gunicorn worker consistent
+without any cross-process messaging.
+"""
+from flask import g, has_request_context
+
+from app import db
+from app.database import dialect_insert
+from app.models import DataVersion
+
+USER_STATS = 'user_stats'              # bumped by every user_stats change
+USER_STATS_EPOCH = 'user_stats_epoch'  # bumped when rows are rebuilt or removed; caches reload in full
+CHALLENGES = 'challenges'              # bumped when challenges are added or changed; see app.catalogue
+
+
+def bump_version(name):
+    """Increment a counter in the current transaction and return its new value."""
+    table = DataVersion.__table__
+    stmt = dialect_insert(table).values(name=name, version=1)
+    stmt = stmt.on_conflict_do_update(index_elements=[table.c.name], set_={'version': table.c.version + 1})
+    return db.session.execute(stmt.returning(table.c.version)).scalar_one()
+
+
+def read_versions(*names):
+    """Committed values of the given counters in one query; missing counters read as 0.
+
+    Within a request the first read is reused, so every consumer sees the same snapshot.
+    """
+    memo = g.setdefault('_data_versions', {}) if has_request_context() else {}
+    if names not in memo:
+        rows = dict(db.session.query(DataVersion.name, DataVersion.version)
+                    .filter(DataVersion.name.in_(names)).all())
+        memo[names] = {name: rows.get(name, 0) for name in names}
+    return memo[names]
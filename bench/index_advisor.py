@@ -0,0 +1,115 @@
+"""
+Index advisor: EXPLAIN QUERY PLAN for every distinct SQL statement a run issues.
+
+Runs the pytest suite (or the load-test journeys) in-process with a listener on
+every SQLAlchemy engine. The first time a statement is seen it is explained on
+the same connection with the same parameters, so the plan reflects the real
+schema and data. The report lists statements whose plan does a full table scan
+(``SCAN <table>`` without an index) or builds a temporary B-tree for ORDER BY /
+GROUP BY / DISTINCT, most frequently executed first.
+
+Usage: python bench/index_advisor.py [--suite tests|loadtest] [--ignore challenge,badge]
+                                     [--out plans.json] [-- extra pytest args]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Reference tables with a handful of rows: scanning them is cheaper than an index lookup
+SMALL_TABLES = ('challenge', 'badge', 'learning_path', 'content_manifest', 'data_version')
+
+_SCAN = re.compile(r'^SCAN (?:TABLE )?(?!CONSTANT ROW|TABLE )(\w+)\b(?! USING (?:COVERING )?INDEX)')
+_TEMP = re.compile(r'USE TEMP B-TREE FOR (.+)$')
+
+
+class PlanCollector:
+    """Engine-wide before_cursor_execute hook that explains each new statement once."""
+
+    def __init__(self):
+        self.statements = {}   # sql -> {'count': n, 'plan': [detail, ...]}
+
+    def install(self):
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+        event.listen(Engine, 'before_cursor_execute', self._before)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        if conn.dialect.name != 'sqlite':
+            return
+        verb = statement.lstrip().split(None, 1)[0].upper()
+        if verb not in ('SELECT', 'UPDATE', 'DELETE', 'WITH'):
+            return
+        entry = self.statements.get(statement)
+        if entry is None:
+            entry = self.statements[statement] = {'count': 0, 'plan': self._explain(cursor, statement,
+                                                                                    parameters, executemany)}
+        entry['count'] += 1
+
+    @staticmethod
+    def _explain(cursor, statement, parameters, executemany):
+        params = parameters[0] if executemany and parameters else parameters
+        try:
+            explain = cursor.connection.cursor()
+            rows = explain.execute(f'EXPLAIN QUERY PLAN {statement}', params or ()).fetchall()
+            explain.close()
+        except Exception as e:   # a plan we cannot get should not fail the run
+            return [f'(explain failed: {e})']
+        return [row[-1] for row in rows]
+
+
+def analyse(statements, ignore):
+    """Flag full scans and temp B-trees; return findings sorted by execution count."""
+    findings = []
+    for sql, entry in statements.items():
+        scans = sorted({m.group(1) for d in entry['plan'] if (m := _SCAN.match(d))} - set(ignore))
+        temps = [m.group(1) for d in entry['plan'] if (m := _TEMP.search(d))]
+        if scans or temps:
+            findings.append({'count': entry['count'], 'full_scans': scans, 'temp_btree': temps,
+                             'sql': ' '.join(sql.split()), 'plan': entry['plan']})
+    findings.sort(key=lambda f: -f['count'])
+    by_table = {}
+    for f in findings:
+        for table in f['full_scans']:
+            by_table[table] = by_table.get(table, 0) + f['count']
+    return findings, dict(sorted(by_table.items(), key=lambda kv: -kv[1]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--suite', choices=('tests', 'loadtest'), default='tests')
+    parser.add_argument('--ignore', default=','.join(SMALL_TABLES),
+                        help='comma-separated tables whose full scans are expected')
+    parser.add_argument('--out', default=None, help='write the JSON report here instead of stdout')
+    parser.add_argument('extra', nargs='*', help='extra arguments for pytest or the load test')
+    args = parser.parse_args()
+
+    collector = PlanCollector()
+    collector.install()
+    if args.suite == 'tests':
+        import pytest
+        pytest.main(['-q', '-p', 'no:cacheprovider', os.path.join(ROOT, 'tests'), *args.extra])
+    else:
+        sys.path.insert(0, os.path.join(ROOT, 'bench'))
+        import loadtest
+        sys.argv = ['loadtest', '--out', os.devnull, *args.extra]
+        loadtest.main()
+
+    findings, by_table = analyse(collector.statements, [t for t in args.ignore.split(',') if t])
+    report = {'distinct_statements': len(collector.statements), 'flagged_statements': len(findings),
+              'full_scan_executions_by_table': by_table, 'findings': findings}
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
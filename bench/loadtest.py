@@ -0,0 +1,207 @@
+"""
+Load test that replays scripted learner journeys against the real Flask app.
+
+Each virtual user runs: signup -> /challenges -> /validate -> enrol ->
+module_view -> quiz_submit -> /leaderboard. Users run on a thread pool, either
+through in-process test clients or over HTTP against a local threaded WSGI
+server. The report holds p50/p95/p99 latency and requests/sec per endpoint as
+sorted JSON, so runs from two commits can be diffed directly.
+
+Usage: python bench/loadtest.py [--users 50] [--concurrency 8] [--mode inprocess|http]
+                                [--dataset-users 10000]
+                                [--database sqlite:////tmp/load.db] [--out load.json]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+PASSWORD = 'Loadtest@123'
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class Recorder:
+    """Thread-safe collection of (endpoint, seconds, status) samples."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}
+
+    def add(self, endpoint, seconds, status):
+        with self._lock:
+            self.samples.setdefault(endpoint, []).append((seconds, status))
+
+    def report(self, wall_seconds):
+        endpoints = {}
+        total = 0
+        for endpoint, samples in sorted(self.samples.items()):
+            latencies = sorted(s * 1000 for s, _ in samples)
+            errors = sum(1 for _, status in samples if status >= 400)
+            total += len(samples)
+            endpoints[endpoint] = {
+                'count': len(samples),
+                'errors': errors,
+                'mean_ms': round(sum(latencies) / len(latencies), 2),
+                'p50_ms': round(percentile(latencies, 50), 2),
+                'p95_ms': round(percentile(latencies, 95), 2),
+                'p99_ms': round(percentile(latencies, 99), 2),
+                'rps': round(len(samples) / wall_seconds, 2),
+            }
+        return {'endpoints': endpoints, 'total_requests': total,
+                'wall_seconds': round(wall_seconds, 3), 'total_rps': round(total / wall_seconds, 2)}
+
+
+class InProcessClient:
+    """Flask test client with one cookie jar per virtual user."""
+
+    def __init__(self, app, base_url=None):
+        self._client = app.test_client()
+
+    def request(self, method, url, **kwargs):
+        rv = self._client.open(url, method=method, **kwargs)
+        return rv.status_code
+
+
+class HttpClient:
+    """requests.Session against the local WSGI server."""
+
+    def __init__(self, app, base_url):
+        import requests
+        self._session = requests.Session()
+        self._base = base_url
+
+    def request(self, method, url, data=None, json=None):
+        rv = self._session.request(method, self._base + url, data=data, json=json, allow_redirects=False)
+        return rv.status_code
+
+
+def build_app(database_uri, dataset_users=0):
+    from app import create_app, db
+    from app.dataset import generate_dataset
+    from app.seeding import sync_content
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': database_uri,
+        'SEED_ON_BOOT': False,
+        'MAIL_SUPPRESS_SEND': True,
+        'SESSION_COOKIE_SECURE': False,
+        'METRICS_DIR': tempfile.mkdtemp(prefix='loadtest-metrics-'),
+    })
+    with app.app_context():
+        db.create_all()
+        sync_content()
+        if dataset_users:
+            generate_dataset(dataset_users)
+    return app
+
+
+def load_fixtures(app):
+    """Challenges and, per path, the first module with its correct quiz answers."""
+    from app.models import Challenge
+    from app.models_learning import LearningPath
+    with app.app_context():
+        challenges = [(c.id, c.solution) for c in Challenge.query.all()]
+        modules = []
+        for path in LearningPath.query.all():
+            if path.modules:
+                module = path.modules[0]
+                answers = {str(q.id): q.correct_answer for q in module.quiz_questions}
+                modules.append((path.slug, module.id, answers))
+    return challenges, modules
+
+
+def run_journey(client, user_no, run_id, fixtures, recorder, rng):
+    challenges, modules = fixtures
+
+    def call(label, method, url, **kwargs):
+        start = time.perf_counter()
+        status = client.request(method, url, **kwargs)
+        recorder.add(label, time.perf_counter() - start, status)
+        return status
+
+    username = f'load_{run_id}_{user_no}'
+    call('POST /signup', 'POST', '/signup', data={
+        'username': username, 'email': f'{username}@loadtest.local',
+        'password': PASSWORD, 'confirm_password': PASSWORD})
+    call('GET /challenges', 'GET', '/challenges')
+    challenge_id, solution = rng.choice(challenges)
+    call('POST /validate', 'POST', '/validate', json={'command': solution, 'challenge_id': challenge_id})
+    slug, module_id, answers = rng.choice(modules)
+    call('POST /learning-paths/<slug>/enrol', 'POST', f'/learning-paths/{slug}/enrol')
+    call('GET /learning-paths/<slug>/module/<id>', 'GET', f'/learning-paths/{slug}/module/{module_id}')
+    call('POST /learning-paths/<slug>/module/<id>/quiz/submit', 'POST',
+         f'/learning-paths/{slug}/module/{module_id}/quiz/submit', json={'answers': answers})
+    call('GET /leaderboard', 'GET', '/leaderboard')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=50, help='virtual users (one journey each)')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--mode', choices=('inprocess', 'http'), default='inprocess')
+    parser.add_argument('--database', default=None,
+                        help='SQLAlchemy URI; defaults to a fresh temporary SQLite file')
+    parser.add_argument('--dataset-users', type=int, default=0,
+                        help='pre-populate this many synthetic users (flask generate-dataset) before the run')
+    parser.add_argument('--seed', type=int, default=1, help='random seed for journey choices')
+    parser.add_argument('--out', default=None, help='write the JSON report here instead of stdout')
+    args = parser.parse_args()
+
+    database_uri = args.database or f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='loadtest-'), 'load.db')}"
+    app = build_app(database_uri, args.dataset_users)
+    fixtures = load_fixtures(app)
+
+    server = None
+    base_url = None
+    client_cls = InProcessClient
+    if args.mode == 'http':
+        from werkzeug.serving import make_server
+        server = make_server('127.0.0.1', 0, app, threaded=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f'http://127.0.0.1:{server.server_port}'
+        client_cls = HttpClient
+
+    recorder = Recorder()
+    run_id = int(time.time())
+
+    def _virtual_user(user_no):
+        rng = random.Random(args.seed * 100003 + user_no)
+        run_journey(client_cls(app, base_url), user_no, run_id, fixtures, recorder, rng)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(_virtual_user, range(args.users)))
+    wall = time.perf_counter() - start
+
+    if server is not None:
+        server.shutdown()
+
+    report = recorder.report(wall)
+    report['config'] = {'users': args.users, 'concurrency': args.concurrency, 'mode': args.mode,
+                        'database': database_uri, 'seed': args.seed,
+                        'dataset_users': args.dataset_users}
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
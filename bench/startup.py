@@ -0,0 +1,109 @@
+"""
+Worker cold-start benchmark.
+
+Boots the app in fresh interpreters and records create_app() wall time plus the
+slowest modules from ``python -X importtime``, so startup has a tracked budget.
+Each child boots like a worker with the scheduler off, against a throw-away
+copy of instance/app.db, so a run never touches the live database or competes
+for the scheduler lease.
+
+Usage: python bench/startup.py [--runs 5] [--top 15] [--budget-ms 800] [--out startup.json]
+"""
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_CHILD = """
+import time
+t0 = time.perf_counter()
+from app import create_app
+t1 = time.perf_counter()
+create_app({'SEED_ON_BOOT': False})
+t2 = time.perf_counter()
+print('{"import_ms": %.2f, "create_app_ms": %.2f}' % ((t1 - t0) * 1000, (t2 - t1) * 1000))
+"""
+
+
+def _parse_importtime(stderr):
+    """Return {module: cumulative_us} from -X importtime output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _self_us, cumulative_us, name = line.replace('import time:', '', 1).split('|')
+        name = name.strip()
+        modules[name] = max(modules.get(name, 0), int(cumulative_us))
+    return modules
+
+
+def scratch_env():
+    """Environment for the children: scheduler off, and a temp copy of the database, metrics and lock."""
+    workdir = tempfile.mkdtemp(prefix='startup-bench-')
+    db_path = os.path.join(workdir, 'app.db')
+    source = os.path.join(ROOT, 'instance', 'app.db')
+    if os.path.exists(source):
+        # The backup API copies a consistent snapshot, including pages still in the WAL
+        with sqlite3.connect(f'file:{source}?mode=ro', uri=True) as src, sqlite3.connect(db_path) as dst:
+            src.backup(dst)
+    return dict(os.environ, SCHEDULER_ENABLED='0', DATABASE_URL=f'sqlite:///{db_path}',
+                METRICS_DIR=os.path.join(workdir, 'metrics'),
+                SCHEDULER_LOCK_PATH=os.path.join(workdir, 'scheduler.lock'))
+
+
+def run_once(python, env):
+    proc = subprocess.run([python, '-X', 'importtime', '-c', _CHILD], cwd=ROOT, env=env,
+                          capture_output=True, text=True, check=True)
+    timings = json.loads(proc.stdout.strip().splitlines()[-1])
+    return timings, _parse_importtime(proc.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15, help='number of slowest imports to report')
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help='fail (exit 1) if median import + create_app time exceeds this')
+    parser.add_argument('--out', default=None, help='write the JSON report here instead of stdout')
+    args = parser.parse_args()
+
+    env = scratch_env()
+    runs, imports = [], {}
+    for _ in range(args.runs):
+        timings, modules = run_once(sys.executable, env)
+        runs.append(timings)
+        for name, us in modules.items():
+            imports.setdefault(name, []).append(us)
+
+    total = [r['import_ms'] + r['create_app_ms'] for r in runs]
+    slowest = sorted(((statistics.median(v) / 1000, k) for k, v in imports.items()), reverse=True)[:args.top]
+    report = {
+        'runs': args.runs,
+        'import_ms_median': round(statistics.median(r['import_ms'] for r in runs), 2),
+        'create_app_ms_median': round(statistics.median(r['create_app_ms'] for r in runs), 2),
+        'total_ms_median': round(statistics.median(total), 2),
+        'slowest_imports_ms': {name: round(ms, 2) for ms, name in slowest},
+        'heavy_modules_loaded': sorted(m for m in ('reportlab', 'boto3', 'requests', 'apscheduler')
+                                       if m in imports),
+    }
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    if args.budget_ms is not None and report['total_ms_median'] > args.budget_ms:
+        print(f"Startup budget exceeded: {report['total_ms_median']} ms > {args.budget_ms} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -18,7 +18,11 @@ kill_stale_app() {
 
 # Function to start the app
 start_app() {
-    nohup $PYTHON_BIN -m gunicorn -w 4 -b 0.0.0.0:$PORT run:app &> /tmp/app.log &
+    # Apply schema migrations and seed content once, then start the workers without boot-time seeding
+    $PYTHON_BIN -m flask --app run upgrade-db &> /tmp/app.log
+    $PYTHON_BIN -m flask --app run seed-content &>> /tmp/app.log
+    $PYTHON_BIN -m flask --app run rebuild-stats &>> /tmp/app.log
+    SEED_ON_BOOT=0 nohup $PYTHON_BIN -m gunicorn -w 4 -b 0.0.0.0:$PORT run:app &>> /tmp/app.log &
     disown
 }
 # Main script logic
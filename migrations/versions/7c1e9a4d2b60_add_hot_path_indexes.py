@@ -0,0 +1,40 @@
+"""Add indexes for hot-path lookups found by bench/index_advisor.py
+
+Revision ID: 7c1e9a4d2b60
+Revises: 3afb2f422ff5
+Create Date: 2026-10-18 09:12:44.318205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c1e9a4d2b60'
+down_revision = '3afb2f422ff5'
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns) -- mirrors the index=True / db.Index declarations on the models
+INDEXES = (
+    ('ix_score_user_id', 'score', ['user_id']),
+    ('ix_user_reset_token', 'user', ['reset_token']),
+    ('ix_user_created_at', 'user', ['created_at']),
+    ('ix_user_module_progress_user_completed', 'user_module_progress', ['user_id', 'completed']),
+    ('ix_audit_log_timestamp', 'audit_log', ['timestamp']),
+    ('ix_backup_log_created_at', 'backup_log', ['created_at']),
+    ('ix_path_module_path_order', 'path_module', ['path_id', 'order_index']),
+    ('ix_quiz_question_module_id', 'quiz_question', ['module_id']),
+    ('ix_certificate_user_path', 'certificate', ['user_id', 'path_id']),
+)
+
+
+def upgrade():
+    # if_not_exists: databases built by db.create_all() after the models gained these already have them
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,38 @@
+"""Move challenge hint links into the challenge table
+
+Revision ID: a3d7e0b95c14
+Revises: f2c8b6e1a937
+Create Date: 2026-10-18 22:18:09.274816
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3d7e0b95c14'
+down_revision = 'f2c8b6e1a937'
+branch_labels = None
+depends_on = None
+
+
+def _columns(table):
+    inspector = sa.inspect(op.get_bind())
+    return {c['name'] for c in inspector.get_columns(table)} if table in inspector.get_table_names() else set()
+
+
+def upgrade():
+    # Run `flask seed-content` afterwards to fill the links in for the seeded challenges
+    existing = _columns('challenge')
+    with op.batch_alter_table('challenge') as batch_op:
+        for name in ('doc_link', 'video_link'):
+            if name not in existing:
+                batch_op.add_column(sa.Column(name, sa.String(length=255), nullable=True))
+
+
+def downgrade():
+    existing = _columns('challenge')
+    with op.batch_alter_table('challenge') as batch_op:
+        for name in ('video_link', 'doc_link'):
+            if name in existing:
+                batch_op.drop_column(name)
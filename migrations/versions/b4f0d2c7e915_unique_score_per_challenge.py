@@ -0,0 +1,32 @@
+"""One score per user and challenge
+
+Revision ID: b4f0d2c7e915
+Revises: 7c1e9a4d2b60
+Create Date: 2026-10-18 14:37:05.902166
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4f0d2c7e915'
+down_revision = '7c1e9a4d2b60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep the earliest completion of any challenge a concurrent double submit recorded twice.
+    # Run `flask rebuild-stats` afterwards so user_stats drops the duplicate points.
+    op.execute('DELETE FROM score WHERE id NOT IN '
+               '(SELECT min(id) FROM score GROUP BY user_id, challenge_id)')
+    op.create_index('uq_score_user_challenge', 'score', ['user_id', 'challenge_id'],
+                    unique=True, if_not_exists=True)
+    # The unique index leads with user_id, so the plain one is redundant
+    op.drop_index('ix_score_user_id', table_name='score', if_exists=True)
+
+
+def downgrade():
+    op.create_index('ix_score_user_id', 'score', ['user_id'], unique=False, if_not_exists=True)
+    op.drop_index('uq_score_user_challenge', table_name='score', if_exists=True)
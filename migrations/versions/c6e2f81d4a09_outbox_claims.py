@@ -0,0 +1,50 @@
+"""Let one drain claim outbox rows before sending them
+
+Revision ID: c6e2f81d4a09
+Revises: a3d7e0b95c14
+Create Date: 2026-10-18 21:12:40.518337
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6e2f81d4a09'
+down_revision = 'a3d7e0b95c14'
+branch_labels = None
+depends_on = None
+
+
+def _has_column(table, column):
+    inspector = sa.inspect(op.get_bind())
+    return table in inspector.get_table_names() and column in {c['name'] for c in inspector.get_columns(table)}
+
+
+def _index_columns(table, name):
+    inspector = sa.inspect(op.get_bind())
+    if table not in inspector.get_table_names():
+        return None
+    return next((i['column_names'] for i in inspector.get_indexes(table) if i['name'] == name), None)
+
+
+def upgrade():
+    with op.batch_alter_table('email_outbox') as batch_op:
+        if not _has_column('email_outbox', 'claimed_by'):
+            batch_op.add_column(sa.Column('claimed_by', sa.String(length=80), nullable=True))
+        if not _has_column('email_outbox', 'claimed_until'):
+            batch_op.add_column(sa.Column('claimed_until', sa.DateTime(), nullable=True))
+    # The due index gains id, so the drain reads due rows in index order without a temp B-tree
+    if _index_columns('email_outbox', 'ix_email_outbox_due') != ['status', 'next_attempt_at', 'id']:
+        op.drop_index('ix_email_outbox_due', table_name='email_outbox', if_exists=True)
+        op.create_index('ix_email_outbox_due', 'email_outbox', ['status', 'next_attempt_at', 'id'])
+
+
+def downgrade():
+    op.drop_index('ix_email_outbox_due', table_name='email_outbox', if_exists=True)
+    op.create_index('ix_email_outbox_due', 'email_outbox', ['status', 'next_attempt_at'])
+    with op.batch_alter_table('email_outbox') as batch_op:
+        if _has_column('email_outbox', 'claimed_until'):
+            batch_op.drop_column('claimed_until')
+        if _has_column('email_outbox', 'claimed_by'):
+            batch_op.drop_column('claimed_by')
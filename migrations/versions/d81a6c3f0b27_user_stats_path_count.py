@@ -0,0 +1,35 @@
+"""Count learning path enrolments in user_stats
+
+Revision ID: d81a6c3f0b27
+Revises: b4f0d2c7e915
+Create Date: 2026-10-18 16:02:51.447390
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd81a6c3f0b27'
+down_revision = 'b4f0d2c7e915'
+branch_labels = None
+depends_on = None
+
+
+def _has_column(table, column):
+    inspector = sa.inspect(op.get_bind())
+    return table in inspector.get_table_names() and column in {c['name'] for c in inspector.get_columns(table)}
+
+
+def upgrade():
+    # user_stats is created by db.create_all(); only older copies of it lack the column.
+    # Run `flask rebuild-stats` afterwards to fill it in.
+    if not _has_column('user_stats', 'path_count'):
+        with op.batch_alter_table('user_stats') as batch_op:
+            batch_op.add_column(sa.Column('path_count', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    if _has_column('user_stats', 'path_count'):
+        with op.batch_alter_table('user_stats') as batch_op:
+            batch_op.drop_column('path_count')
@@ -0,0 +1,36 @@
+"""Flag badge awards awaiting a digest email
+
+Revision ID: e5a91c07d4f3
+Revises: d81a6c3f0b27
+Create Date: 2026-10-18 19:41:07.902114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a91c07d4f3'
+down_revision = 'd81a6c3f0b27'
+branch_labels = None
+depends_on = None
+
+
+def _has_column(table, column):
+    inspector = sa.inspect(op.get_bind())
+    return table in inspector.get_table_names() and column in {c['name'] for c in inspector.get_columns(table)}
+
+
+def upgrade():
+    # Existing awards default to not pending, so nobody is emailed about badges they already hold
+    if not _has_column('user_badge', 'email_pending'):
+        with op.batch_alter_table('user_badge') as batch_op:
+            batch_op.add_column(sa.Column('email_pending', sa.Boolean(), nullable=False, server_default=sa.false()))
+    op.create_index('ix_user_badge_email_pending', 'user_badge', ['email_pending', 'user_id'], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_user_badge_email_pending', table_name='user_badge', if_exists=True)
+    if _has_column('user_badge', 'email_pending'):
+        with op.batch_alter_table('user_badge') as batch_op:
+            batch_op.drop_column('email_pending')
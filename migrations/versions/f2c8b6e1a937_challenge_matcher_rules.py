@@ -0,0 +1,43 @@
+"""Add matcher rules and a version to challenges
+
+Revision ID: f2c8b6e1a937
+Revises: e5a91c07d4f3
+Create Date: 2026-10-18 21:05:33.610482
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c8b6e1a937'
+down_revision = 'e5a91c07d4f3'
+branch_labels = None
+depends_on = None
+
+
+def _new_columns():
+    return (sa.Column('forbidden_params', sa.String(length=255), nullable=True),
+            sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+
+
+def _columns(table):
+    inspector = sa.inspect(op.get_bind())
+    return {c['name'] for c in inspector.get_columns(table)} if table in inspector.get_table_names() else set()
+
+
+def upgrade():
+    # Run `flask seed-content` afterwards so seeded challenges pick up their forbidden options
+    existing = _columns('challenge')
+    with op.batch_alter_table('challenge') as batch_op:
+        for column in _new_columns():
+            if column.name not in existing:
+                batch_op.add_column(column)
+
+
+def downgrade():
+    existing = _columns('challenge')
+    with op.batch_alter_table('challenge') as batch_op:
+        for name in ('version', 'forbidden_params'):
+            if name in existing:
+                batch_op.drop_column(name)
@@ -17,12 +17,8 @@ with app.app_context():
     db.drop_all()
     db.create_all()
 
-    from app.models import initialize_challenges, initialize_badges
-    from app.models_learning import seed_learning_paths, seed_aws_associate_paths
-    initialize_challenges()
-    initialize_badges()
-    seed_learning_paths()
-    seed_aws_associate_paths()
+    from app.seeding import sync_content
+    sync_content(force=True)
 
     # Create admin user
     if not User.query.filter_by(username='admin').first():
@@ -1,15 +1,19 @@
 import pytest
 import os
+import socketserver
+import threading
+from contextlib import contextmanager
 os.environ['FLASK_ENV'] = 'testing'
+os.environ['SCHEDULER_ENABLED'] = '0'   # apps built without TESTING must not take the real scheduler lock either
 
 from app import create_app, db as _db
 from app.models import User, Challenge, initialize_challenges, initialize_badges
 
 @pytest.fixture(scope='session')
-def app():
+def app(tmp_path_factory):
     """Create a test application with an in-memory database."""
-    app = create_app()
-    app.config.update({
+    app = create_app({
+        'METRICS_DIR': str(tmp_path_factory.mktemp('metrics')),
         'TESTING': True,
         'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
         'WTF_CSRF_ENABLED': False,
@@ -48,3 +52,125 @@ def admin_client(client, app):
     with app.app_context():
         client.post('/login', data={'username':'testadmin','password':'Admin@1234!'})
     return client
+
+
+@pytest.fixture
+def query_budget():
+    """Context manager factory: fail if more than `limit` SQL statements run inside the block."""
+    from app.metrics import QueryCounter
+
+    @contextmanager
+    def _budget(app, limit, label=''):
+        with app.app_context():
+            engines = [_db.engine, app.extensions.get('readonly_engine')]
+        with QueryCounter(*engines) as counter:
+            yield counter
+        assert counter.count <= limit, (
+            f"{label or 'block'} issued {counter.count} SQL statements (budget {limit}):\n"
+            + "\n".join(counter.statements))
+    return _budget
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: EHLO/MAIL/RCPT/DATA/RSET/NOOP/QUIT."""
+
+    def _reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode())
+
+    def handle(self):
+        stub = self.server
+        with stub.lock:
+            stub.connections += 1
+        self._reply('220 smtp-stub ready')
+        sender, rcpts = None, []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().strip()
+            verb, _, arg = command.partition(' ')
+            verb = verb.upper()
+            if verb in ('EHLO', 'HELO'):
+                self._reply('250 smtp-stub')
+            elif verb == 'MAIL':
+                sender, rcpts = arg.split(':', 1)[1].strip('<> '), []
+                self._reply('250 OK')
+            elif verb == 'RCPT':
+                rcpt = arg.split(':', 1)[1].strip('<> ')
+                if rcpt in stub.reject:
+                    self._reply('550 No such user')
+                else:
+                    rcpts.append(rcpt)
+                    self._reply('250 OK')
+            elif verb == 'DATA':
+                self._reply('354 End data with <CR><LF>.<CR><LF>')
+                data = []
+                for raw in iter(self.rfile.readline, b''):
+                    if raw in (b'.\r\n', b'.\n'):
+                        break
+                    data.append(raw)
+                with stub.lock:
+                    transient = stub.fail_data > 0
+                    if transient:
+                        stub.fail_data -= 1
+                    else:
+                        stub.messages.append({'from': sender, 'to': rcpts, 'data': b''.join(data)})
+                self._reply('451 Try again later' if transient else '250 Queued')
+            elif verb in ('RSET', 'NOOP'):
+                self._reply('250 OK')
+            elif verb == 'QUIT':
+                self._reply('221 Bye')
+                return
+            else:
+                self._reply('502 Not implemented')
+
+
+class SMTPStub(socketserver.ThreadingTCPServer):
+    """Local SMTP stand-in that records messages, counts connections and can refuse or defer mail."""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _SMTPHandler)
+        self.lock = threading.Lock()
+        self.messages = []
+        self.connections = 0
+        self.reject = set()     # recipients answered with 550
+        self.fail_data = 0      # answer the next n DATA commands with 451
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+
+@pytest.fixture
+def smtp_server():
+    server = SMTPStub()
+    threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def mail_app(tmp_path, smtp_server):
+    """App with its own database whose mail goes to the SMTP stand-in."""
+    app = create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path / "mail.db"}',
+        'SEED_ON_BOOT': False,
+        'METRICS_DIR': str(tmp_path / 'metrics'),
+        'MAIL_SERVER': '127.0.0.1',
+        'MAIL_PORT': smtp_server.port,
+        'MAIL_USE_SSL': False,
+        'MAIL_DEBUG': False,
+        'MAIL_USERNAME': None,
+        'MAIL_PASSWORD': None,
+        'MAIL_SUPPRESS_SEND': False,
+    })
+    with app.app_context():
+        _db.create_all()
+    yield app
+    with app.app_context():
+        _db.session.remove()
+        _db.engine.dispose()
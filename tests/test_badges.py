@@ -0,0 +1,104 @@
+"""Unit tests for the badge rule engine."""
+import pytest
+
+
+class _Stats:
+    challenge_points = 25
+    challenge_count = 2
+    path_count = 0
+    certificate_count = 1
+    total_points = 75
+
+
+def test_conditions_compile_to_predicates():
+    """Seeded conditions and 'and' combinations evaluate against a stats row."""
+    from app.badges import compile_condition
+    assert compile_condition('score>=20')(_Stats)
+    assert not compile_condition('score>=50')(_Stats)
+    assert compile_condition('certificates >= 1 and challenges>1')(_Stats)
+    assert not compile_condition('paths>=1')(_Stats)
+    assert compile_condition('score>=20') is compile_condition('score>=20')
+
+
+@pytest.mark.parametrize('condition', ['', 'score', 'karma>=1', 'score>=x', 'score>=1 or paths>=1'])
+def test_malformed_conditions_are_rejected(condition):
+    """Unknown metrics and bad syntax raise ValueError instead of silently never matching."""
+    from app.badges import compile_condition
+    with pytest.raises(ValueError):
+        compile_condition(condition)
+
+
+def test_enrolment_awards_path_starter(app):
+    """Enrolling in a first path awards the paths>=1 badge and counts it in user_stats."""
+    from app import db
+    from app.models import Badge, User, UserBadge
+    from app.models_learning import LearningPath
+    from app.stats import get_stats
+    with app.app_context():
+        user = User(username='enroller', email='enroller@test.com', show_wizard=False)
+        user.set_password('Enrol@1234!')
+        path = LearningPath(slug='badge-path', title='Badge Path')
+        db.session.add_all([user, path])
+        db.session.commit()
+        user_id = user.id
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = user_id
+    assert client.post('/learning-paths/badge-path/enrol').status_code == 200
+    with app.app_context():
+        starter = Badge.query.filter_by(name='Path Starter').one()
+        assert UserBadge.query.filter_by(user_id=user_id, badge_id=starter.id).count() == 1
+        stats = get_stats(user_id)
+        assert stats.path_count == 1 and stats.badge_count == 1
+
+
+def test_backfill_awards_qualifying_users_once(tmp_path):
+    """The backfill awards every qualifying user across chunks, keeps badge_count right and is idempotent."""
+    from app import create_app, db
+    from app.badges import backfill_badges
+    from app.dataset import generate_dataset
+    from app.models import Badge, UserBadge, UserStats, initialize_challenges, initialize_badges
+    app = create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path / "bf.db"}',
+                      'SEED_ON_BOOT': False, 'METRICS_DIR': str(tmp_path / 'metrics')})
+    with app.app_context():
+        db.create_all()
+        initialize_challenges()
+        initialize_badges()
+        generate_dataset(120, seed=3)
+        first_steps = Badge.query.filter_by(name='First Steps').one()
+        qualifying = UserStats.query.filter(UserStats.challenge_count >= 1).count()
+
+        awards = backfill_badges(chunk_size=25)
+        assert awards['First Steps'] == qualifying > 0
+        assert UserBadge.query.filter_by(badge_id=first_steps.id).count() == qualifying
+        assert db.session.query(db.func.sum(UserStats.badge_count)).scalar() == UserBadge.query.count()
+        assert sum(backfill_badges(chunk_size=25).values()) == 0
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_awards_are_emailed_as_one_digest_per_window(mail_app, smtp_server):
+    """Several badges earned together become one digest email, sent only once the window has passed."""
+    from app import db
+    from app.badges import check_and_award_badges, flush_badge_digests
+    from app.models import OutboxEmail, User, UserBadge, initialize_badges
+    from app.outbox import drain_outbox
+    from app.stats import bump_stats
+    with mail_app.app_context():
+        initialize_badges()
+        user = User(username='digester', email='digest@test.com', password_hash='x')
+        db.session.add(user)
+        db.session.commit()
+        stats = bump_stats(user.id, challenge_points=60, challenge_count=3)
+        assert len(check_and_award_badges(user.id, stats)) == 3
+        db.session.commit()
+
+        assert flush_badge_digests(window=3600) == 0          # still inside the window
+        assert flush_badge_digests(window=0) == 1
+        assert flush_badge_digests(window=0) == 0
+        assert UserBadge.query.filter_by(email_pending=True).count() == 0
+        digest = OutboxEmail.query.filter_by(kind='badge').one()
+        assert digest.subject == "Congratulations! You've Unlocked 3 New Badges!"
+        assert all(name in digest.html for name in ('Cloud Warrior', 'Cloud Sorcerer', 'First Steps'))
+        assert drain_outbox() == {'sent': 1, 'failed': 0}
+    assert len(smtp_server.messages) == 1
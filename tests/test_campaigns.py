@@ -0,0 +1,117 @@
+"""Tests for admin announcement campaigns."""
+import time
+
+
+def _learners(n):
+    from app import db
+    from app.models import User
+    db.session.add_all([User(username=f'learner{i}', email=f'learner{i}@test.local', password_hash='x', is_active=True)
+                        for i in range(n)])
+    db.session.commit()
+
+
+def _campaign(**kwargs):
+    from app import db
+    from app.models import Campaign
+    kwargs.setdefault('status', 'queued')
+    campaign = Campaign(subject='News', body='Hi {{ username }},\n\nNew labs are live.', **kwargs)
+    db.session.add(campaign)
+    db.session.commit()
+    return campaign.id
+
+
+def test_campaign_reaches_every_learner_over_pooled_connections(mail_app, smtp_server):
+    """Each active learner gets one personalised email; the pool opens at most one connection per worker."""
+    from app.campaigns import run_campaign
+    mail_app.config.update(CAMPAIGN_SMTP_CONNECTIONS=2, CAMPAIGN_CHUNK_SIZE=3, CAMPAIGN_RATE_PER_SECOND=0)
+    with mail_app.app_context():
+        _learners(7)
+        campaign = run_campaign(_campaign())
+        assert (campaign.status, campaign.sent_count, campaign.failed_count) == ('done', 7, 0)
+    assert smtp_server.connections <= 2
+    assert sorted(m['to'][0] for m in smtp_server.messages) == sorted(f'learner{i}@test.local' for i in range(7))
+    assert b'Hi learner3,' in next(m['data'] for m in smtp_server.messages if m['to'] == ['learner3@test.local'])
+
+
+def test_interrupted_campaign_resumes_from_checkpoint(mail_app, smtp_server):
+    """A campaign left 'sending' picks up after the last user id it checkpointed."""
+    from app.campaigns import run_campaign
+    from app.models import User
+    mail_app.config.update(CAMPAIGN_RATE_PER_SECOND=0)
+    with mail_app.app_context():
+        _learners(5)
+        checkpoint = User.query.filter_by(username='learner2').one().id
+        campaign = run_campaign(_campaign(status='sending', last_user_id=checkpoint, sent_count=3))
+        assert (campaign.status, campaign.sent_count) == ('done', 5)
+    assert sorted(m['to'][0] for m in smtp_server.messages) == ['learner3@test.local', 'learner4@test.local']
+
+
+def test_failures_are_counted_or_deferred_to_the_outbox(mail_app, smtp_server):
+    """A refused recipient counts as failed; a 4xx is handed to the outbox for retry."""
+    from app.campaigns import run_campaign
+    from app.models import OutboxEmail
+    mail_app.config.update(CAMPAIGN_SMTP_CONNECTIONS=1, CAMPAIGN_RATE_PER_SECOND=0)
+    smtp_server.reject.add('learner0@test.local')
+    smtp_server.fail_data = 1
+    with mail_app.app_context():
+        _learners(3)
+        campaign = run_campaign(_campaign())
+        assert (campaign.sent_count, campaign.deferred_count, campaign.failed_count) == (1, 1, 1)
+        deferred = OutboxEmail.query.one()
+        assert deferred.kind == 'campaign' and deferred.recipient == 'learner1@test.local'
+        assert 'Hi learner1,' in deferred.body
+
+
+def test_rate_limiter_spaces_sends():
+    """Five acquisitions at 50/s take at least four intervals."""
+    from app.campaigns import RateLimiter
+    limiter = RateLimiter(50)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    assert time.monotonic() - start >= 4 / 50 - 0.005
+
+
+def test_admin_creates_and_queues_campaign(admin_client, app):
+    """Admins save a draft and queue it; a malformed template is rejected."""
+    from app.models import Campaign
+    r = admin_client.post('/admin/campaigns', data={'subject': 'Broken', 'body': '{{ username', 'audience': 'active'})
+    assert b'Template error' in r.data
+    r = admin_client.post('/admin/campaigns', data={'subject': 'Launch', 'body': 'Hi {{ username }}', 'audience': 'admins'})
+    assert r.status_code == 302
+    with app.app_context():
+        campaign_id = Campaign.query.filter_by(subject='Launch').one().id
+    assert admin_client.post(f'/admin/campaigns/{campaign_id}/send').get_json() == {'success': True}
+    assert admin_client.post(f'/admin/campaigns/{campaign_id}/send').status_code == 400
+    with app.app_context():
+        assert Campaign.query.get(campaign_id).status == 'queued'
+
+
+def test_campaign_is_claimed_by_one_sender_at_a_time(mail_app, smtp_server):
+    """While one sender holds a campaign's lease another cannot take it; a lapsed lease can be taken over."""
+    from datetime import datetime, timedelta
+    from app import db
+    from app.campaigns import claim_campaign, run_campaign
+    from app.models import Campaign
+    with mail_app.app_context():
+        _learners(2)
+        campaign_id = _campaign()
+        assert claim_campaign(campaign_id, 'scheduler') is True
+        assert claim_campaign(campaign_id, 'cli') is False
+        assert run_campaign(campaign_id).sent_count == 0       # held by 'scheduler': nothing sent
+        assert smtp_server.messages == []
+        db.session.get(Campaign, campaign_id).lease_until = datetime.utcnow() - timedelta(seconds=1)
+        db.session.commit()
+        campaign = run_campaign(campaign_id)
+        assert (campaign.status, campaign.sent_count) == ('done', 2)
+
+
+def test_username_filters_are_rejected():
+    """The body is rendered once around a placeholder, so username must be output unchanged."""
+    import pytest
+    from jinja2 import TemplateSyntaxError
+    from app.campaigns import validate_body
+    validate_body('Hi {{ username }}, see you {{ "soon" | upper }}')
+    for body in ('Hi {{ username|upper }}', '{{ username ~ "!" }}', '{% if username %}x{% endif %}'):
+        with pytest.raises(TemplateSyntaxError):
+            validate_body(body)
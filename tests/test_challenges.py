@@ -73,3 +73,87 @@ def test_backup_requires_admin(auth_client):
     """Standard user cannot access backup panel."""
     rv = auth_client.get('/backup/', follow_redirects=False)
     assert rv.status_code == 302
+
+
+def test_completion_insert_is_idempotent(app):
+    """Recording the same completion twice inserts one Score and counts the points once."""
+    from app import db
+    from app.models import Challenge, Score, User
+    from app.stats import get_stats, record_challenge_completion
+    with app.app_context():
+        user = User(username='idempotent', email='idem@test.com', password_hash='x')
+        db.session.add(user)
+        db.session.commit()
+        ch = Challenge.query.first()
+        first = record_challenge_completion(user.id, ch)
+        second = record_challenge_completion(user.id, ch)
+        db.session.commit()
+        assert first is not None and second is None
+        assert Score.query.filter_by(user_id=user.id, challenge_id=ch.id).count() == 1
+        assert get_stats(user.id).challenge_points == ch.points
+
+
+def test_command_parser_normalises_options():
+    """`--opt=x` and `--opt x` parse the same, in any order; options and service are case-insensitive."""
+    from app.cli_matcher import parse_command
+    a = parse_command('aws iam create-user --user-name=alice --path /ops/')
+    b = parse_command("AWS IAM create-user --path '/ops/' --USER-NAME alice")
+    assert a == b == ('iam', 'create-user', {'user-name': 'alice', 'path': '/ops/'}, ())
+    assert parse_command('aws s3 mb s3://my-bucket --region eu-west-1').args == ('s3://my-bucket',)
+    assert parse_command('aws ec2 run-instances --dry-run --count 1').params == {'dry-run': None, 'count': '1'}
+    assert parse_command('ls -la') is None and parse_command('aws s3') is None
+
+
+def test_matcher_checks_operation_and_parameters():
+    """Prefixes no longer pass; required options must be present and forbidden ones absent."""
+    from app.cli_matcher import Matcher, parse_command
+    mb = Matcher('aws s3 mb')
+    assert mb(parse_command('aws s3 mb s3://bucket')).ok
+    assert not mb(parse_command('aws s3 mbx s3://bucket')).ok
+    user = Matcher('aws iam create-user --user-name')
+    assert user(parse_command('aws iam create-user --user-name=bob')).ok
+    assert user(parse_command('aws iam create-user')).problem == 'Missing --user-name.'
+    launch = Matcher('aws ec2 run-instances', forbidden='--dry-run')
+    assert launch(parse_command('aws ec2 run-instances --image-id ami-1')).ok
+    assert launch(parse_command('aws ec2 run-instances --dry-run')).problem == '--dry-run is not allowed here.'
+
+
+def test_matchers_are_cached_by_challenge_version(app):
+    """A challenge's matcher is compiled once and rebuilt only when its version moves."""
+    from app import db
+    from app.cli_matcher import match_command, matcher_for
+    from app.models import Challenge
+    with app.app_context():
+        ch = Challenge(name='Matcher Cache', description='d', solution='aws sqs create-queue', points=5)
+        db.session.add(ch)
+        db.session.commit()
+        first = matcher_for(ch)
+        assert matcher_for(ch) is first
+        assert match_command(ch, 'aws sqs create-queue --queue-name=q').ok
+        ch.solution, ch.version = 'aws sqs create-queue --queue-name jobs', ch.version + 1
+        db.session.commit()
+        assert matcher_for(ch) is not first
+        assert not match_command(ch, 'aws sqs create-queue --queue-name=q').ok
+        assert match_command(ch, 'aws sqs create-queue --queue-name jobs').ok
+        db.session.delete(ch)
+        db.session.commit()
+
+
+def test_catalogue_snapshot_reloads_on_version_change(app):
+    """The snapshot is reused until initialize_challenges bumps the counter, and its entries are read-only."""
+    import pytest
+    from app import db
+    from app.catalogue import get_catalogue
+    from app.models import Challenge, initialize_challenges
+    with app.app_context():
+        catalogue = get_catalogue()
+        assert get_catalogue() is catalogue
+        vpc = next(c for c in catalogue.challenges if c.name == 'Create a VPC')
+        assert catalogue.get(vpc.id) is vpc and 'create-vpc.html' in vpc.hint
+        with pytest.raises(AttributeError):
+            vpc.points = 100
+        Challenge.query.get(vpc.id).doc_link = None
+        db.session.commit()
+        initialize_challenges()            # restores the seeded link and bumps the counter
+        fresh = get_catalogue()
+        assert fresh is not catalogue and fresh.get(vpc.id).version == vpc.version + 1
@@ -0,0 +1,141 @@
+"""Unit tests for the SQLite engine profile."""
+import sqlite3
+
+
+def test_performance_profile_applies_pragmas(tmp_path):
+    """New connections pick up WAL, busy_timeout and the other profile pragmas."""
+    from sqlalchemy import create_engine
+    from app.database import SQLITE_PROFILES, apply_sqlite_pragmas, read_sqlite_pragmas
+    engine = create_engine(f'sqlite:///{tmp_path / "profile.db"}')
+    apply_sqlite_pragmas(engine, SQLITE_PROFILES['performance'])
+    live = read_sqlite_pragmas(engine)
+    assert live['journal_mode'] == 'wal'
+    assert live['busy_timeout'] == 5000
+    assert live['synchronous'] == 1   # NORMAL
+    assert live['temp_store'] == 2    # MEMORY
+
+
+def test_backup_copy_includes_wal_pages(tmp_path):
+    """Backups made from a WAL database contain rows not yet checkpointed."""
+    from app.backup.routes import _copy_database
+    live = str(tmp_path / 'live.db')
+    conn = sqlite3.connect(live)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA wal_autocheckpoint=0')
+    conn.execute('CREATE TABLE t (x INTEGER)')
+    conn.executemany('INSERT INTO t VALUES (?)', [(i,) for i in range(50)])
+    conn.commit()
+    backup = str(tmp_path / 'backup.db')
+    _copy_database(live, backup, journal_mode='DELETE')
+    conn.close()
+    copy = sqlite3.connect(backup)
+    assert copy.execute('SELECT COUNT(*) FROM t').fetchone()[0] == 50
+    assert copy.execute('PRAGMA journal_mode').fetchone()[0] == 'delete'
+    copy.close()
+
+
+def test_admin_database_page(admin_client):
+    """Admins can see the active engine profile."""
+    rv = admin_client.get('/admin/database')
+    assert rv.status_code == 200
+    assert b'journal_mode' in rv.data
+
+
+def test_read_only_views_use_readonly_engine(tmp_path):
+    """Marked views read through the mode=ro engine while writes still reach the primary."""
+    import pytest
+    from flask import g
+    from sqlalchemy.exc import OperationalError
+    from app import create_app, db
+    from app.models import User
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path / "routing.db"}',
+                      'SEED_ON_BOOT': False})
+    with app.app_context():
+        db.create_all()
+        db.session.add(User(username='reader', password_hash='x'))
+        db.session.commit()
+    with app.test_request_context():
+        g.db_read_only = True
+        assert db.session.get_bind() is app.extensions['readonly_engine']
+        assert User.query.filter_by(username='reader').count() == 1
+        with pytest.raises(OperationalError):
+            db.session.execute(db.text("INSERT INTO user (username, password_hash, role, is_active, show_wizard) "
+                                       "VALUES ('x', 'x', 'user', 1, 1)"))
+        db.session.rollback()
+        db.session.add(User(username='writer', password_hash='x'))
+        db.session.commit()
+    with app.app_context():
+        assert User.query.count() == 2
+        db.session.remove()
+        db.engine.dispose()
+        app.extensions['readonly_engine'].dispose()
+
+
+def test_hot_path_lookups_use_indexes(app):
+    """Score-by-user, reset-token and completed-module lookups no longer scan their tables."""
+    from app import db
+    from app.models import Score, User
+    from app.models_learning import UserModuleProgress
+    with app.app_context():
+        queries = (db.session.query(Score).filter(Score.user_id == 1),
+                   db.session.query(User).filter(User.reset_token == 'x'),
+                   db.session.query(UserModuleProgress).filter_by(user_id=1, completed=True))
+        for query in queries:
+            sql = str(query.statement.compile(db.engine, compile_kwargs={'literal_binds': True}))
+            plan = ' '.join(row[-1] for row in db.session.execute(db.text(f'EXPLAIN QUERY PLAN {sql}')))
+            assert 'USING INDEX' in plan or 'USING COVERING INDEX' in plan, plan
+
+
+def test_upgrade_schema_migrates_a_baseline_database(tmp_path):
+    """A pre-migration database is upgraded to head, loses its duplicate scores and can be seeded and served."""
+    from sqlalchemy import inspect
+    from app import create_app, db
+    from app.catalogue import get_catalogue
+    from app.models import initialize_challenges
+    from app.schema import current_revision, head_revision, upgrade_schema
+    path = tmp_path / 'legacy.db'
+    app = create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}', 'SEED_ON_BOOT': False,
+                      'METRICS_DIR': str(tmp_path / 'metrics')})
+    with app.app_context():
+        db.create_all()
+        db.engine.dispose()
+    # Strip everything the migrations add, as on a database created before them
+    conn = sqlite3.connect(path)
+    for index in ('uq_score_user_challenge', 'ix_user_badge_email_pending', 'ix_user_created_at',
+                  'ix_user_reset_token', 'ix_audit_log_timestamp', 'ix_certificate_user_path'):
+        conn.execute(f'DROP INDEX IF EXISTS {index}')
+    conn.execute('DROP INDEX ix_email_outbox_due')
+    conn.execute('CREATE INDEX ix_email_outbox_due ON email_outbox (status, next_attempt_at)')
+    for table, column in (('challenge', 'forbidden_params'), ('challenge', 'version'), ('challenge', 'doc_link'),
+                          ('challenge', 'video_link'), ('user_badge', 'email_pending'),
+                          ('user_stats', 'path_count'), ('email_outbox', 'claimed_by'),
+                          ('email_outbox', 'claimed_until')):
+        conn.execute(f'ALTER TABLE {table} DROP COLUMN {column}')
+    conn.execute("INSERT INTO user (id, username, password_hash, role, is_active, show_wizard) "
+                 "VALUES (1, 'legacy', 'x', 'user', 1, 1)")
+    conn.execute("INSERT INTO challenge (id, name, description, solution, points) "
+                 "VALUES (1, 'Create a VPC', 'd', 'aws ec2 create-vpc', 10)")
+    conn.executemany('INSERT INTO score (user_id, challenge_id, score) VALUES (1, 1, 10)', [(), ()])
+    conn.commit()
+    conn.close()
+
+    with app.app_context():
+        assert current_revision() is None
+        upgrade_schema()
+        inspector = inspect(db.engine)
+        assert current_revision() == head_revision()
+        challenge_columns = {c['name'] for c in inspector.get_columns('challenge')}
+        assert {'forbidden_params', 'version', 'doc_link', 'video_link'} <= challenge_columns
+        assert 'email_pending' in {c['name'] for c in inspector.get_columns('user_badge')}
+        assert 'ix_user_badge_email_pending' in {i['name'] for i in inspector.get_indexes('user_badge')}
+        assert 'uq_score_user_challenge' in {i['name'] for i in inspector.get_indexes('score')}
+        assert {'claimed_by', 'claimed_until'} <= {c['name'] for c in inspector.get_columns('email_outbox')}
+        outbox_due = next(i for i in inspector.get_indexes('email_outbox') if i['name'] == 'ix_email_outbox_due')
+        assert outbox_due['column_names'] == ['status', 'next_attempt_at', 'id']
+        assert db.session.execute(db.text('SELECT COUNT(*) FROM score')).scalar() == 1
+        initialize_challenges()
+        vpc = get_catalogue().get(1)
+        assert vpc.doc_link.endswith('create-vpc.html') and vpc.version == 2
+        assert upgrade_schema() == (head_revision(), head_revision())     # idempotent
+        db.session.remove()
+        db.engine.dispose()
@@ -0,0 +1,53 @@
+"""Unit tests for the domain event bus."""
+
+
+def test_sync_bus_isolates_failing_subscribers(app):
+    """Subscribers run inline in order, and one raising does not stop the others."""
+    from app.events import EventBus, Enrolled
+    bus = EventBus()
+    seen = []
+
+    @bus.subscribe(Enrolled)
+    def _broken(event):
+        raise RuntimeError('boom')
+
+    bus.subscribe(Enrolled, seen.append)
+    bus.publish(Enrolled(1, 2))
+    assert seen == [Enrolled(1, 2)]
+
+
+def test_published_events_are_counted(app):
+    """The built-in subscriber counts every published event by type."""
+    from app.events import Enrolled, publish
+    registry = app.extensions['metrics'].registry
+
+    def _count():
+        return registry.snapshot()['counters'].get('domain_events_total', {}).get('[["event", "Enrolled"]]', 0)
+
+    before = _count()
+    with app.app_context():
+        publish(Enrolled(1, 2), Enrolled(1, 3))
+    assert _count() == before + 2
+
+
+def test_validate_publishes_after_commit(app, auth_client):
+    """A correct answer publishes ChallengeCompleted once the score is committed."""
+    from app import db
+    from app.events import ChallengeCompleted
+    from app.models import Challenge, Score, User
+    bus = app.extensions['events']
+    committed = []
+
+    def _check(event):
+        committed.append(Score.query.filter_by(user_id=event.user_id, challenge_id=event.challenge_id).count())
+
+    bus.subscribe(ChallengeCompleted, _check)
+    try:
+        with app.app_context():
+            done = db.select(Score.challenge_id).join(User).where(User.username == 'testuser')
+            ch = Challenge.query.filter(Challenge.id.not_in(done)).first()
+            ch_id, solution = ch.id, ch.solution
+        auth_client.post('/validate', json={'command': solution, 'challenge_id': ch_id})
+    finally:
+        bus.unsubscribe(ChallengeCompleted, _check)
+    assert committed == [1]
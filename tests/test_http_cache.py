@@ -0,0 +1,66 @@
+"""Unit tests for ETag / 304 conditional responses."""
+import pytest
+
+ENDPOINTS = ['/leaderboard', '/user_info', '/api/my-progress', '/api/my-stats']
+
+
+@pytest.mark.parametrize('url', ENDPOINTS)
+def test_matching_etag_returns_304(auth_client, url):
+    """Replaying the ETag gets an empty 304."""
+    first = auth_client.get(url)
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    again = auth_client.get(url, headers={'If-None-Match': etag})
+    assert again.status_code == 304
+    assert again.data == b''
+    assert again.headers['ETag'] == etag
+
+
+def test_304_skips_the_view_queries(auth_client, app, query_budget):
+    """A revalidated request only reads the version counter."""
+    etag = auth_client.get('/api/my-progress').headers['ETag']
+    with query_budget(app, 1, 'my_progress 304'):
+        rv = auth_client.get('/api/my-progress', headers={'If-None-Match': etag})
+    assert rv.status_code == 304
+
+
+def test_enrolment_changes_progress_etag(auth_client, app):
+    """Enrolling bumps the user's version, so the old tag no longer matches."""
+    from app.models_learning import LearningPath
+    from app.seeding import sync_content
+    with app.app_context():
+        sync_content()
+        slug = LearningPath.query.order_by(LearningPath.id.desc()).first().slug
+    etag = auth_client.get('/api/my-progress').headers['ETag']
+    auth_client.post(f'/learning-paths/{slug}/enrol')
+    rv = auth_client.get('/api/my-progress', headers={'If-None-Match': etag})
+    assert rv.status_code == 200
+    assert any(p['slug'] == slug for p in rv.get_json())
+
+
+def test_other_users_award_changes_leaderboard_etag(auth_client, app):
+    """Any score change anywhere invalidates the leaderboard tag."""
+    from app import db
+    from app.models import User
+    from app.stats import bump_stats
+    etag = auth_client.get('/leaderboard').headers['ETag']
+    with app.app_context():
+        admin_id = User.query.filter_by(username='testadmin').first().id
+        bump_stats(admin_id, challenge_points=10)
+        db.session.commit()
+    assert auth_client.get('/leaderboard', headers={'If-None-Match': etag}).status_code == 200
+    with app.app_context():
+        bump_stats(admin_id, challenge_points=-10)
+        db.session.commit()
+
+
+def test_etag_differs_per_user(app, auth_client):
+    """Two users never share a tag for the same URL."""
+    from app.models import User
+    with app.app_context():
+        admin_id = User.query.filter_by(username='testadmin').first().id
+    other = app.test_client()
+    with other.session_transaction() as sess:
+        sess['user_id'] = admin_id
+    admin_tag = other.get('/api/my-stats').headers['ETag']
+    assert auth_client.get('/api/my-stats').headers['ETag'] != admin_tag
@@ -0,0 +1,172 @@
+"""Unit tests for the ranked leaderboard index and its cross-worker sync."""
+
+
+def test_ranked_index_orders_and_ranks():
+    """Totals sort descending, ties break on user id, ranks are 1-based."""
+    from app.leaderboard import RankedIndex
+    index = RankedIndex([(1, 30, 'a'), (2, 50, 'b'), (3, 30, 'c'), (4, 0, 'd')])
+    assert [e.username for e in index.top(10)] == ['b', 'a', 'c']
+    assert index.rank(3) == 3
+    assert index.rank(4) is None
+    assert len(index) == 3
+
+
+def test_ranked_index_set_moves_and_drops():
+    """Updating a total moves the user; a zero total removes them."""
+    from app.leaderboard import RankedIndex
+    index = RankedIndex([(1, 10, 'a'), (2, 20, 'b'), (3, 30, 'c')])
+    index.set(1, 40, 'a')
+    assert index.rank(1) == 1 and index.rank(3) == 2
+    index.set(3, 0, 'c')
+    assert index.rank(3) is None and len(index) == 2
+
+
+def test_ranked_index_neighbours():
+    """around() returns the user with n entries either side, clipped at the ends."""
+    from app.leaderboard import RankedIndex
+    index = RankedIndex([(i, 100 - i, f'u{i}') for i in range(1, 21)])
+    assert [e.user_id for e in index.around(10, n=2)] == [8, 9, 10, 11, 12]
+    assert [e.user_id for e in index.around(1, n=2)] == [1, 2, 3]
+
+
+def test_cache_syncs_changes_from_other_workers(app):
+    """A second worker's cache picks up a committed award through the version counter."""
+    from app import db
+    from app.leaderboard import LeaderboardCache
+    from app.models import User
+    from app.stats import bump_stats
+    with app.app_context():
+        worker_a, worker_b = LeaderboardCache(), LeaderboardCache()
+        worker_a.sync()
+        worker_b.sync()
+        user = User.query.filter_by(username='testadmin').first()
+        bump_stats(user.id, challenge_points=10_000)
+        db.session.commit()
+        assert worker_b.sync().rank(user.id) == 1
+        assert worker_a.sync().top(1)[0].user_id == user.id
+        bump_stats(user.id, challenge_points=-10_000)
+        db.session.commit()
+
+
+def test_rebuild_forces_full_reload(app):
+    """A rebuild bumps the epoch, so cached indexes drop rows that no longer exist."""
+    from app.leaderboard import LeaderboardCache
+    from app.stats import rebuild_user_stats
+    with app.app_context():
+        cache = LeaderboardCache()
+        cache.sync()
+        cache.index.set(999_999, 123, 'ghost')
+        rebuild_user_stats()
+        assert cache.sync().rank(999_999) is None
+
+
+def test_leaderboard_page_shows_own_rank(auth_client, app):
+    """A learner with points sees their position."""
+    from app.models import Challenge
+    with app.app_context():
+        ch = Challenge.query.first()
+    auth_client.post('/validate', json={'command': ch.solution, 'challenge_id': ch.id})
+    rv = auth_client.get('/leaderboard')
+    assert rv.status_code == 200
+    assert b'Your rank: #' in rv.data
+
+
+def test_keyset_pages_cover_ranking_once():
+    """Following next cursors visits every entry exactly once, in rank order."""
+    from app.leaderboard import RankedIndex
+    index = RankedIndex([(i, (i * 7) % 13 + 1, f'u{i}') for i in range(1, 101)])
+    seen, after = [], None
+    while True:
+        page = index.page(after, limit=15)
+        seen += page
+        if len(page) < 15:
+            break
+        after = (page[-1].total, page[-1].user_id)
+    assert [e.rank for e in seen] == list(range(1, 101))
+    assert len({e.user_id for e in seen}) == 100
+
+
+def test_windowed_boards_read_daily_rollups(app):
+    """Points older than the window count on the monthly board but not the weekly one."""
+    from datetime import timedelta
+    from app import db
+    from app.leaderboard import LeaderboardCache
+    from app.models import ScoreDaily, User, now_sast
+    from app.versioning import USER_STATS_EPOCH, bump_version
+    with app.app_context():
+        user = User(username='windowuser', password_hash='x')
+        db.session.add(user)
+        db.session.flush()
+        db.session.add(ScoreDaily(day=now_sast().date() - timedelta(days=10), user_id=user.id, points=40))
+        bump_version(USER_STATS_EPOCH)
+        db.session.commit()
+        assert LeaderboardCache(window_days=7).sync().rank(user.id) is None
+        assert LeaderboardCache(window_days=30).sync().rank(user.id) is not None
+        db.session.delete(user)
+        db.session.commit()
+
+
+def test_award_updates_todays_bucket(app):
+    """A completed challenge lands in today's rollup and on the weekly board."""
+    from app import db
+    from app.leaderboard import LeaderboardCache
+    from app.models import Challenge, ScoreDaily, User, now_sast
+    with app.app_context():
+        user = User(username='bucketuser', password_hash='x')
+        db.session.add(user)
+        db.session.commit()
+        weekly = LeaderboardCache(window_days=7)
+        weekly.sync()
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess['user_id'] = user.id
+        ch = Challenge.query.first()
+        client.post('/validate', json={'command': ch.solution, 'challenge_id': ch.id})
+        bucket = db.session.get(ScoreDaily, (now_sast().date(), user.id))
+        assert bucket.points == ch.points
+        assert weekly.sync().rank(user.id) is not None
+
+
+def test_full_leaderboard_page(auth_client):
+    """The full ranking renders for each board and ignores a malformed cursor."""
+    for board in ('all', 'week', 'month'):
+        assert auth_client.get(f'/leaderboard/full?board={board}').status_code == 200
+    assert auth_client.get('/leaderboard/full?after=garbage').status_code == 200
+
+
+def test_overall_board_combines_both_sources(app):
+    """Quiz points and challenge points both count on the overall board, with a breakdown."""
+    from app import db
+    from app.leaderboard import LeaderboardCache
+    from app.models import Challenge, User
+    from app.models_learning import PathModule
+    from app.seeding import sync_content
+    from app.stats import get_stats
+    with app.app_context():
+        sync_content()
+        user = User(username='overalluser', password_hash='x')
+        db.session.add(user)
+        db.session.commit()
+        overall = LeaderboardCache('combined')
+        overall.sync()
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess['user_id'] = user.id
+        ch = Challenge.query.first()
+        client.post('/validate', json={'command': ch.solution, 'challenge_id': ch.id})
+        module = PathModule.query.first()
+        answers = {str(q.id): q.correct_answer for q in module.quiz_questions}
+        client.post(f'/learning-paths/{module.path.slug}/module/{module.id}/quiz/submit', json={'answers': answers})
+        assert get_stats(user.id).total_points == ch.points + module.points
+        entry = overall.sync().around(user.id, n=0)[0]
+        assert entry.total == ch.points + module.points
+        assert (entry.breakdown.challenges, entry.breakdown.learning) == (ch.points, module.points)
+
+
+def test_leaderboard_defaults_to_challenge_points(auth_client):
+    """Plain /leaderboard still ranks challenge points; the overall board with its columns is opt-in."""
+    rv = auth_client.get('/leaderboard')
+    assert rv.status_code == 200
+    assert b'Learning Paths' not in rv.data
+    rv = auth_client.get('/leaderboard?board=overall')
+    assert b'Learning Paths' in rv.data
@@ -0,0 +1,88 @@
+"""Unit tests for request and SQL metrics."""
+
+
+def test_metrics_requires_admin(auth_client):
+    """Standard users cannot scrape metrics."""
+    rv = auth_client.get('/admin/metrics', follow_redirects=False)
+    assert rv.status_code == 302
+
+
+def test_metrics_report_requests_and_queries(admin_client):
+    """Requests are counted per endpoint with their SQL statements."""
+    admin_client.get('/health')
+    admin_client.get('/admin/dashboard')
+    rv = admin_client.get('/admin/metrics')
+    assert rv.status_code == 200
+    body = rv.data.decode()
+    assert '# TYPE http_request_duration_seconds histogram' in body
+    assert 'http_requests_total{endpoint="main.health",method="GET",status="200"}' in body
+    dashboard_queries = [line for line in body.splitlines()
+                         if line.startswith('db_queries_total{endpoint="admin.dashboard"}')]
+    assert dashboard_queries and float(dashboard_queries[0].split()[-1]) > 0
+
+
+def test_snapshots_merge_across_workers():
+    """Counters and histogram buckets from several workers are summed."""
+    from app.metrics import MetricsRegistry, merge_snapshots, LATENCY_BUCKETS
+    a, b = MetricsRegistry(), MetricsRegistry()
+    for reg, latency in ((a, 0.02), (b, 0.3)):
+        reg.inc('http_requests_total', {'endpoint': 'main.index'})
+        reg.observe('http_request_duration_seconds', {'endpoint': 'main.index'}, latency, LATENCY_BUCKETS)
+    merged = merge_snapshots([a.snapshot(), b.snapshot()])
+    assert list(merged['counters']['http_requests_total'].values()) == [2]
+    hist = list(merged['histograms']['http_request_duration_seconds'].values())[0]
+    assert hist['count'] == 2
+    assert hist['buckets'][LATENCY_BUCKETS.index(0.025)] == 1
+    assert hist['buckets'][-1] == 2
+
+
+def test_collect_keeps_idle_and_exited_workers(tmp_path):
+    """A worker overwrites one file; idle workers are merged as is, exited ones are folded into the retired totals."""
+    import json
+    import os
+    import subprocess
+    import sys
+    import time
+    from app.metrics import RETIRED_SNAPSHOT, WorkerMetrics
+
+    def _snapshot(count):
+        return json.dumps({'counters': {'http_requests_total': {'[]': count}}, 'histograms': {}})
+
+    (tmp_path / f'{os.getpid()}.json').write_text(_snapshot(1000))   # an exited worker that had our pid
+    metrics = WorkerMetrics(str(tmp_path), flush_seconds=5)
+    metrics.registry.inc('http_requests_total', {'endpoint': 'main.index'})
+    metrics.maybe_flush(force=True)
+    metrics.maybe_flush(force=True)
+    assert sorted(n for n in os.listdir(tmp_path) if n.endswith('.json')) == [f'{os.getpid()}.json', RETIRED_SNAPSHOT]
+
+    dead = subprocess.Popen([sys.executable, '-c', 'pass'])
+    dead.wait()
+    idle = tmp_path / f'{os.getppid()}.json'
+    (tmp_path / f'{dead.pid}.json').write_text(_snapshot(100))
+    idle.write_text(_snapshot(10))
+    old = time.time() - 3600
+    os.utime(idle, (old, old))
+
+    for _ in range(2):
+        merged = metrics.collect()
+        assert sum(merged['counters']['http_requests_total'].values()) == 1111
+    assert sorted(n for n in os.listdir(tmp_path) if n.endswith('.json')) == sorted(
+        [f'{os.getpid()}.json', idle.name, RETIRED_SNAPSHOT])
+
+
+def test_background_flush_keeps_idle_worker_current(tmp_path):
+    """After its first flush a worker rewrites its snapshot on a timer, without waiting for a request."""
+    import json
+    import os
+    import time
+    from app.metrics import WorkerMetrics
+    metrics = WorkerMetrics(str(tmp_path), flush_seconds=0.05, background=True)
+    metrics.maybe_flush(force=True)
+    metrics.registry.inc('http_requests_total', {'endpoint': 'main.index'})
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        counters = json.loads((tmp_path / f'{os.getpid()}.json').read_text())['counters']
+        if counters:
+            break
+        time.sleep(0.02)
+    assert counters['http_requests_total'] == {'[["endpoint", "main.index"]]': 1}
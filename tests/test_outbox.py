@@ -0,0 +1,96 @@
+"""Tests for the transactional email outbox and its sender."""
+from datetime import datetime
+
+SENDER = ('Test', 'no-reply@test.local')
+
+
+def _queue(n, recipient='learner{}@test.local'):
+    from app import db
+    from app.outbox import enqueue_email
+    for i in range(n):
+        enqueue_email('test', recipient.format(i), f'Hello {i}', SENDER, body='hi')
+    db.session.commit()
+
+
+def test_drain_sends_batches_over_one_connection(mail_app, smtp_server):
+    """Every due email goes out through a single SMTP connection, batch by batch."""
+    from app.models import OutboxEmail
+    from app.outbox import drain_outbox
+    with mail_app.app_context():
+        _queue(5)
+        assert drain_outbox(batch_size=2) == {'sent': 5, 'failed': 0}
+        assert OutboxEmail.query.filter_by(status='sent').count() == 5
+    assert smtp_server.connections == 1
+    assert len(smtp_server.messages) == 5
+
+
+def test_transient_failures_back_off_then_dead_letter(mail_app, smtp_server):
+    """A 4xx is retried later with backoff; after OUTBOX_MAX_ATTEMPTS the row is dead-lettered."""
+    from app import db
+    from app.models import OutboxEmail
+    from app.outbox import drain_outbox
+    mail_app.config['OUTBOX_MAX_ATTEMPTS'] = 2
+    with mail_app.app_context():
+        _queue(1)
+        smtp_server.fail_data = 5
+        assert drain_outbox() == {'sent': 0, 'failed': 1}
+        row = OutboxEmail.query.one()
+        assert row.status == 'pending' and row.attempts == 1 and row.next_attempt_at > datetime.utcnow()
+        assert drain_outbox() == {'sent': 0, 'failed': 0}    # not due yet
+        row.next_attempt_at = datetime.utcnow()
+        db.session.commit()
+        drain_outbox()
+        row = OutboxEmail.query.one()
+        assert row.status == 'dead' and row.attempts == 2 and '451' in row.last_error
+
+
+def test_refused_recipient_is_dead_lettered_at_once(mail_app, smtp_server):
+    """A permanent 5xx rejection is not retried, and the rest of the batch still goes out."""
+    from app.models import OutboxEmail
+    from app.outbox import drain_outbox
+    smtp_server.reject.add('learner0@test.local')
+    with mail_app.app_context():
+        _queue(3)
+        assert drain_outbox() == {'sent': 2, 'failed': 1}
+        dead = OutboxEmail.query.filter_by(status='dead').one()
+        assert dead.recipient == 'learner0@test.local' and dead.attempts == 1
+
+
+def test_unreachable_server_leaves_rows_pending(mail_app, smtp_server):
+    """If SMTP cannot be reached nothing is charged an attempt; the next run retries."""
+    from app.models import OutboxEmail
+    from app.outbox import drain_outbox
+    smtp_server.shutdown()
+    smtp_server.server_close()
+    with mail_app.app_context():
+        _queue(2)
+        assert drain_outbox() == {'sent': 0, 'failed': 0}
+        assert {(r.status, r.attempts) for r in OutboxEmail.query} == {('pending', 0)}
+
+
+def test_claimed_rows_are_sent_by_one_drain(mail_app, smtp_server):
+    """Rows another drain has claimed are skipped until that claim expires; nothing is sent twice."""
+    from datetime import timedelta
+    from app import db
+    from app.models import OutboxEmail
+    from app.outbox import _claim, drain_outbox
+    with mail_app.app_context():
+        _queue(3)
+        assert len(_claim('other-drain', 2)) == 2
+        assert drain_outbox() == {'sent': 1, 'failed': 0}
+        assert drain_outbox() == {'sent': 0, 'failed': 0}
+        for row in OutboxEmail.query.filter_by(claimed_by='other-drain'):
+            row.claimed_until = datetime.utcnow() - timedelta(seconds=1)
+        db.session.commit()
+        assert drain_outbox() == {'sent': 2, 'failed': 0}
+    assert sorted(m['to'][0] for m in smtp_server.messages) == [f'learner{i}@test.local' for i in range(3)]
+
+
+def test_signup_queues_welcome_email_with_the_account(client, app):
+    """Signup writes the welcome email to the outbox in the same commit instead of sending it."""
+    from app.models import OutboxEmail
+    client.post('/signup', data={'username': 'outboxuser', 'email': 'outbox@test.com',
+                                 'password': 'Outbox@1234!', 'confirm_password': 'Outbox@1234!'})
+    with app.app_context():
+        row = OutboxEmail.query.filter_by(recipient='outbox@test.com').one()
+        assert row.kind == 'welcome' and row.status == 'pending'
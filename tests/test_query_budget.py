@@ -0,0 +1,154 @@
+"""Query-budget regression tests.
+
+Each endpoint declares the maximum number of SQL statements it may issue. The
+fixture database is built with app.dataset and is large enough that any
+per-row (N+1) query blows the budget.
+"""
+import pytest
+
+N_USERS = 300
+N_PATHS = 3
+MODULES_PER_PATH = 8
+
+
+@pytest.fixture(scope='module')
+def big_app(tmp_path_factory):
+    from app import create_app, db
+    from app.dataset import generate_dataset
+    from app.stats import rebuild_user_stats
+    from app.models import User, initialize_challenges, initialize_badges
+    from app.models_learning import (LearningPath, PathModule, QuizQuestion,
+                                     UserPathProgress, UserModuleProgress)
+    app = create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+                      'SEED_ON_BOOT': False, 'METRICS_DIR': str(tmp_path_factory.mktemp('metrics'))})
+    with app.app_context():
+        db.create_all()
+        initialize_challenges()
+        initialize_badges()
+        for p in range(N_PATHS):
+            path = LearningPath(slug=f'path-{p}', title=f'Path {p}', total_points=MODULES_PER_PATH * 50)
+            db.session.add(path)
+            db.session.flush()
+            for m in range(MODULES_PER_PATH):
+                module = PathModule(path_id=path.id, title=f'Module {m}', order_index=m, points=50)
+                db.session.add(module)
+                db.session.flush()
+                db.session.add(QuizQuestion(module_id=module.id, question_text='Q?', option_a='a', option_b='b',
+                                            option_c='c', option_d='d', correct_answer='A'))
+        db.session.commit()
+        generate_dataset(N_USERS, seed=7)
+
+        # A learner with a known state: enrolled everywhere, one module short of finishing the last path
+        budget_user = User(username='budgetuser', email='budget@test.com', password_hash='x', show_wizard=False)
+        db.session.add(budget_user)
+        db.session.flush()
+        module_ids = [m for (m,) in db.session.query(PathModule.id).order_by(PathModule.id)]
+        path_ids = [p for (p,) in db.session.query(LearningPath.id)]
+        db.session.execute(db.insert(UserPathProgress), [
+            {'user_id': budget_user.id, 'path_id': pid} for pid in path_ids])
+        db.session.execute(db.insert(UserModuleProgress), [
+            {'user_id': budget_user.id, 'module_id': mid, 'completed': True, 'quiz_passed': True, 'points_earned': 50}
+            for mid in module_ids[:-1]])
+        db.session.commit()
+        rebuild_user_stats()
+        app.config['BUDGET_ADMIN_ID'] = User.query.filter_by(role='admin').first().id
+        app.config['BUDGET_USER_ID'] = budget_user.id
+    yield app
+
+
+def _client(app, user_key):
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = app.config[user_key]
+    return client
+
+
+# (endpoint label, user, method, url, json body, max SQL statements)
+BUDGETS = [
+    ('main.index', 'BUDGET_USER_ID', 'GET', '/', None, 2),
+    ('main.challenges', 'BUDGET_USER_ID', 'GET', '/challenges', None, 4),   # cold: includes the catalogue load
+    ('main.leaderboard', 'BUDGET_USER_ID', 'GET', '/leaderboard', None, 3),
+    ('main.user_info', 'BUDGET_USER_ID', 'GET', '/user_info', None, 2),
+    ('learning.catalogue', 'BUDGET_USER_ID', 'GET', '/learning-paths', None, 4),
+    ('learning.path_detail', 'BUDGET_USER_ID', 'GET', '/learning-paths/path-0', None, 5),
+    ('learning.my_progress_api', 'BUDGET_USER_ID', 'GET', '/api/my-progress', None, 5),
+    ('learning.my_stats_api', 'BUDGET_USER_ID', 'GET', '/api/my-stats', None, 1),
+    ('admin.dashboard', 'BUDGET_ADMIN_ID', 'GET', '/admin/dashboard', None, 9),
+    ('admin.users', 'BUDGET_ADMIN_ID', 'GET', '/admin/users', None, 2),
+    ('admin.audit_log', 'BUDGET_ADMIN_ID', 'GET', '/admin/audit-log', None, 2),
+    ('reports.user_registration_report', 'BUDGET_ADMIN_ID', 'GET', '/reports/users', None, 2),
+    ('reports.system_activity_report', 'BUDGET_ADMIN_ID', 'GET', '/reports/activity', None, 2),
+    ('reports.backup_integrity_report', 'BUDGET_ADMIN_ID', 'GET', '/reports/backups', None, 2),
+]
+
+
+@pytest.mark.parametrize('label,user_key,method,url,body,limit', BUDGETS, ids=[b[0] for b in BUDGETS])
+def test_endpoint_query_budget(big_app, query_budget, label, user_key, method, url, body, limit):
+    client = _client(big_app, user_key)
+    with query_budget(big_app, limit, label):
+        rv = client.open(url, method=method, json=body)
+    assert rv.status_code == 200
+
+
+def test_quiz_submit_query_budget(big_app, query_budget):
+    """Passing the last module of a path checks completion without a query per module.
+
+    The budget covers the certificate plus two badge awards (Path Starter, Certified) with their
+    outbox emails, and the one-off load of the badge rules.
+    """
+    from app import db
+    from app.models_learning import PathModule
+    with big_app.app_context():
+        module = PathModule.query.order_by(PathModule.id.desc()).first()
+        path_slug, module_id = module.path.slug, module.id
+        question_id = module.quiz_questions[0].id
+    client = _client(big_app, 'BUDGET_USER_ID')
+    with query_budget(big_app, 21, 'learning.quiz_submit'):
+        rv = client.post(f'/learning-paths/{path_slug}/module/{module_id}/quiz/submit',
+                         json={'answers': {str(question_id): 'A'}})
+    assert rv.status_code == 200
+    assert rv.get_json()['passed'] is True
+
+
+def test_warm_leaderboard_query_budget(big_app, query_budget):
+    """Once this worker's ranked index is built, a view only checks the data version."""
+    client = _client(big_app, 'BUDGET_USER_ID')
+    client.get('/leaderboard')
+    with query_budget(big_app, 2, 'main.leaderboard (warm)'):
+        rv = client.get('/leaderboard')
+    assert rv.status_code == 200
+
+
+def test_validate_query_budget(big_app, query_budget):
+    """A correct answer that also earns a badge costs one commit and a fixed number of statements."""
+    from sqlalchemy import event
+    from app import db
+    from app.models import Challenge, Score
+    with big_app.app_context():
+        done = db.select(Score.challenge_id).where(Score.user_id == big_app.config['BUDGET_USER_ID'])
+        challenge = Challenge.query.filter(Challenge.id.not_in(done)).first()
+        challenge_id, solution = challenge.id, challenge.solution
+        engine = db.engine
+    commits = []
+
+    def _on_commit(conn):
+        commits.append(conn)
+
+    event.listen(engine, 'commit', _on_commit)
+    try:
+        client = _client(big_app, 'BUDGET_USER_ID')
+        with query_budget(big_app, 10, 'main.validate_command'):
+            rv = client.post('/validate', json={'command': solution, 'challenge_id': challenge_id})
+    finally:
+        event.remove(engine, 'commit', _on_commit)
+    assert '✅' in rv.get_json()['message']
+    assert len(commits) == 1
+
+
+def test_wrong_answer_validate_query_budget(big_app, query_budget):
+    """With the challenge catalogue warm, a wrong answer only reads the catalogue version."""
+    client = _client(big_app, 'BUDGET_USER_ID')
+    client.get('/challenges')
+    with query_budget(big_app, 1, 'main.validate_command (wrong)'):
+        rv = client.post('/validate', json={'command': 'aws s3 ls', 'challenge_id': 1})
+    assert '📖 Docs:' in rv.get_json()['message']
@@ -0,0 +1,17 @@
+"""Unit tests for the admin PDF reports."""
+import pytest
+
+
+@pytest.mark.parametrize('path', ['/reports/users', '/reports/activity', '/reports/backups'])
+def test_admin_can_download_report(admin_client, path):
+    """Each report renders as a PDF attachment."""
+    rv = admin_client.get(path)
+    assert rv.status_code == 200
+    assert rv.mimetype == 'application/pdf'
+    assert rv.data.startswith(b'%PDF')
+
+
+def test_reports_require_admin(auth_client):
+    """Standard users are redirected away from reports."""
+    rv = auth_client.get('/reports/users', follow_redirects=False)
+    assert rv.status_code == 302
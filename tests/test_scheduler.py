@@ -0,0 +1,39 @@
+"""Unit tests for scheduler leader election."""
+import threading
+
+
+def test_only_one_lease_holder(tmp_path):
+    """A second lease on the same file cannot be acquired while the first is held."""
+    from app.scheduler import LeaderLease
+    path = str(tmp_path / 'scheduler.lock')
+    leader, follower = LeaderLease(path), LeaderLease(path)
+    assert leader.try_acquire() is True
+    assert follower.try_acquire() is False
+    leader.release()
+
+
+def test_follower_takes_over_after_release(tmp_path):
+    """A standby process starts the scheduler once the leader lets go."""
+    from app.scheduler import LeaderLease, run_as_leader
+    path = str(tmp_path / 'scheduler.lock')
+    leader, follower = LeaderLease(path), LeaderLease(path)
+    assert leader.try_acquire()
+    started = threading.Event()
+    stop = run_as_leader(follower, started.set, retry_seconds=0.05)
+    assert not started.wait(0.2)
+    leader.release()
+    assert started.wait(2)
+    assert follower.held
+    stop.set()
+    follower.release()
+
+
+def test_scheduler_stays_off_in_test_and_disabled_apps(tmp_path):
+    """TESTING apps, and apps with SCHEDULER_ENABLED off, never take the lease or start background jobs."""
+    from app import create_app
+    base = {'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:', 'SEED_ON_BOOT': False,
+            'METRICS_DIR': str(tmp_path / 'metrics'), 'SCHEDULER_LOCK_PATH': str(tmp_path / 'scheduler.lock')}
+    testing = create_app({**base, 'TESTING': True, 'SCHEDULER_ENABLED': True})
+    disabled = create_app({**base, 'SCHEDULER_ENABLED': False})
+    assert 'scheduler_lease' not in testing.extensions
+    assert 'scheduler_lease' not in disabled.extensions
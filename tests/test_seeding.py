@@ -0,0 +1,33 @@
+"""Unit tests for versioned content seeding."""
+
+
+def test_sync_records_manifest(app):
+    """Syncing stores a hash for every seed set."""
+    from app.models import ContentManifest
+    from app.seeding import sync_content, stale_seed_sets
+    with app.app_context():
+        sync_content()
+        names = {m.seed_set for m in ContentManifest.query.all()}
+        assert {'challenges', 'badges', 'learning_paths', 'aws_associate_paths'} <= names
+        assert stale_seed_sets() == []
+
+
+def test_sync_skips_unchanged_content(app):
+    """A second sync with unchanged content seeds nothing."""
+    from app.seeding import sync_content
+    with app.app_context():
+        sync_content()
+        assert sync_content() == []
+
+
+def test_changed_hash_reseeds_only_that_set(app):
+    """Only the seed set whose hash differs is re-run."""
+    from app import db
+    from app.models import ContentManifest
+    from app.seeding import sync_content
+    with app.app_context():
+        sync_content()
+        entry = db.session.get(ContentManifest, 'badges')
+        entry.content_hash = 'outdated'
+        db.session.commit()
+        assert sync_content() == ['badges']
@@ -0,0 +1,89 @@
+"""Unit tests for the materialised user_stats counters."""
+import itertools
+
+import pytest
+
+_ids = itertools.count()
+
+
+@pytest.fixture
+def learner(app):
+    """A fresh user with no activity, plus a client logged in as them."""
+    from app import db
+    from app.models import User
+    with app.app_context():
+        user = User(username=f'statsuser{next(_ids)}', email=None, show_wizard=False)
+        user.set_password('Stats@1234!')
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = user_id
+        sess['role'] = 'user'
+    return user_id, client
+
+
+def test_correct_answer_updates_stats(app, learner):
+    """A completed challenge adds its points and one to the count."""
+    from app.models import Challenge
+    from app.stats import get_stats
+    user_id, client = learner
+    with app.app_context():
+        ch = Challenge.query.first()
+        rv = client.post('/validate', json={'command': ch.solution, 'challenge_id': ch.id})
+        assert rv.get_json()['total_score'] == ch.points
+        stats = get_stats(user_id)
+        assert (stats.challenge_points, stats.challenge_count, stats.badge_count) == (ch.points, 1, 1)
+    assert client.get('/user_info').get_json()['total_score'] == ch.points
+
+
+def test_quiz_pass_updates_module_points(app, learner):
+    """Passing a quiz adds the module's points."""
+    from app.models_learning import PathModule
+    from app.seeding import sync_content
+    from app.stats import get_stats
+    user_id, client = learner
+    with app.app_context():
+        sync_content()
+        module = PathModule.query.first()
+        answers = {str(q.id): q.correct_answer for q in module.quiz_questions}
+        client.post(f'/learning-paths/{module.path.slug}/module/{module.id}/quiz/submit', json={'answers': answers})
+        assert get_stats(user_id).module_points == module.points
+
+
+def test_rebuild_matches_incremental_counters(app, learner):
+    """Rebuilding after normal activity finds nothing out of date."""
+    from app.models import Challenge
+    from app.stats import rebuild_user_stats
+    user_id, client = learner
+    with app.app_context():
+        challenges = Challenge.query.limit(4).all()
+        for ch in challenges[:3]:
+            client.post('/validate', json={'command': ch.solution, 'challenge_id': ch.id})
+        rebuild_user_stats()
+        client.post('/validate', json={'command': challenges[3].solution, 'challenge_id': challenges[3].id})
+        _, drifted = rebuild_user_stats()
+        assert drifted == 0
+
+
+def test_rebuild_repairs_drift(app, learner):
+    """A counter that disagrees with the source tables is corrected."""
+    from app import db
+    from app.models import UserStats
+    from app.stats import bump_stats, get_stats, rebuild_user_stats
+    user_id, _ = learner
+    with app.app_context():
+        bump_stats(user_id, challenge_points=999)
+        db.session.commit()
+        _, drifted = rebuild_user_stats()
+        assert drifted >= 1
+        assert get_stats(user_id).challenge_points == 0
+        assert db.session.get(UserStats, user_id) is not None
+
+
+def test_rebuild_stats_command(app):
+    """flask rebuild-stats reports how many rows it rebuilt."""
+    result = app.test_cli_runner().invoke(args=['rebuild-stats'])
+    assert result.exit_code == 0, result.output
+    assert 'Rebuilt stats for' in result.output